@@ -0,0 +1,126 @@
+"""Startup benchmark for the pantheon CLI.
+
+Runs the console entry point in a fresh interpreter under ``python -X
+importtime`` and reports how long Pantheon's imports take, excluding the
+interpreter's own startup. Fails if any scenario exceeds its budget in
+startup_budget.json or imports a module it should not.
+
+Usage:
+    python -m benchmarks.startup [--runs N] [--budget FILE]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Optional, TypedDict
+
+BUDGET_FILE = Path(__file__).parent / "startup_budget.json"
+
+# Runs the entry point exactly as the console script would
+_LAUNCH = (
+    "import sys; sys.argv = ['pantheon', *{argv!r}]; "
+    "from pantheon.__main__ import run; run()"
+)
+
+
+class StartupSample(TypedDict):
+    """Type for one startup measurement."""
+
+    import_ms: float
+    modules: list[str]
+
+
+class ScenarioResult(TypedDict):
+    """Type for a benchmarked scenario."""
+
+    name: str
+    import_ms: float
+    budget_ms: float
+    unexpected_modules: list[str]
+    passed: bool
+
+
+def measure_startup(argv: list[str], cwd: Path) -> StartupSample:
+    """Run pantheon once with argv and parse its -X importtime output.
+
+    Only top-level imports made after the interpreter has started (i.e.
+    from the first pantheon import on) are counted.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _LAUNCH.format(argv=argv)],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+    )
+
+    total_us = 0
+    modules = []
+    started = False
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        module = name.strip()
+        modules.append(module)
+        if module == "pantheon" or module.startswith("pantheon."):
+            started = True
+        # Nested imports are indented past the single separator space
+        if started and not name[1:].startswith(" "):
+            total_us += int(cumulative)
+
+    return {"import_ms": total_us / 1000, "modules": modules}
+
+
+def run_benchmark(
+    budget_file: Path = BUDGET_FILE, runs: int = 5, cwd: Optional[Path] = None
+) -> list[ScenarioResult]:
+    """Benchmark every scenario in budget_file, taking the median of runs."""
+    if cwd is None:
+        cwd = Path.cwd()
+
+    budgets = json.loads(budget_file.read_text())
+    results: list[ScenarioResult] = []
+
+    for name, scenario in budgets["scenarios"].items():
+        samples = [measure_startup(scenario["argv"], cwd) for _ in range(runs)]
+        import_ms = statistics.median(s["import_ms"] for s in samples)
+        imported = {m for s in samples for m in s["modules"]}
+        unexpected = sorted(imported.intersection(scenario.get("forbidden", [])))
+        results.append({
+            "name": name,
+            "import_ms": round(import_ms, 2),
+            "budget_ms": scenario["budget_ms"],
+            "unexpected_modules": unexpected,
+            "passed": import_ms <= scenario["budget_ms"] and not unexpected,
+        })
+
+    return results
+
+
+def main() -> int:
+    """Command-line entry point; returns the process exit code."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget", type=Path, default=BUDGET_FILE)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.budget, args.runs)
+    for result in results:
+        status = "ok" if result["passed"] else "FAIL"
+        unexpected = ""
+        if result["unexpected_modules"]:
+            unexpected = f" unexpected: {', '.join(result['unexpected_modules'])}"
+        print(
+            f"{status:<4} {result['name']:<12} "
+            f"{result['import_ms']:>8.2f} ms (budget {result['budget_ms']} ms)"
+            f"{unexpected}"
+        )
+
+    return 0 if all(r["passed"] for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,315 @@
+"""Benchmark suite for init / integrate / rollback / list over synthetic trees.
+
+Each case builds a synthetic project tree (untimed), then measures the
+median wall time over several runs and the peak Python heap (tracemalloc)
+of one further run. Results are written as JSON and can be compared with a
+committed baseline in benchmarks/baselines/ so regressions show up in review.
+
+Usage:
+    python -m benchmarks.suite [--profile quick] [--compare] [--update-baseline]
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Optional, TypedDict
+
+from click.testing import CliRunner
+
+from benchmarks.synthetic import age_tree, make_fleet, make_project, write_commands
+from pantheon.cli import main
+from pantheon.integrations.spec_kit import (
+    find_latest_backup,
+    integrate_spec_kit,
+    integrate_spec_kit_batch,
+    rollback_integration,
+)
+from pantheon.project_index import ProjectIndex
+from pantheon.scan import scan_projects
+
+BASELINE_DIR = Path(__file__).parent / "baselines"
+
+KB = 1024
+MB = 1024 * KB
+
+# Scales per profile: command file sizes, existing backups, project roots
+PROFILES: dict[str, dict[str, list[int]]] = {
+    "smoke": {"sizes": [1 * KB], "backups": [1], "roots": [1], "runs": [1]},
+    "quick": {
+        "sizes": [1 * KB, 1 * MB],
+        "backups": [1, 100],
+        "roots": [1, 50],
+        "runs": [3],
+    },
+    "full": {
+        "sizes": [1 * KB, 1 * MB, 50 * MB],
+        "backups": [1, 100, 10_000],
+        "roots": [1, 100, 5_000],
+        "runs": [3],
+    },
+}
+
+# A case regresses when it is this many times slower / larger than baseline
+TIME_TOLERANCE = 1.5
+MEMORY_TOLERANCE = 1.25
+
+# Differences below these are noise on sub-millisecond cases
+MIN_SECONDS_DELTA = 0.002
+MIN_BYTES_DELTA = 16 * 1024
+
+
+class CaseResult(TypedDict):
+    """Type for one measured benchmark case."""
+
+    seconds: float
+    peak_bytes: int
+
+
+class Regression(TypedDict):
+    """Type for a case that got worse than its baseline."""
+
+    case: str
+    metric: str
+    baseline: float
+    current: float
+
+
+def _label(value: int) -> str:
+    """Render a size in bytes compactly for case names."""
+    if value >= MB and value % MB == 0:
+        return f"{value // MB}MB"
+    if value >= KB and value % KB == 0:
+        return f"{value // KB}KB"
+    return str(value)
+
+
+@contextmanager
+def _chdir(path: Path) -> Iterator[None]:
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def measure(
+    operation: Callable[[], object],
+    runs: int,
+    setup: Optional[Callable[[], object]] = None,
+) -> CaseResult:
+    """Time operation over runs (median) and trace its peak heap once.
+
+    Args:
+        operation: The code under test.
+        runs: Number of timed runs.
+        setup: Untimed preparation run before every timed or traced run.
+
+    Returns:
+        Median seconds and peak traced bytes.
+    """
+    timings = []
+    for _ in range(runs):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        operation()
+        timings.append(time.perf_counter() - start)
+
+    if setup is not None:
+        setup()
+    tracemalloc.start()
+    try:
+        operation()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"seconds": statistics.median(timings), "peak_bytes": peak}
+
+
+def run_suite(profile: str = "quick") -> dict[str, CaseResult]:
+    """Run every benchmark case for a profile.
+
+    Args:
+        profile: Name of a profile in PROFILES.
+
+    Returns:
+        Results keyed by case name, e.g. "integrate_spec_kit[size=1MB]".
+    """
+    scales = PROFILES[profile]
+    runs = scales["runs"][0]
+    results: dict[str, CaseResult] = {}
+    runner = CliRunner()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp)
+
+        for size in scales["sizes"]:
+            root = make_project(base / f"size-{size}", command_size=size)
+            results[f"integrate_spec_kit[size={_label(size)}]"] = measure(
+                lambda: integrate_spec_kit(root, force=True),
+                runs,
+                setup=lambda: write_commands(root, size),
+            )
+
+        for count in scales["backups"]:
+            root = make_project(base / f"backups-{count}", backups=count)
+            results[f"find_latest_backup[backups={count}]"] = measure(
+                lambda: find_latest_backup(root), runs
+            )
+            results[f"rollback_integration[backups={count}]"] = measure(
+                lambda: rollback_integration(root), runs
+            )
+
+        for count in scales["roots"]:
+            roots = make_fleet(base / f"fleet-{count}", count)
+
+            def remove_agents() -> None:
+                for project_root in roots:
+                    (project_root / ".claude" / "agents" / "dev.md").unlink(
+                        missing_ok=True
+                    )
+
+            for link_mode in ("copy", "symlink"):
+
+                def init_all(link_mode: str = link_mode) -> None:
+                    args = ["init", "--auto-integrate", "--link-mode", link_mode]
+                    for project_root in roots:
+                        with _chdir(project_root):
+                            runner.invoke(main, args)
+
+                case = f"init[roots={count}]"
+                if link_mode != "copy":
+                    case = f"init[roots={count},link_mode={link_mode}]"
+                results[case] = measure(init_all, runs, setup=remove_agents)
+
+            def integrate_all() -> None:
+                for _ in integrate_spec_kit_batch(roots, executor="thread"):
+                    pass
+
+            def reset_commands() -> None:
+                for project_root in roots:
+                    write_commands(project_root, 1 * KB)
+
+            results[f"integrate_spec_kit_batch[roots={count}]"] = measure(
+                integrate_all, runs, setup=reset_commands
+            )
+
+            fleet_dir = base / f"fleet-{count}"
+            age_tree(fleet_dir)
+            results[f"scan_projects[roots={count}]"] = measure(
+                lambda: list(scan_projects(fleet_dir)), runs
+            )
+
+            def index_refresh() -> None:
+                with ProjectIndex(fleet_dir) as index:
+                    for _ in index.refresh():
+                        pass
+
+            index_refresh()  # Warm the index; the cases measure index hits
+            results[f"project_index_refresh[roots={count}]"] = measure(
+                index_refresh, runs
+            )
+
+        root = make_project(base / "list")
+        with _chdir(root):
+            results["list"] = measure(lambda: runner.invoke(main, ["list"]), runs)
+
+    return results
+
+
+def compare(
+    results: dict[str, CaseResult], baseline: dict[str, CaseResult]
+) -> list[Regression]:
+    """Find cases slower or larger than baseline beyond the tolerances."""
+    regressions: list[Regression] = []
+    for case, current in results.items():
+        previous = baseline.get(case)
+        if previous is None:
+            continue
+        checks = [
+            ("seconds", TIME_TOLERANCE, MIN_SECONDS_DELTA),
+            ("peak_bytes", MEMORY_TOLERANCE, MIN_BYTES_DELTA),
+        ]
+        for metric, tolerance, min_delta in checks:
+            before = float(previous[metric])  # type: ignore[literal-required]
+            after = float(current[metric])  # type: ignore[literal-required]
+            if after > before * tolerance and after - before > min_delta:
+                regressions.append({
+                    "case": case,
+                    "metric": metric,
+                    "baseline": before,
+                    "current": after,
+                })
+    return regressions
+
+
+def _report(profile: str, results: dict[str, CaseResult]) -> dict[str, object]:
+    return {
+        "profile": profile,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def main_cli() -> int:
+    """Command-line entry point; returns the process exit code."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="quick")
+    parser.add_argument("--output", type=Path, help="Write results JSON here")
+    parser.add_argument(
+        "--compare",
+        action="store_true",
+        help="Fail if any case regressed against the profile's baseline",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Overwrite the profile's baseline with these results",
+    )
+    args = parser.parse_args()
+
+    results = run_suite(args.profile)
+    for case, result in results.items():
+        print(
+            f"{case:<45} {result['seconds'] * 1000:>10.2f} ms "
+            f"{result['peak_bytes'] / KB:>10.1f} KiB"
+        )
+
+    report = _report(args.profile, results)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    baseline_file = BASELINE_DIR / f"{args.profile}.json"
+    if args.update_baseline:
+        BASELINE_DIR.mkdir(exist_ok=True)
+        baseline_file.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\nBaseline written to {baseline_file}")
+
+    if args.compare:
+        baseline = json.loads(baseline_file.read_text())["results"]
+        regressions = compare(results, baseline)
+        for r in regressions:
+            print(
+                f"REGRESSION {r['case']} {r['metric']}: "
+                f"{r['baseline']:.4g} -> {r['current']:.4g}"
+            )
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_cli())
@@ -0,0 +1,83 @@
+"""Synthetic Spec Kit project trees for benchmarks."""
+
+import os
+import time
+from pathlib import Path
+
+from pantheon.backups import append_to_index
+from pantheon.integrations.spec_kit import COMMAND_DIRECTIVES
+
+_LINE = "- Step: process the next task and record the outcome in the log.\n"
+
+
+def command_text(name: str, size: int) -> str:
+    """Build a Spec Kit style command file of roughly size bytes."""
+    header = f"---\ndescription: {name} command\n---\n\n# /{name}\n\n"
+    body_lines = max(0, (size - len(header)) // len(_LINE))
+    return header + _LINE * body_lines
+
+
+def make_project(
+    root: Path, command_size: int = 1024, backups: int = 0, agent: bool = True
+) -> Path:
+    """Create one Spec Kit project with optional pre-existing backups.
+
+    Args:
+        root: Directory to create the project in.
+        command_size: Approximate size in bytes of each command file.
+        backups: Number of existing backup directories to create.
+        agent: Whether to install the DEV agent.
+
+    Returns:
+        The project root.
+    """
+    commands_dir = root / ".claude" / "commands"
+    commands_dir.mkdir(parents=True, exist_ok=True)
+    (root / ".claude" / "agents").mkdir(exist_ok=True)
+    (root / ".specify").mkdir(exist_ok=True)
+
+    if agent:
+        (root / ".claude" / "agents" / "dev.md").write_text("---\nname: DEV\n---\n")
+
+    write_commands(root, command_size)
+
+    for i in range(backups):
+        backup_dir = root / f".integration-backup-20240101-{i:06d}"
+        backup_dir.mkdir()
+        for filename in COMMAND_DIRECTIVES:
+            (backup_dir / filename).write_text(command_text(filename, 256))
+        append_to_index(root, backup_dir.name)
+
+    return root
+
+
+def write_commands(root: Path, command_size: int) -> None:
+    """(Re)write every registered command file without directives."""
+    commands_dir = root / ".claude" / "commands"
+    for filename in COMMAND_DIRECTIVES:
+        (commands_dir / filename).write_text(
+            command_text(filename.removesuffix(".md"), command_size)
+        )
+
+
+def make_fleet(base: Path, count: int, command_size: int = 1024) -> list[Path]:
+    """Create count projects under base, spread over nested directories."""
+    roots = []
+    for i in range(count):
+        root = base / f"group-{i // 100:03d}" / f"project-{i:05d}"
+        roots.append(make_project(root, command_size))
+    return roots
+
+
+def age_tree(base: Path, seconds: int = 3600) -> None:
+    """Backdate every file and directory under base.
+
+    Caches treat entries modified within the last couple of seconds as
+    possibly still changing, so freshly generated trees are aged before
+    measuring warm-cache behaviour.
+    """
+    old_ns = time.time_ns() - seconds * 10**9
+    for dirpath, dirnames, filenames in os.walk(base):
+        for name in dirnames + filenames:
+            os.utime(os.path.join(dirpath, name), ns=(old_ns, old_ns))
+    os.utime(base, ns=(old_ns, old_ns))
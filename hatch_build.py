@@ -0,0 +1,21 @@
+"""Hatch build hook: regenerate the agent catalog before packaging."""
+
+import sys
+from pathlib import Path
+from typing import Any
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+
+class CustomBuildHook(BuildHookInterface):
+    """Write src/pantheon/agents/catalog.json from the agent files."""
+
+    def initialize(self, version: str, build_data: dict[str, Any]) -> None:
+        sys.path.insert(0, str(Path(self.root) / "src"))
+        try:
+            from pantheon.catalog import write_catalog
+
+            if write_catalog():
+                self.app.display_info("Regenerated agent catalog")
+        finally:
+            sys.path.pop(0)
@@ -0,0 +1,46 @@
+"""Console entry point for Pantheon.
+
+Answers ``pantheon --version`` and a plain ``pantheon list``, which shell
+prompts and git hooks call constantly, without importing click. Commands a
+running ``pantheon serve`` daemon can handle are forwarded to it, importing
+pantheon.client only for those; everything else is handed to the click CLI
+in pantheon.cli.
+"""
+
+import sys
+
+
+def run() -> None:
+    """Run the pantheon command line."""
+    if sys.argv[1:] == ["--version"]:
+        from pantheon import __version__
+
+        sys.stdout.write(f"pantheon, version {__version__}\n")
+        return
+
+    if sys.argv[1:] == ["list"]:
+        from pathlib import Path
+
+        from pantheon.catalog import agent_statuses, format_agent_list
+
+        cwd = Path.cwd()
+        lines = format_agent_list(cwd, agent_statuses(cwd))
+        sys.stdout.write("".join(f"{line}\n" for line in lines))
+        return
+
+    from pantheon._forwarding import forwardable
+
+    if forwardable(sys.argv[1:]):
+        from pantheon.client import forward
+
+        exit_code = forward(sys.argv[1:])
+        if exit_code is not None:
+            sys.exit(exit_code)
+
+    from pantheon.cli import main
+
+    main()
+
+
+if __name__ == "__main__":
+    run()
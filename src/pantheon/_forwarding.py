@@ -0,0 +1,53 @@
+"""Which command lines the `pantheon serve` daemon may run.
+
+Kept free of imports so the console entry point can rule out forwarding
+before importing pantheon.client; see pantheon.client for the protocol.
+"""
+
+# Options the daemon may run, per subcommand, mapped to whether they take a
+# value. Options naming files or directories are absent on purpose: they
+# would be resolved against the daemon's working directory.
+FORWARDED_OPTIONS: dict[str, dict[str, bool]] = {
+    "integrate": {
+        "--dry-run": False,
+        "--diff": False,
+        "--force": False,
+        "--verify-on-disk": False,
+    },
+    "rollback": {"--force": False, "--nth": True, "--to": True, "--file": True},
+    "status": {},
+    "unintegrate": {},
+    "upgrade": {},
+}
+
+
+def forwardable(argv: list[str]) -> bool:
+    """Whether the daemon can run this command line unchanged."""
+    args = list(argv)
+    structured = False
+    while args and args[0].startswith("--output"):
+        option = args.pop(0)
+        value = option.partition("=")[2] if "=" in option else None
+        if value is None:
+            if not args:
+                return False
+            value = args.pop(0)
+        structured = value != "text"
+
+    if not args or args[0] not in FORWARDED_OPTIONS:
+        return False
+    command, options = args[0], FORWARDED_OPTIONS[args[0]]
+
+    rest = args[1:]
+    while rest:
+        option = rest.pop(0)
+        name = option.partition("=")[0]
+        if name not in options:
+            return False
+        if options[name] and "=" not in option:
+            if not rest:
+                return False
+            rest.pop(0)
+
+    # The daemon cannot prompt: rollback needs --force (or structured output)
+    return command != "rollback" or structured or "--force" in args
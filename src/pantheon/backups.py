@@ -0,0 +1,965 @@
+"""Content-addressed backup store for Spec Kit command files."""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, TypedDict
+
+if TYPE_CHECKING:
+    import tarfile
+
+# Project-local directory holding Pantheon's own state
+STORE_DIR = ".pantheon"
+
+# Backup directories live in the project root and are named by timestamp,
+# to the second, plus a nanosecond suffix that keeps names unique and in
+# creation order: .integration-backup-20250101-120000-123456789
+BACKUP_PREFIX = ".integration-backup-"
+BACKUP_GLOB = BACKUP_PREFIX + "*"
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+# Append-only index of backup names, oldest first. Records are fixed width
+# so the N-th most recent backup is a single seek from the end of the file.
+INDEX_NAME = "backups.idx"
+INDEX_RECORD_SIZE = 64
+
+# Packed backups live in one archive per project, holding each backup's
+# manifest as <backup name>/manifest.json and file contents once each as
+# objects/<digest>. packed.idx lists the packed backups in the index format.
+ARCHIVE_NAMES = {"xz": "backups.tar.xz", "gz": "backups.tar.gz"}
+PACKED_INDEX_NAME = "packed.idx"
+
+_TIMESTAMP_FORMAT = "%Y%m%d-%H%M%S"
+_AGE_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 7 * 86400}
+
+_CHUNK_SIZE = 64 * 1024
+
+
+class BackupManifest(TypedDict):
+    """Type for the manifest stored in each backup directory."""
+
+    version: int
+    created: str
+    files: dict[str, str]
+
+
+class GcResult(TypedDict):
+    """Type for object garbage collection result dictionary."""
+
+    objects_removed: int
+    bytes_freed: int
+    objects_kept: int
+
+
+class PruneResult(TypedDict):
+    """Type for backup pruning result dictionary."""
+
+    backups_removed: list[str]
+    backups_kept: int
+
+
+class PackResult(TypedDict):
+    """Type for backup packing result dictionary."""
+
+    backups_packed: list[str]
+    archive: Optional[Path]
+    packed_total: int
+
+
+def objects_dir(project_root: Path) -> Path:
+    """Return the directory holding content-addressed backup objects."""
+    return project_root / STORE_DIR / "objects"
+
+
+def object_path(project_root: Path, digest: str) -> Path:
+    """Return the path of the object with the given SHA-256 digest."""
+    return objects_dir(project_root) / digest[:2] / digest[2:]
+
+
+def hash_file(path: Path) -> str:
+    """Compute the SHA-256 hex digest of a file in bounded chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(_CHUNK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def store_object(project_root: Path, source: Path) -> str:
+    """Add a file's content to the object store.
+
+    Content that is already stored is not copied again.
+
+    Args:
+        project_root: Root directory of the project.
+        source: File whose content should be stored.
+
+    Returns:
+        SHA-256 hex digest identifying the stored object.
+    """
+    digest = hash_file(source)
+    target = object_path(project_root, digest)
+
+    if not target.exists():
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        os.close(fd)
+        try:
+            shutil.copy2(source, tmp_name)
+            os.replace(tmp_name, target)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+    return digest
+
+
+def link_object(project_root: Path, digest: str, dest: Path) -> None:
+    """Materialize a stored object at dest.
+
+    Uses a hardlink so the backup costs no extra bytes, falling back to a
+    copy where the filesystem does not support hardlinks.
+
+    Args:
+        project_root: Root directory of the project.
+        digest: Digest of a stored object.
+        dest: Path to create.
+    """
+    source = object_path(project_root, digest)
+    if dest.exists():
+        dest.unlink()
+    try:
+        os.link(source, dest)
+    except OSError:
+        shutil.copy2(source, dest)
+
+
+def write_manifest(backup_dir: Path, files: dict[str, str]) -> BackupManifest:
+    """Write the manifest describing a backup directory.
+
+    Args:
+        backup_dir: Backup directory to describe.
+        files: Mapping of command filename to object digest.
+
+    Returns:
+        The manifest that was written.
+    """
+    manifest: BackupManifest = {
+        "version": MANIFEST_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "files": files,
+    }
+    (backup_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2) + "\n")
+    return manifest
+
+
+def read_manifest(backup_dir: Path) -> Optional[BackupManifest]:
+    """Read a backup directory's manifest.
+
+    Args:
+        backup_dir: Backup directory to read.
+
+    Returns:
+        The manifest, or None for legacy backups without one or with an
+        unreadable one.
+    """
+    try:
+        return _parse_manifest((backup_dir / MANIFEST_NAME).read_bytes())
+    except OSError:
+        return None
+
+
+def _parse_manifest(raw: bytes) -> Optional[BackupManifest]:
+    try:
+        data = json.loads(raw)
+    except ValueError:
+        return None
+
+    if not isinstance(data, dict) or not isinstance(data.get("files"), dict):
+        return None
+
+    manifest: BackupManifest = {
+        "version": int(data.get("version", MANIFEST_VERSION)),
+        "created": str(data.get("created", "")),
+        "files": {str(k): str(v) for k, v in data["files"].items()},
+    }
+    return manifest
+
+
+def gc_objects(project_root: Optional[Path] = None) -> GcResult:
+    """Remove stored objects no backup manifest refers to.
+
+    Objects named by the journal of an interrupted commit are kept too, so
+    journal.recover() can still undo it.
+
+    Args:
+        project_root: Root directory of the project. Defaults to current directory.
+
+    Returns:
+        Dictionary with garbage collection results:
+        {
+            "objects_removed": int,
+            "bytes_freed": int,
+            "objects_kept": int
+        }
+    """
+    if project_root is None:
+        project_root = Path.cwd()
+
+    from pantheon.journal import read_journal
+    from pantheon.locking import project_lock
+
+    result: GcResult = {"objects_removed": 0, "bytes_freed": 0, "objects_kept": 0}
+
+    with project_lock(project_root):
+        referenced: set[str] = set()
+        for backup_dir in project_root.glob(BACKUP_GLOB):
+            manifest = read_manifest(backup_dir)
+            if manifest is not None:
+                referenced.update(manifest["files"].values())
+        for entry in read_journal(project_root) or []:
+            referenced.add(entry["before"])
+
+        store = objects_dir(project_root)
+        if not store.exists():
+            return result
+
+        for fanout_dir in store.iterdir():
+            if not fanout_dir.is_dir():
+                continue
+            for obj in fanout_dir.iterdir():
+                if fanout_dir.name + obj.name in referenced:
+                    result["objects_kept"] += 1
+                    continue
+                # Space is only reclaimed once no backup hardlinks the object
+                st = obj.stat()
+                if st.st_nlink == 1:
+                    result["bytes_freed"] += st.st_size
+                obj.unlink()
+                result["objects_removed"] += 1
+            if not any(fanout_dir.iterdir()):
+                fanout_dir.rmdir()
+
+        return result
+
+
+class CorruptIndexError(Exception):
+    """Raised when the backup index is missing or unreadable."""
+
+
+def index_path(project_root: Path) -> Path:
+    """Return the path of the backup index."""
+    return project_root / STORE_DIR / INDEX_NAME
+
+
+def _encode_record(backup_name: str) -> bytes:
+    """Encode a backup name as one fixed-width index record."""
+    record = backup_name.encode("ascii").ljust(INDEX_RECORD_SIZE - 1) + b"\n"
+    if len(record) != INDEX_RECORD_SIZE:
+        raise ValueError(f"Backup name too long for index: {backup_name}")
+    return record
+
+
+def _decode_record(record: bytes) -> str:
+    """Decode one index record, raising CorruptIndexError if malformed."""
+    try:
+        name = record.decode("ascii").rstrip()
+    except UnicodeDecodeError as e:
+        raise CorruptIndexError(str(e)) from e
+    if not record.endswith(b"\n") or not name.startswith(BACKUP_PREFIX):
+        raise CorruptIndexError(f"Malformed index record: {record!r}")
+    return name
+
+
+def append_to_index(project_root: Path, backup_name: str) -> None:
+    """Record a newly created backup at the end of the index.
+
+    If there is no index yet, it is built from the backup directories on
+    disk instead, so backups made before the index existed are kept.
+
+    Args:
+        project_root: Root directory of the project.
+        backup_name: Name of the (already created) backup directory.
+    """
+    path = index_path(project_root)
+    if not path.exists():
+        rebuild_index(project_root)
+        return
+
+    with open(path, "ab") as f:
+        f.write(_encode_record(backup_name))
+
+
+def rebuild_index(project_root: Path) -> list[str]:
+    """Rebuild the backup index from the backup directories on disk.
+
+    Args:
+        project_root: Root directory of the project.
+
+    Returns:
+        Backup names, oldest first.
+    """
+    names = sorted({
+        *(p.name for p in project_root.glob(BACKUP_GLOB) if p.is_dir()),
+        *list_packed_names(project_root),
+    })
+
+    path = index_path(project_root)
+    if not names and not path.exists():
+        return names
+
+    try:
+        _write_records(path, names)
+    except (OSError, ValueError):
+        # Read-only or odd names: the in-memory list is still correct
+        pass
+
+    return names
+
+
+def _write_records(path: Path, names: list[str]) -> None:
+    """Atomically replace an index file with the given records."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for name in names:
+                f.write(_encode_record(name))
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def _read_records(path: Path) -> list[str]:
+    """Read every record of an index file, oldest first.
+
+    Raises:
+        CorruptIndexError: If the file is missing or malformed.
+    """
+    try:
+        data = path.read_bytes()
+    except OSError as e:
+        raise CorruptIndexError(str(e)) from e
+    if len(data) % INDEX_RECORD_SIZE:
+        raise CorruptIndexError("Index size is not a whole number of records")
+    return [
+        _decode_record(data[i:i + INDEX_RECORD_SIZE])
+        for i in range(0, len(data), INDEX_RECORD_SIZE)
+    ]
+
+
+def _read_index_record(project_root: Path, n: int) -> Optional[str]:
+    """Read the n-th most recent record (0 = latest) from the index.
+
+    Returns:
+        The backup name, or None if the index holds n or fewer records.
+
+    Raises:
+        CorruptIndexError: If the index is missing or malformed.
+    """
+    try:
+        with open(index_path(project_root), "rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            if size % INDEX_RECORD_SIZE:
+                raise CorruptIndexError("Index size is not a whole number of records")
+            offset = size - (n + 1) * INDEX_RECORD_SIZE
+            if offset < 0:
+                return None
+            f.seek(offset)
+            return _decode_record(f.read(INDEX_RECORD_SIZE))
+    except FileNotFoundError as e:
+        raise CorruptIndexError("Index not found") from e
+
+
+def backup_name_at(project_root: Path, n: int = 0) -> Optional[str]:
+    """Look up the n-th most recent backup (0 = latest).
+
+    Reads a single index record; falls back to rebuilding the index from
+    disk if it is missing, corrupt, or points at a deleted backup.
+
+    Args:
+        project_root: Root directory of the project.
+        n: How many backups to step back from the latest.
+
+    Returns:
+        The backup directory name, or None if there are not enough backups.
+    """
+    try:
+        name = _read_index_record(project_root, n)
+        if (
+            name is None
+            or (project_root / name).is_dir()
+            or name in list_packed_names(project_root)
+        ):
+            return name
+    except CorruptIndexError:
+        pass
+
+    names = rebuild_index(project_root)
+    return names[-(n + 1)] if n < len(names) else None
+
+
+def list_backup_names(project_root: Path) -> list[str]:
+    """List all backups recorded in the index, newest first.
+
+    Falls back to rebuilding the index from disk if it is missing, corrupt,
+    or lists a backup that no longer exists. Packed backups are included.
+
+    Args:
+        project_root: Root directory of the project.
+
+    Returns:
+        Backup names, newest first.
+    """
+    try:
+        names = _read_records(index_path(project_root))
+        missing = {name for name in names if not (project_root / name).is_dir()}
+        if not missing or missing.issubset(list_packed_names(project_root)):
+            return names[::-1]
+    except CorruptIndexError:
+        pass
+
+    return rebuild_index(project_root)[::-1]
+
+
+def backup_created(backup_name: str) -> Optional[datetime]:
+    """Return when a backup was made, from the timestamp in its name.
+
+    Returns:
+        The creation time, or None if the name carries no timestamp.
+    """
+    stamp = backup_name[len(BACKUP_PREFIX):len(BACKUP_PREFIX) + 15]
+    try:
+        return datetime.strptime(stamp, _TIMESTAMP_FORMAT)
+    except ValueError:
+        return None
+
+
+def _backup_ns(backup_name: str) -> Optional[int]:
+    """Return a backup's creation time in nanoseconds, from its name."""
+    created = backup_created(backup_name)
+    if created is None:
+        return None
+    ns = int(created.timestamp()) * 1_000_000_000
+    suffix = backup_name[len(BACKUP_PREFIX) + 15:]
+    if len(suffix) == 10 and suffix[0] == "-" and suffix[1:].isdigit():
+        ns += int(suffix[1:])
+    return ns
+
+
+def new_backup_name(project_root: Path, after: Optional[str] = None) -> str:
+    """Choose the name for a new backup of a project.
+
+    The name is the current time to the nanosecond. If that would not sort
+    after the latest backup (or after), because the clock went back or two
+    backups were made in the same nanosecond, the time just after the
+    latest backup is used instead, so names always sort in creation order.
+
+    Args:
+        project_root: Root directory of the project.
+        after: A name the new one must also sort after.
+
+    Returns:
+        The backup directory name.
+    """
+    ns = time.time_ns()
+    for name in (backup_name_at(project_root), after):
+        floor = _backup_ns(name) if name is not None else None
+        if floor is not None and ns <= floor:
+            ns = floor + 1
+    seconds, fraction = divmod(ns, 1_000_000_000)
+    stamp = datetime.fromtimestamp(seconds).strftime(_TIMESTAMP_FORMAT)
+    return f"{BACKUP_PREFIX}{stamp}-{fraction:09d}"
+
+
+def make_backup_dir(project_root: Path) -> Path:
+    """Create and index the directory for a new backup.
+
+    Callers hold the project lock (see pantheon.locking), so the name is
+    not raced by other Pantheon processes; a directory made by anything
+    else is skipped over.
+
+    Args:
+        project_root: Root directory of the project.
+
+    Returns:
+        The new, empty backup directory.
+    """
+    name = None
+    while True:
+        name = new_backup_name(project_root, after=name)
+        backup_dir = project_root / name
+        try:
+            backup_dir.mkdir(parents=True)
+        except FileExistsError:
+            continue
+        append_to_index(project_root, name)
+        return backup_dir
+
+
+def parse_age(text: str) -> timedelta:
+    """Parse an age such as "90m", "12h", "30d" or "2w".
+
+    Raises:
+        ValueError: If text is not a number followed by s, m, h, d or w.
+    """
+    match = re.fullmatch(r"\s*(\d+)\s*([smhdw])\s*", text)
+    if match is None:
+        raise ValueError(f"Invalid age: {text!r} (expected e.g. 12h, 30d, 2w)")
+    return timedelta(seconds=int(match.group(1)) * _AGE_UNITS[match.group(2)])
+
+
+def resolve_backup_name(
+    project_root: Path, ref: str, now: Optional[datetime] = None
+) -> Optional[str]:
+    """Find the backup a user refers to by ID or by age.
+
+    Args:
+        project_root: Root directory of the project.
+        ref: A backup's directory name, its ID (the name without the
+            ".integration-backup-" prefix) or a unique leading part of the
+            ID such as "20251001-1430"; or an age such as "2d", meaning the
+            newest backup at least that old.
+        now: Reference time for ages. Defaults to now.
+
+    Returns:
+        The backup name, or None if no backup matches.
+
+    Raises:
+        ValueError: If ref is a leading part of several backup IDs.
+    """
+    names = list_backup_names(project_root)
+    ref = ref.strip()
+    name = ref if ref.startswith(BACKUP_PREFIX) else BACKUP_PREFIX + ref
+    if name in names:
+        return name
+
+    try:
+        age = parse_age(ref)
+    except ValueError:
+        matches = [n for n in names if n.startswith(name)] if ref else []
+        if len(matches) > 1:
+            raise ValueError(
+                f"Backup ID {ref!r} is ambiguous: matches {len(matches)} backups"
+            ) from None
+        return matches[0] if matches else None
+
+    cutoff = (now or datetime.now()) - age
+    for name in names:
+        created = backup_created(name)
+        if created is not None and created <= cutoff:
+            return name
+    return None
+
+
+def expired_backups(
+    names: list[str],
+    keep: Optional[int] = None,
+    older_than: Optional[timedelta] = None,
+    now: Optional[datetime] = None,
+) -> list[str]:
+    """Select the backups outside a retention policy.
+
+    A backup is retained if it is among the newest keep backups or is no
+    older than older_than; when both are given, either one retains it.
+
+    Args:
+        names: Backup names, newest first.
+        keep: Number of most recent backups to retain.
+        older_than: Retain backups younger than this.
+        now: Reference time for ages. Defaults to now.
+
+    Returns:
+        Names of the backups not retained, newest first.
+
+    Raises:
+        ValueError: If neither keep nor older_than is given.
+    """
+    if keep is None and older_than is None:
+        raise ValueError("A retention policy needs keep or older_than")
+    if now is None:
+        now = datetime.now()
+
+    expired = []
+    for position, name in enumerate(names):
+        if keep is not None and position < keep:
+            continue
+        if older_than is not None:
+            created = backup_created(name)
+            if created is None or now - created <= older_than:
+                continue
+        expired.append(name)
+    return expired
+
+
+def prune_backups(
+    project_root: Optional[Path] = None,
+    keep: Optional[int] = None,
+    older_than: Optional[timedelta] = None,
+    dry_run: bool = False,
+) -> PruneResult:
+    """Delete the backups (directories and packed) outside a retention policy.
+
+    Objects only referenced by deleted backup directories stay in the
+    object store until gc_objects() runs.
+
+    Args:
+        project_root: Root directory of the project. Defaults to current directory.
+        keep: Number of most recent backups to retain.
+        older_than: Retain backups younger than this.
+        dry_run: Only report what would be deleted.
+
+    Returns:
+        Dictionary with pruning results:
+        {
+            "backups_removed": list of backup names, newest first,
+            "backups_kept": int
+        }
+
+    Raises:
+        ValueError: If neither keep nor older_than is given.
+    """
+    if project_root is None:
+        project_root = Path.cwd()
+
+    from pantheon.locking import project_lock
+
+    with project_lock(project_root):
+        names = list_backup_names(project_root)
+        expired = expired_backups(names, keep, older_than)
+        result: PruneResult = {
+            "backups_removed": expired,
+            "backups_kept": len(names) - len(expired),
+        }
+        if dry_run or not expired:
+            return result
+
+        packed = set(list_packed_names(project_root))
+        dropped = packed.intersection(expired)
+        if dropped:
+            _write_archive(project_root, [], dropped)
+
+        for name in expired:
+            shutil.rmtree(project_root / name, ignore_errors=True)
+
+        rebuild_index(project_root)
+        return result
+
+
+def archive_path(project_root: Path) -> Optional[Path]:
+    """Return the project's packed backup archive, or None if there is none."""
+    for name in ARCHIVE_NAMES.values():
+        path = project_root / STORE_DIR / name
+        if path.exists():
+            return path
+    return None
+
+
+def packed_index_path(project_root: Path) -> Path:
+    """Return the path of the list of packed backups."""
+    return project_root / STORE_DIR / PACKED_INDEX_NAME
+
+
+def list_packed_names(project_root: Path) -> list[str]:
+    """List the backups held in the packed archive, oldest first.
+
+    Reads packed.idx; if it is missing or corrupt while an archive exists,
+    the list is recovered from the archive.
+    """
+    try:
+        return _read_records(packed_index_path(project_root))
+    except CorruptIndexError:
+        pass
+
+    archive = archive_path(project_root)
+    if archive is None:
+        return []
+
+    import tarfile
+
+    with tarfile.open(archive, "r:*") as tar:
+        names = sorted(_archive_manifests(tar))
+    try:
+        _write_records(packed_index_path(project_root), names)
+    except (OSError, ValueError):
+        pass
+    return names
+
+
+def _archive_manifests(tar: "tarfile.TarFile") -> dict[str, BackupManifest]:
+    """Read every backup manifest in an open archive."""
+    manifests: dict[str, BackupManifest] = {}
+    for member in tar.getmembers():
+        name, _, leaf = member.name.partition("/")
+        if leaf != MANIFEST_NAME or not name.startswith(BACKUP_PREFIX):
+            continue
+        stream = tar.extractfile(member)
+        manifest = _parse_manifest(stream.read()) if stream else None
+        if manifest is not None:
+            manifests[name] = manifest
+    return manifests
+
+
+def _backup_contents(
+    project_root: Path, backup_name: str
+) -> tuple[BackupManifest, dict[str, Path]]:
+    """Return a backup directory's manifest and a source file per digest.
+
+    Legacy backups without a manifest get one computed from their files.
+    """
+    backup_dir = project_root / backup_name
+    manifest = read_manifest(backup_dir)
+    if manifest is None:
+        files = {p.name: hash_file(p) for p in sorted(backup_dir.glob("*.md"))}
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "created": "",
+            "files": files,
+        }
+
+    sources: dict[str, Path] = {}
+    for filename, digest in manifest["files"].items():
+        source = backup_dir / filename
+        if not source.exists():
+            source = object_path(project_root, digest)
+        sources[digest] = source
+    return manifest, sources
+
+
+def _write_archive(
+    project_root: Path,
+    add: list[str],
+    drop: set[str],
+    compression: Optional[str] = None,
+) -> list[str]:
+    """Rewrite the packed archive with backups added and dropped.
+
+    Args:
+        project_root: Root directory of the project.
+        add: Backup directories to add (replacing packed copies).
+        drop: Packed backups to leave out.
+        compression: "xz" or "gz". Defaults to the existing archive's.
+
+    Returns:
+        Names of the backups in the new archive, oldest first. packed.idx
+        is rewritten to match; the archive is removed when it ends up empty.
+    """
+    import io
+    import tarfile
+
+    old_path = archive_path(project_root)
+    if compression is None:
+        compression = "gz" if old_path and old_path.name.endswith(".gz") else "xz"
+    new_path = project_root / STORE_DIR / ARCHIVE_NAMES[compression]
+    new_path.parent.mkdir(parents=True, exist_ok=True)
+
+    manifests: dict[str, BackupManifest] = {}
+    written: set[str] = set()
+
+    def add_bytes(tar: tarfile.TarFile, arcname: str, data: bytes) -> None:
+        info = tarfile.TarInfo(arcname)
+        info.size = len(data)
+        info.mtime = int(time.time())
+        tar.addfile(info, io.BytesIO(data))
+
+    fd, tmp_name = tempfile.mkstemp(dir=new_path.parent, suffix=".tmp")
+    os.close(fd)
+    try:
+        with (
+            tarfile.open(tmp_name, "w:gz")
+            if compression == "gz"
+            else tarfile.open(tmp_name, "w:xz")
+        ) as tar:
+            for name in add:
+                manifest, sources = _backup_contents(project_root, name)
+                manifests[name] = manifest
+                add_bytes(
+                    tar,
+                    f"{name}/{MANIFEST_NAME}",
+                    json.dumps(manifest, indent=2).encode() + b"\n",
+                )
+                for digest, source in sources.items():
+                    if digest not in written:
+                        tar.add(source, arcname=f"objects/{digest}", recursive=False)
+                        written.add(digest)
+
+            if old_path is not None:
+                with tarfile.open(old_path, "r:*") as old:
+                    kept = {
+                        name: manifest
+                        for name, manifest in _archive_manifests(old).items()
+                        if name not in drop and name not in manifests
+                    }
+                    needed = {
+                        digest
+                        for manifest in kept.values()
+                        for digest in manifest["files"].values()
+                    }
+                    for member in old.getmembers():
+                        name, _, leaf = member.name.partition("/")
+                        keep_member = (
+                            name in kept
+                            if leaf == MANIFEST_NAME
+                            else name == "objects"
+                            and leaf in needed
+                            and leaf not in written
+                        )
+                        if keep_member:
+                            tar.addfile(member, old.extractfile(member))
+                            if name == "objects":
+                                written.add(leaf)
+                    manifests.update(kept)
+
+        if manifests:
+            os.replace(tmp_name, new_path)
+        else:
+            os.unlink(tmp_name)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+    if old_path is not None and (old_path != new_path or not manifests):
+        old_path.unlink()
+
+    names = sorted(manifests)
+    if names:
+        _write_records(packed_index_path(project_root), names)
+    else:
+        packed_index_path(project_root).unlink(missing_ok=True)
+    return names
+
+
+def pack_backups(
+    project_root: Optional[Path] = None,
+    keep: Optional[int] = 1,
+    older_than: Optional[timedelta] = None,
+    compression: Optional[str] = None,
+) -> PackResult:
+    """Move backups outside a retention policy into the packed archive.
+
+    Packed backups keep their place in the backup index, so find_backup()
+    and rollback_integration() still reach them; restoring one extracts it
+    from the archive. The packed directories are deleted; objects only they
+    referenced stay in the object store until gc_objects() runs.
+
+    Args:
+        project_root: Root directory of the project. Defaults to current directory.
+        keep: Number of most recent backups to leave as directories.
+        older_than: Leave backups younger than this as directories.
+        compression: "xz" (default for a new archive) or "gz".
+
+    Returns:
+        Dictionary with packing results:
+        {
+            "backups_packed": list of backup names, newest first,
+            "archive": Path of the archive, or None if there is none,
+            "packed_total": int (backups now in the archive)
+        }
+    """
+    if project_root is None:
+        project_root = Path.cwd()
+    if compression is not None and compression not in ARCHIVE_NAMES:
+        raise ValueError(f"Unknown compression: {compression}")
+
+    from pantheon.locking import project_lock
+
+    with project_lock(project_root):
+        names = list_backup_names(project_root)
+        to_pack = [
+            name
+            for name in expired_backups(names, keep, older_than)
+            if (project_root / name).is_dir()
+        ]
+
+        if to_pack or compression is not None:
+            packed = _write_archive(project_root, to_pack[::-1], set(), compression)
+        else:
+            packed = list_packed_names(project_root)
+
+        for name in to_pack:
+            shutil.rmtree(project_root / name, ignore_errors=True)
+
+        return {
+            "backups_packed": to_pack,
+            "archive": archive_path(project_root),
+            "packed_total": len(packed),
+        }
+
+
+def read_packed_manifest(
+    project_root: Path, backup_name: str
+) -> Optional[BackupManifest]:
+    """Read the manifest of a packed backup.
+
+    Returns:
+        The manifest, or None if the backup is not in the archive.
+    """
+    archive = archive_path(project_root)
+    if archive is None:
+        return None
+
+    import tarfile
+
+    with tarfile.open(archive, "r:*") as tar:
+        try:
+            stream = tar.extractfile(f"{backup_name}/{MANIFEST_NAME}")
+        except KeyError:
+            return None
+        return _parse_manifest(stream.read()) if stream else None
+
+
+def unpack_backup(project_root: Path, backup_name: str, dest: Path) -> bool:
+    """Extract a packed backup into a new backup-style directory.
+
+    Args:
+        project_root: Root directory of the project.
+        backup_name: Name of the packed backup.
+        dest: Directory to create, receiving the manifest and files.
+
+    Returns:
+        True if the backup was found in the archive, otherwise False.
+    """
+    archive = archive_path(project_root)
+    if archive is None:
+        return False
+
+    import tarfile
+
+    with tarfile.open(archive, "r:*") as tar:
+        try:
+            stream = tar.extractfile(f"{backup_name}/{MANIFEST_NAME}")
+        except KeyError:
+            return False
+        raw = stream.read() if stream else b""
+        manifest = _parse_manifest(raw)
+        if manifest is None:
+            return False
+
+        dest.mkdir(parents=True)
+        (dest / MANIFEST_NAME).write_bytes(raw)
+        for filename, digest in manifest["files"].items():
+            # Only plain file names: never write outside dest
+            if os.path.basename(filename) != filename:
+                continue
+            try:
+                source = tar.extractfile(f"objects/{digest}")
+            except KeyError:
+                continue
+            if source is None:
+                continue
+            with open(dest / filename, "wb") as f:
+                shutil.copyfileobj(source, f)
+    return True
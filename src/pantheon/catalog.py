@@ -0,0 +1,239 @@
+"""Precomputed catalog of the agents shipped with Pantheon.
+
+The catalog (agents/catalog.json) holds each agent's YAML frontmatter,
+content hash and size. It is generated at build time by the hatch build
+hook in hatch_build.py, so `pantheon list` reads one small JSON file
+instead of parsing agent files, and installed copies are checked for
+staleness against the recorded hash.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, TypedDict
+
+AGENTS_DIR = Path(__file__).parent / "agents"
+CATALOG_NAME = "catalog.json"
+CATALOG_VERSION = 1
+
+# Read size for hashing installed agent files
+_CHUNK_SIZE = 1024 * 1024
+
+
+class AgentEntry(TypedDict):
+    """Type for one agent in the catalog."""
+
+    name: str
+    file: str
+    sha256: str
+    size: int
+    frontmatter: dict[str, Any]
+
+
+class AgentStatus(AgentEntry):
+    """Type for a catalog entry with its install status in a project."""
+
+    status: str
+
+
+class AgentCatalog(TypedDict):
+    """Type for the agent catalog manifest."""
+
+    version: int
+    agents: list[AgentEntry]
+
+
+def parse_frontmatter(content: str) -> dict[str, Any]:
+    """Parse the YAML frontmatter at the top of an agent file.
+
+    Args:
+        content: Full text of the agent file.
+
+    Returns:
+        The frontmatter mapping, or an empty dict if there is none.
+    """
+    import yaml
+
+    lines = content.splitlines()
+    if not lines or lines[0].strip() != "---":
+        return {}
+
+    for i, line in enumerate(lines[1:], start=1):
+        if line.strip() == "---":
+            data = yaml.safe_load("\n".join(lines[1:i]))
+            return data if isinstance(data, dict) else {}
+
+    return {}
+
+
+def build_catalog(agents_dir: Path = AGENTS_DIR) -> AgentCatalog:
+    """Build the catalog by reading every agent file.
+
+    Args:
+        agents_dir: Directory holding the agent .md files.
+
+    Returns:
+        Catalog with one entry per agent, sorted by filename.
+    """
+    agents: list[AgentEntry] = []
+    for agent_file in sorted(agents_dir.glob("*.md")):
+        data = agent_file.read_bytes()
+        frontmatter = parse_frontmatter(data.decode("utf-8"))
+        agents.append({
+            "name": str(frontmatter.get("name", agent_file.stem.upper())),
+            "file": agent_file.name,
+            "sha256": hashlib.sha256(data).hexdigest(),
+            "size": len(data),
+            "frontmatter": frontmatter,
+        })
+
+    return {"version": CATALOG_VERSION, "agents": agents}
+
+
+def render_catalog(catalog: AgentCatalog) -> str:
+    """Serialize a catalog exactly as it is written to disk."""
+    return json.dumps(catalog, indent=2, sort_keys=True) + "\n"
+
+
+def write_catalog(agents_dir: Path = AGENTS_DIR) -> bool:
+    """Regenerate agents_dir/catalog.json from the agent files.
+
+    Args:
+        agents_dir: Directory holding the agent .md files.
+
+    Returns:
+        True if the catalog was missing or out of date and was rewritten.
+    """
+    path = agents_dir / CATALOG_NAME
+    rendered = render_catalog(build_catalog(agents_dir))
+    try:
+        if path.read_text() == rendered:
+            return False
+    except OSError:
+        pass
+
+    path.write_text(rendered)
+    return True
+
+
+def load_catalog(agents_dir: Path = AGENTS_DIR) -> AgentCatalog:
+    """Load the agent catalog.
+
+    Falls back to building it from the agent files when the manifest is
+    missing or from another version (e.g. a source checkout).
+
+    Args:
+        agents_dir: Directory holding the agent files and catalog.json.
+
+    Returns:
+        The agent catalog.
+    """
+    try:
+        data = json.loads((agents_dir / CATALOG_NAME).read_text())
+    except (OSError, ValueError):
+        return build_catalog(agents_dir)
+
+    if not isinstance(data, dict) or data.get("version") != CATALOG_VERSION:
+        return build_catalog(agents_dir)
+
+    catalog: AgentCatalog = data  # type: ignore[assignment]
+    return catalog
+
+
+def install_status(entry: AgentEntry, installed_path: Path) -> str:
+    """Compare an installed agent file with its catalog entry.
+
+    A size mismatch is decided by a single stat(); the file is only hashed
+    when its size matches.
+
+    Args:
+        entry: Catalog entry of the agent.
+        installed_path: Where the agent would be installed.
+
+    Returns:
+        "missing", "stale" (content differs from the catalog), or "installed".
+    """
+    try:
+        size = installed_path.stat().st_size
+    except OSError:
+        return "missing"
+
+    if size != entry["size"]:
+        return "stale"
+
+    # Hashed here rather than with backups.hash_file(), which would pull
+    # shutil and tempfile into `pantheon list`
+    digest = hashlib.sha256()
+    with open(installed_path, "rb") as f:
+        while True:
+            chunk = f.read(_CHUNK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+    if digest.hexdigest() != entry["sha256"]:
+        return "stale"
+    return "installed"
+
+
+def agent_statuses(project_root: Path) -> list[AgentStatus]:
+    """Check every catalog agent against a project's .claude/agents/.
+
+    Args:
+        project_root: Project to check.
+
+    Returns:
+        Catalog entries with their install_status() added as "status".
+    """
+    agents_dir = project_root / ".claude" / "agents"
+    return [
+        {**entry, "status": install_status(entry, agents_dir / entry["file"])}
+        for entry in load_catalog()["agents"]
+    ]
+
+
+_STATUS_LABELS = {
+    "installed": "✓ installed",
+    "stale": "⚠ outdated",
+    "missing": "  not installed",
+}
+
+
+def format_agent_list(project_root: Path, agents: list[AgentStatus]) -> list[str]:
+    """Render the `pantheon list` text output.
+
+    Kept free of click so the console entry point can answer a plain
+    `pantheon list` without importing the CLI.
+
+    Args:
+        project_root: Project the statuses were checked in.
+        agents: Result of agent_statuses().
+
+    Returns:
+        Output lines, without trailing newlines.
+    """
+    if not agents:
+        return ["No agents available in Pantheon library."]
+
+    lines = ["Available Agents:\n"]
+    for agent in agents:
+        label = _STATUS_LABELS[agent["status"]]
+        lines.append(f"  {agent['name']:<10} ({agent['file']:<15}) [{label}]")
+        description = agent["frontmatter"].get("description")
+        if description:
+            lines.append(f"      {description}")
+
+    agents_dir = project_root / ".claude" / "agents"
+    statuses = [agent["status"] for agent in agents]
+    if not agents_dir.exists():
+        agents_path = agents_dir.relative_to(project_root)
+        lines.append(
+            f"\n💡 Run 'pantheon init' to install agents to {agents_path}/"
+        )
+    elif all(status == "missing" for status in statuses):
+        lines.append("\n💡 Run 'pantheon init' to install agents")
+    elif "stale" in statuses:
+        lines.append(
+            "\n💡 Outdated agents differ from this Pantheon version; "
+            "remove them and re-run 'pantheon init' to update"
+        )
+    return lines
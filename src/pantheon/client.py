@@ -0,0 +1,125 @@
+"""Client for the `pantheon serve` daemon.
+
+The console entry point calls forward() before importing click, for command
+lines the daemon can run (integrate, rollback, status, unintegrate and
+upgrade in the current directory; pantheon._forwarding decides this without
+importing this module). When a daemon is listening, the command runs in the
+warm daemon and only this module, socket and json are imported locally.
+Otherwise forward() returns None and the command runs in-process as usual.
+Set PANTHEON_NO_DAEMON=1 to always run in-process.
+
+The protocol is JSON-RPC 2.0, one request or response object per line,
+over a Unix domain socket.
+"""
+
+import os
+import sys
+from typing import Any, Optional
+
+from pantheon import __version__
+from pantheon._forwarding import FORWARDED_OPTIONS, forwardable
+
+SOCKET_ENV = "PANTHEON_SOCKET"
+NO_DAEMON_ENV = "PANTHEON_NO_DAEMON"
+
+
+class DaemonError(Exception):
+    """Raised when the daemon answers a request with a JSON-RPC error."""
+
+    def __init__(self, code: int, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+
+
+def socket_path() -> str:
+    """Return the daemon socket path for the current user.
+
+    PANTHEON_SOCKET overrides the default of pantheon-<uid>.sock in
+    XDG_RUNTIME_DIR (or TMPDIR, or /tmp).
+    """
+    override = os.environ.get(SOCKET_ENV)
+    if override:
+        return override
+    base = os.environ.get("XDG_RUNTIME_DIR") or os.environ.get("TMPDIR") or "/tmp"
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return os.path.join(base, f"pantheon-{uid}.sock")
+
+
+def call(
+    method: str,
+    params: Optional[dict[str, Any]] = None,
+    path: Optional[str] = None,
+    timeout: Optional[float] = None,
+) -> Any:
+    """Send one JSON-RPC request to the daemon and return its result.
+
+    Args:
+        method: Method name, e.g. "integrate" or "status".
+        params: Method parameters.
+        path: Socket path. Defaults to socket_path().
+        timeout: Seconds to wait for the connection and the reply.
+
+    Returns:
+        The "result" member of the response.
+
+    Raises:
+        OSError: If no daemon is listening or the connection fails.
+        DaemonError: If the daemon returns an error response.
+    """
+    import json
+    import socket
+
+    request = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params or {}}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(path or socket_path())
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        with sock.makefile("rb") as stream:
+            line = stream.readline()
+
+    if not line:
+        raise ConnectionError("Daemon closed the connection")
+    response = json.loads(line)
+    if "error" in response:
+        error = response["error"]
+        raise DaemonError(int(error.get("code", -1)), str(error.get("message")))
+    return response.get("result")
+
+
+def forward(argv: list[str]) -> Optional[int]:
+    """Run a command line in the daemon if one is running.
+
+    Returns:
+        The command's exit code, or None if the command must run
+        in-process (not forwardable, no daemon, or a different version).
+    """
+    if os.environ.get(NO_DAEMON_ENV) or not forwardable(argv):
+        return None
+    path = socket_path()
+    if not os.path.exists(path):
+        return None
+
+    try:
+        result = call(
+            "cli",
+            {"argv": argv, "cwd": os.getcwd(), "version": __version__},
+            path=path,
+        )
+    except (OSError, ValueError, DaemonError):
+        # Stale socket, daemon shutting down or version mismatch
+        return None
+
+    sys.stdout.write(result.get("stdout", ""))
+    sys.stderr.write(result.get("stderr", ""))
+    sys.stdout.flush()
+    return int(result.get("exit_code", 0))
+
+
+__all__ = [
+    "FORWARDED_OPTIONS",
+    "DaemonError",
+    "call",
+    "forward",
+    "forwardable",
+    "socket_path",
+]
@@ -0,0 +1 @@
+"""CLI subcommand implementations, imported on demand by pantheon.cli."""
@@ -0,0 +1,50 @@
+"""Helpers shared by commands that locate project roots."""
+
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Optional, TextIO
+
+import click
+
+
+def working_dir() -> Path:
+    """Return the directory the command was run from.
+
+    This is the process working directory, except for commands the daemon
+    runs on a client's behalf, where the root context's obj carries the
+    client's "cwd".
+    """
+    ctx = click.get_current_context(silent=True)
+    if ctx is not None:
+        cwd = (ctx.find_root().obj or {}).get("cwd")
+        if cwd is not None:
+            return Path(cwd)
+    return Path.cwd()
+
+
+def iter_roots(
+    roots_file: Optional[TextIO],
+    discover_dir: Optional[Path],
+    roots: Iterable[Path] = (),
+) -> Iterator[Path]:
+    """Yield project roots from arguments, a roots file and/or a discovery walk."""
+    from pantheon.integrations.spec_kit import discover_spec_kit_projects
+
+    yield from roots
+
+    if roots_file is not None:
+        for line in roots_file:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                yield Path(line)
+
+    if discover_dir is not None:
+        yield from discover_spec_kit_projects(discover_dir)
+
+
+def display_path(path: Path, cwd: Path) -> str:
+    """Render path relative to cwd when possible."""
+    try:
+        return str(path.resolve().relative_to(cwd.resolve())) or "."
+    except ValueError:
+        return str(path)
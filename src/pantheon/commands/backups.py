@@ -0,0 +1,158 @@
+"""`pantheon backups`: inspect, prune and pack integration backups."""
+
+from datetime import timedelta
+from pathlib import Path
+from typing import Optional
+
+import click
+
+
+def _parse_age(
+    ctx: click.Context, param: click.Parameter, value: Optional[str]
+) -> Optional[timedelta]:
+    if value is None:
+        return None
+    from pantheon.backups import parse_age
+
+    try:
+        return parse_age(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e)) from e
+
+
+@click.group()
+def backups() -> None:
+    """Inspect, prune and pack integration backups."""
+
+
+@backups.command("list")
+def backups_list() -> None:
+    """List integration backups, newest first.
+
+    Numbers shown here can be passed to 'pantheon rollback --nth'.
+    """
+    from pantheon.backups import list_packed_names
+    from pantheon.integrations.spec_kit import list_backups
+    from pantheon.output import reporter
+
+    out = reporter()
+    cwd = Path.cwd()
+    backup_dirs = list_backups(cwd)
+    packed = set(list_packed_names(cwd))
+    out.result({
+        "backups": [
+            {
+                "number": number,
+                "backup_dir": backup_dir,
+                "packed": backup_dir.name in packed,
+            }
+            for number, backup_dir in enumerate(backup_dirs, start=1)
+        ]
+    })
+
+    if not backup_dirs:
+        out.echo("No backups found.")
+        return
+
+    out.echo("Backups (newest first):\n")
+    for number, backup_dir in enumerate(backup_dirs, start=1):
+        label = " (packed)" if backup_dir.name in packed else ""
+        out.echo(f"  {number:>3}. {backup_dir.relative_to(cwd)}/{label}")
+
+
+@backups.command("prune")
+@click.option(
+    "--keep",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Keep the N most recent backups",
+)
+@click.option(
+    "--older-than",
+    "older_than",
+    callback=_parse_age,
+    default=None,
+    metavar="AGE",
+    help="Delete only backups older than AGE (e.g. 12h, 30d, 2w)",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Show which backups would be deleted",
+)
+def backups_prune(
+    keep: Optional[int], older_than: Optional[timedelta], dry_run: bool
+) -> None:
+    """Delete backups outside a retention policy.
+
+    With both --keep and --older-than, a backup is deleted only if it is
+    outside the newest N and older than AGE. Packed backups are removed
+    from the archive too. Run 'pantheon gc' afterwards to free objects
+    the deleted backups referenced.
+    """
+    if keep is None and older_than is None:
+        raise click.UsageError("Give --keep and/or --older-than")
+
+    from pantheon.backups import prune_backups
+    from pantheon.output import reporter
+
+    out = reporter()
+    result = prune_backups(Path.cwd(), keep, older_than, dry_run=dry_run)
+    out.result({**result, "dry_run": dry_run})
+
+    for name in result["backups_removed"]:
+        out.echo(f"  - {name}/")
+    verb = "Would delete" if dry_run else "Deleted"
+    out.echo(
+        f"🧹 {verb} {len(result['backups_removed'])} backup(s), "
+        f"kept {result['backups_kept']}"
+    )
+
+
+@backups.command("pack")
+@click.option(
+    "--keep",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Leave the N most recent backups as directories",
+)
+@click.option(
+    "--older-than",
+    "older_than",
+    callback=_parse_age,
+    default=None,
+    metavar="AGE",
+    help="Pack only backups older than AGE (e.g. 12h, 30d, 2w)",
+)
+@click.option(
+    "--compression",
+    type=click.Choice(["xz", "gz"]),
+    default=None,
+    help="Archive compression (default: xz, or the existing archive's)",
+)
+def backups_pack(
+    keep: int, older_than: Optional[timedelta], compression: Optional[str]
+) -> None:
+    """Move older backups into one compressed archive.
+
+    Backup directories are replaced by entries in .pantheon/backups.tar.xz
+    (or .tar.gz). Packed backups still appear in 'pantheon backups list'
+    and 'pantheon rollback' restores them transparently.
+    """
+    from pantheon.backups import pack_backups
+    from pantheon.output import reporter
+
+    out = reporter()
+    cwd = Path.cwd()
+    result = pack_backups(cwd, keep, older_than, compression)
+    out.result(result)
+
+    if not result["backups_packed"]:
+        out.echo("Nothing to pack.")
+        return
+
+    archive = result["archive"]
+    where = archive.relative_to(cwd) if archive else "archive"
+    out.echo(f"📦 Packed {len(result['backups_packed'])} backup(s) into {where}")
+    out.echo(f"   {result['packed_total']} backup(s) now packed")
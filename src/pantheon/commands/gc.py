@@ -0,0 +1,26 @@
+"""`pantheon gc`: remove unreferenced backup objects."""
+
+from pathlib import Path
+
+import click
+
+
+@click.command()
+def gc() -> None:
+    """Remove backup objects no longer referenced by any backup.
+
+    Backups share file contents through the object store in .pantheon/objects/.
+    Deleting backup directories leaves their objects behind until gc runs.
+    """
+    from pantheon.backups import gc_objects
+    from pantheon.output import reporter
+
+    out = reporter()
+    result = gc_objects(Path.cwd())
+    out.result(result)
+
+    out.echo(
+        f"🧹 Removed {result['objects_removed']} unreferenced object(s), "
+        f"freed {result['bytes_freed']} bytes"
+    )
+    out.echo(f"   {result['objects_kept']} object(s) still referenced")
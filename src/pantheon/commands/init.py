@@ -0,0 +1,107 @@
+"""`pantheon init`: install agents into a project."""
+
+from pathlib import Path
+
+import click
+
+
+@click.command()
+@click.option(
+    "--auto-integrate",
+    is_flag=True,
+    help="Automatically integrate with Spec Kit if detected (skip prompt)",
+)
+@click.option(
+    "--link-mode",
+    type=click.Choice(["copy", "hardlink", "symlink", "reflink"]),
+    default="copy",
+    show_default=True,
+    help="How to install agent files: independent copy, hardlink or symlink "
+    "to the library file, or copy-on-write clone (falls back to copy)",
+)
+def init(auto_integrate: bool, link_mode: str) -> None:
+    """Initialize Pantheon agents in your project.
+
+    This command:
+    - Creates .claude/agents/ directory
+    - Copies (or links, see --link-mode) DEV agent to your project
+    - Detects Spec Kit and offers integration
+    """
+    from pantheon.install import install_file
+    from pantheon.output import reporter
+
+    out = reporter()
+    cwd = Path.cwd()
+    claude_dir = cwd / ".claude"
+    agents_dir = claude_dir / "agents"
+
+    # Step 1: Ensure .claude/ directory exists
+    if not claude_dir.exists():
+        claude_dir.mkdir()
+        out.echo(f"✓ Created {claude_dir.relative_to(cwd)}/")
+    else:
+        out.echo(f"✓ Found {claude_dir.relative_to(cwd)}/")
+
+    # Step 2: Ensure .claude/agents/ directory exists
+    if not agents_dir.exists():
+        agents_dir.mkdir()
+        out.echo(f"✓ Created {agents_dir.relative_to(cwd)}/")
+    else:
+        out.echo(f"✓ Found {agents_dir.relative_to(cwd)}/")
+
+    # Step 3: Copy DEV agent
+    package_agents_dir = Path(__file__).parent.parent / "agents"
+    dev_agent_source = package_agents_dir / "dev.md"
+    dev_agent_dest = agents_dir / "dev.md"
+
+    agent_installed = not dev_agent_dest.exists()
+    installed_mode = None
+    if not agent_installed:
+        out.echo(f"⚠ {dev_agent_dest.relative_to(cwd)} already exists (skipping)")
+    else:
+        if dev_agent_dest.is_symlink():
+            # Dangling symlink to a Pantheon install that no longer exists
+            dev_agent_dest.unlink()
+        installed_mode = install_file(dev_agent_source, dev_agent_dest, link_mode)
+        verb = {
+            "copy": "Copied",
+            "hardlink": "Hardlinked",
+            "symlink": "Symlinked",
+            "reflink": "Cloned",
+        }[installed_mode]
+        out.echo(f"✓ {verb} DEV agent to {dev_agent_dest.relative_to(cwd)}")
+        if installed_mode != link_mode:
+            out.echo(f"  ({link_mode} not supported here, copied instead)")
+
+    # Step 4: Detect Spec Kit
+    specify_dir = cwd / ".specify"
+    commands_dir = claude_dir / "commands"
+    spec_kit_detected = specify_dir.exists() and commands_dir.exists()
+    should_integrate = False
+
+    if spec_kit_detected:
+        out.echo("\n🔍 Spec Kit detected!")
+
+        # Structured output never prompts
+        if auto_integrate or out.structured:
+            should_integrate = auto_integrate
+        else:
+            should_integrate = click.confirm(
+                "Would you like to integrate DEV agent with Spec Kit?",
+                default=True
+            )
+
+        if should_integrate:
+            out.echo(
+                "\n💡 Run 'pantheon integrate' to add DEV agent "
+                "integration to Spec Kit commands."
+            )
+
+    out.echo("\n✅ Initialization complete!")
+    out.result({
+        "agent_path": dev_agent_dest,
+        "agent_installed": agent_installed,
+        "link_mode": installed_mode,
+        "spec_kit_detected": spec_kit_detected,
+        "integrate_suggested": should_integrate,
+    })
@@ -0,0 +1,260 @@
+"""`pantheon integrate`: add DEV directives to Spec Kit commands."""
+
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, TextIO
+
+import click
+
+from pantheon.commands._roots import display_path, iter_roots, working_dir
+
+if TYPE_CHECKING:
+    from pantheon.output import Reporter
+
+
+@click.command()
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Preview changes without applying them",
+)
+@click.option(
+    "--diff",
+    "show_diff",
+    is_flag=True,
+    help="With --dry-run, print a unified diff of the changes",
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Ignore the fingerprint cache and re-check every command file",
+)
+@click.option(
+    "--verify-on-disk",
+    is_flag=True,
+    help="Re-read command files from disk to validate after writing",
+)
+@click.option(
+    "--roots",
+    "roots_file",
+    type=click.File("r"),
+    default=None,
+    help="Integrate every project root listed in FILE, one per line ('-' for stdin)",
+)
+@click.option(
+    "--discover",
+    "discover_dir",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    default=None,
+    help="Integrate every Spec Kit project found under DIR",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of parallel workers for --roots/--discover (default: CPU count)",
+)
+@click.option(
+    "--executor",
+    type=click.Choice(["process", "thread"]),
+    default="process",
+    show_default=True,
+    help="Worker pool type for --roots/--discover",
+)
+def integrate(
+    dry_run: bool,
+    show_diff: bool,
+    force: bool,
+    verify_on_disk: bool,
+    roots_file: Optional[TextIO],
+    discover_dir: Optional[Path],
+    jobs: Optional[int],
+    executor: str,
+) -> None:
+    """Integrate DEV agent with Spec Kit commands.
+
+    Adds minimal integration directives to /implement, /plan, and /tasks
+    commands to enable DEV agent delegation.
+
+    With --roots or --discover, integrates many projects in parallel and
+    reports one line per project as each finishes.
+
+    With --dry-run, reads each command file and reports which ones would
+    change (and with --diff, exactly how) without writing anything.
+    """
+    if show_diff and not dry_run:
+        raise click.UsageError("--diff requires --dry-run")
+
+    from pantheon.integrations.spec_kit import integrate_spec_kit
+    from pantheon.output import reporter
+
+    out = reporter()
+    cwd = working_dir()
+
+    if roots_file is not None or discover_dir is not None:
+        _integrate_batch(
+            out,
+            cwd,
+            dry_run,
+            show_diff,
+            force,
+            verify_on_disk,
+            roots_file,
+            discover_dir,
+            jobs,
+            executor,
+        )
+        return
+
+    if dry_run:
+        _preview(out, cwd, force, show_diff)
+        return
+
+    # Run integration
+    out.echo("Integrating DEV agent with Spec Kit...\n")
+
+    result = integrate_spec_kit(cwd, force=force, verify_on_disk=verify_on_disk)
+    out.result(result)
+
+    # Report results
+    if result["success"]:
+        out.echo("✅ Integration successful!\n")
+        if result["backup_dir"]:
+            backup_path = result["backup_dir"].relative_to(cwd)
+            out.echo(f"📦 Backup created: {backup_path}/\n")
+        out.echo("Modified files:")
+        for filename in result["files_modified"]:
+            out.echo(f"  ✓ {filename}")
+
+        out.echo("\n💡 DEV agent is now integrated with Spec Kit")
+        out.echo("   Run /implement to use DEV for task execution")
+    else:
+        out.echo("❌ Integration failed!\n")
+        for error in result["errors"]:
+            out.echo(f"  • {error}")
+
+        if result["backup_dir"]:
+            backup_path = result["backup_dir"].relative_to(cwd)
+            out.echo(f"\n📦 Backup available at: {backup_path}/")
+            out.echo("   Run 'pantheon rollback' to restore")
+
+
+def _preview(out: "Reporter", cwd: Path, force: bool, show_diff: bool) -> None:
+    """Report what integrating cwd would change, without writing."""
+    from pantheon.integrations.spec_kit import preview_spec_kit
+
+    out.echo("🔍 Dry run mode - no changes will be made\n")
+    result = preview_spec_kit(cwd, force=force, diff=show_diff)
+    out.result({"dry_run": True, **result})
+
+    if not result["success"]:
+        out.echo("❌ Integration would fail!\n")
+        for error in result["errors"]:
+            out.echo(f"  • {error}")
+        return
+
+    if not result["would_modify"]:
+        out.echo("✅ Already integrated - nothing would change")
+        return
+
+    out.echo("Would create backup directory")
+    out.echo("Would modify:")
+    for filename in result["would_modify"]:
+        out.echo(f"  - .claude/commands/{filename}")
+    if result["unchanged"]:
+        out.echo("Already integrated:")
+        for filename in result["unchanged"]:
+            out.echo(f"  ✓ .claude/commands/{filename}")
+    if result["diff"]:
+        out.echo()
+        out.echo(result["diff"].rstrip("\n"))
+
+
+def _integrate_batch(
+    out: "Reporter",
+    cwd: Path,
+    dry_run: bool,
+    show_diff: bool,
+    force: bool,
+    verify_on_disk: bool,
+    roots_file: Optional[TextIO],
+    discover_dir: Optional[Path],
+    jobs: Optional[int],
+    executor: str,
+) -> None:
+    """Integrate many project roots, streaming one line per root."""
+    from pantheon.integrations.spec_kit import integrate_spec_kit_batch
+
+    roots = iter_roots(roots_file, discover_dir)
+
+    if dry_run:
+        _preview_batch(out, cwd, roots, show_diff, force, jobs, executor)
+        return
+
+    out.echo("Integrating DEV agent with Spec Kit projects...\n")
+
+    succeeded = 0
+    failed = 0
+    for root, result in integrate_spec_kit_batch(
+        roots,
+        max_workers=jobs,
+        executor=executor,
+        force=force,
+        verify_on_disk=verify_on_disk,
+    ):
+        out.progress("project", project_root=root, result=result)
+        if result["success"]:
+            succeeded += 1
+            out.echo(f"  ✓ {display_path(root, cwd)}")
+        else:
+            failed += 1
+            errors = "; ".join(result["errors"])
+            out.echo(f"  ✗ {display_path(root, cwd)}: {errors}")
+
+    out.echo(f"\n{succeeded} integrated, {failed} failed")
+    out.result({"succeeded": succeeded, "failed": failed})
+    if failed:
+        click.get_current_context().exit(1)
+
+
+def _preview_batch(
+    out: "Reporter",
+    cwd: Path,
+    roots: Iterable[Path],
+    show_diff: bool,
+    force: bool,
+    jobs: Optional[int],
+    executor: str,
+) -> None:
+    """Preview many project roots, streaming one line per root."""
+    from pantheon.integrations.spec_kit import preview_spec_kit_batch
+
+    out.echo("🔍 Dry run mode - no changes will be made\n")
+
+    counts = {"projects": 0, "would_change": 0, "up_to_date": 0, "failed": 0}
+    for root, result in preview_spec_kit_batch(
+        roots, max_workers=jobs, executor=executor, force=force, diff=show_diff
+    ):
+        out.progress("project", project_root=root, dry_run=True, result=result)
+        counts["projects"] += 1
+        where = display_path(root, cwd)
+        if not result["success"]:
+            counts["failed"] += 1
+            out.echo(f"  ✗ {where}: {'; '.join(result['errors'])}")
+        elif result["would_modify"]:
+            counts["would_change"] += 1
+            out.echo(f"  ~ {where}: {', '.join(result['would_modify'])}")
+            if result["diff"]:
+                out.echo(result["diff"].rstrip("\n"))
+        else:
+            counts["up_to_date"] += 1
+            out.echo(f"  = {where}")
+
+    out.echo(
+        f"\n{counts['would_change']} would change, "
+        f"{counts['up_to_date']} up to date, {counts['failed']} would fail"
+    )
+    out.result({"dry_run": True, **counts})
+    if counts["failed"]:
+        click.get_current_context().exit(1)
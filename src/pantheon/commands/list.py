@@ -0,0 +1,38 @@
+"""`pantheon list`: show available agents and their install status."""
+
+from pathlib import Path
+
+import click
+
+
+@click.command()
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    help="Print the agent catalog and install status as JSON",
+)
+def list(as_json: bool) -> None:
+    """List available agents and their installation status.
+
+    Shows agents available in the Pantheon library and indicates
+    which ones are installed locally in .claude/agents/ (or installed
+    but differing from the library version).
+    """
+    from pantheon.catalog import agent_statuses, format_agent_list
+    from pantheon.output import reporter
+
+    out = reporter()
+    cwd = Path.cwd()
+
+    # Agents come from the precomputed catalog; no agent file is parsed
+    agents = agent_statuses(cwd)
+    if as_json:
+        import json
+
+        click.echo(json.dumps({"agents": agents}, indent=2))
+        return
+    out.result({"agents": agents})
+
+    for line in format_agent_list(cwd, agents):
+        out.echo(line)
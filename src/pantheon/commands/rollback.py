@@ -0,0 +1,152 @@
+"""`pantheon rollback`: restore command files from a backup."""
+
+from typing import Optional
+
+import click
+
+from pantheon.commands._roots import working_dir
+
+
+@click.command()
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Skip confirmation prompt",
+)
+@click.option(
+    "--nth",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Restore the N-th most recent backup (see 'pantheon backups list') "
+    "[default: 1]",
+)
+@click.option(
+    "--to",
+    "ref",
+    metavar="ID|AGE",
+    default=None,
+    help="Restore the backup with this ID (or a unique leading part of it), "
+    "or the newest backup at least AGE old (e.g. 2d)",
+)
+@click.option(
+    "--file",
+    "files",
+    metavar="NAME",
+    multiple=True,
+    help="Only restore this command file (e.g. plan.md); repeatable",
+)
+def rollback(
+    force: bool, nth: Optional[int], ref: Optional[str], files: tuple[str, ...]
+) -> None:
+    """Rollback to the most recent backup.
+
+    Restores Spec Kit command files from the most recent integration backup,
+    or an older one with --nth or --to. Files that already match the backup
+    are left untouched.
+    """
+    from pantheon.backups import read_manifest, read_packed_manifest
+    from pantheon.integrations.spec_kit import (
+        find_backup,
+        resolve_backup,
+        rollback_integration,
+    )
+    from pantheon.output import reporter
+
+    out = reporter()
+    if out.structured and not force:
+        raise click.UsageError("--force is required with structured --output")
+    if nth is not None and ref is not None:
+        raise click.UsageError("--nth and --to are mutually exclusive")
+
+    cwd = working_dir()
+
+    # Find backup first to show user what will be restored
+    if ref is not None:
+        try:
+            backup_dir = resolve_backup(ref, cwd)
+        except ValueError as e:
+            raise click.BadParameter(str(e), param_hint="--to") from None
+        missing = f"No backup matches {ref!r}."
+    else:
+        nth = nth or 1
+        backup_dir = find_backup(cwd, nth - 1)
+        if nth == 1:
+            missing = "No backup found. Nothing to rollback."
+        else:
+            missing = f"No backup #{nth} found."
+
+    if not backup_dir:
+        out.echo(f"❌ {missing}")
+        out.result({
+            "success": False,
+            "backup_dir": None,
+            "files_restored": [],
+            "files_unchanged": [],
+            "errors": [missing],
+        })
+        return
+
+    packed = not backup_dir.is_dir()
+    if packed:
+        manifest = read_packed_manifest(cwd, backup_dir.name)
+    else:
+        manifest = read_manifest(backup_dir)
+    if manifest is not None:
+        filenames = sorted(manifest["files"])
+    else:
+        filenames = sorted(p.name for p in backup_dir.glob("*.md"))
+
+    # Refuse unknown names before showing or restoring anything
+    unknown = [f for f in dict.fromkeys(files) if f not in filenames]
+    if unknown:
+        raise click.BadParameter(
+            f"{', '.join(unknown)} not in backup {backup_dir.name}",
+            param_hint="--file",
+        )
+    if files:
+        filenames = [f for f in filenames if f in files]
+
+    # Show what will be restored
+    label = " (packed)" if packed else ""
+    out.echo(f"📦 Found backup: {backup_dir.relative_to(cwd)}/{label}\n")
+    out.echo("Files to restore:")
+    for filename in filenames:
+        out.echo(f"  • {filename}")
+    out.progress(
+        "backup_found", backup_dir=backup_dir, packed=packed, files=filenames
+    )
+
+    # Confirm unless --force
+    if not force:
+        out.echo()
+        if not click.confirm("Restore these files from backup?"):
+            out.echo("Rollback cancelled.")
+            return
+
+    # Perform rollback
+    out.echo("\nRolling back...\n")
+    result = rollback_integration(
+        cwd,
+        (nth or 1) - 1,
+        files=files or None,
+        to=backup_dir.name if ref is not None else None,
+    )
+    out.result(result)
+
+    if result["success"]:
+        out.echo("✅ Rollback successful!\n")
+        if result["files_restored"]:
+            out.echo("Restored files:")
+            for filename in result["files_restored"]:
+                out.echo(f"  ✓ {filename}")
+        if result["files_unchanged"]:
+            out.echo("Already matching the backup:")
+            for filename in result["files_unchanged"]:
+                out.echo(f"  = {filename}")
+        if result["backup_dir"]:
+            backup_path = result["backup_dir"].relative_to(cwd)
+            out.echo(f"\n📦 Backup used: {backup_path}/")
+    else:
+        out.echo("❌ Rollback failed!\n")
+        for error in result["errors"]:
+            out.echo(f"  • {error}")
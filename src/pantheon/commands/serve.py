@@ -0,0 +1,50 @@
+"""`pantheon serve`: run the warm daemon in the foreground."""
+
+from pathlib import Path
+from typing import Optional
+
+import click
+
+
+@click.command()
+@click.option(
+    "--socket",
+    "socket_file",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Unix socket to listen on (default: $PANTHEON_SOCKET, or "
+    "pantheon-<uid>.sock in $XDG_RUNTIME_DIR)",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of requests handled at once (default: thread pool default)",
+)
+def serve(socket_file: Optional[Path], jobs: Optional[int]) -> None:
+    """Serve integrate, rollback and status requests from a warm process.
+
+    Listens for JSON-RPC 2.0 requests, one per line, on a Unix socket.
+    While it runs, 'pantheon integrate', 'pantheon rollback --force' and
+    'pantheon status' forward to it instead of starting up from scratch.
+    Requests for different projects run concurrently; requests for the
+    same project run one at a time. Stop it with Ctrl-C or SIGTERM.
+    """
+    from pantheon import client, daemon
+    from pantheon.output import reporter
+
+    out = reporter()
+    path = str(socket_file) if socket_file is not None else client.socket_path()
+
+    def ready() -> None:
+        out.progress("listening", socket=path)
+        out.echo(f"🔌 Listening on {path}")
+
+    try:
+        daemon.serve(path, max_workers=jobs, ready=ready)
+    except RuntimeError as e:
+        raise click.ClickException(str(e)) from e
+
+    out.result({"socket": path})
+    out.echo("Daemon stopped.")
@@ -0,0 +1,119 @@
+"""`pantheon status`: report the integration state of one or many projects."""
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+import click
+
+from pantheon.commands._roots import working_dir
+
+if TYPE_CHECKING:
+    from pantheon.output import Reporter
+
+
+@click.command()
+@click.option(
+    "--scan",
+    "scan_dir",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    default=None,
+    help="Check every Spec Kit project under DIR, streaming one JSON line each",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of scanner threads for --scan",
+)
+@click.option(
+    "--index",
+    "use_index",
+    is_flag=True,
+    help="With --scan, keep a project index in DIR/.pantheon/ and only "
+    "re-read what changed since the last scan",
+)
+@click.option(
+    "--no-walk",
+    is_flag=True,
+    help="With --scan --index, re-check only projects already in the index",
+)
+def status(
+    scan_dir: Optional[Path], jobs: Optional[int], use_index: bool, no_walk: bool
+) -> None:
+    """Show whether the DEV agent is installed and integrated.
+
+    With --scan, walks DIR (pruning VCS, dependency and virtualenv
+    directories), checks every Spec Kit project found, and prints one
+    NDJSON record per project as soon as it is checked.
+    """
+    if no_walk and not use_index:
+        raise click.UsageError("--no-walk requires --index")
+    if use_index and scan_dir is None:
+        raise click.UsageError("--index requires --scan DIR")
+
+    from pantheon.output import reporter
+
+    out = reporter()
+
+    if scan_dir is not None:
+        _scan(out, scan_dir, jobs, use_index, not no_walk)
+        return
+
+    from pantheon.integrations.spec_kit import verify_spec_kit
+    from pantheon.scan import check_project
+
+    cwd = working_dir()
+    if not verify_spec_kit(cwd):
+        out.echo("❌ Spec Kit not detected (.specify/ and .claude/commands/)")
+        out.result({"project_root": cwd, "spec_kit_detected": False})
+        return
+
+    record = check_project(cwd)
+    out.result({**record, "spec_kit_detected": True})
+    agent = "✓ installed" if record["agents_installed"] else "✗ not installed"
+    out.echo(f"DEV agent:   {agent}")
+    if record["integrated"]:
+        out.echo("Integration: ✓ integrated")
+    else:
+        out.echo("Integration: ✗ not integrated")
+        for error in record["validation"]["errors"]:
+            out.echo(f"  • {error}")
+
+
+def _scan(
+    out: "Reporter",
+    scan_dir: Path,
+    jobs: Optional[int],
+    use_index: bool,
+    walk: bool,
+) -> None:
+    """Stream one record per project found under scan_dir.
+
+    In text mode each record is printed as a bare NDJSON line; structured
+    output modes report each record as a "project" progress event instead.
+    """
+    import json
+
+    from pantheon.output import to_jsonable
+    from pantheon.scan import ScanRecord, scan_projects
+
+    counts = {"projects": 0, "integrated": 0}
+
+    def emit(record: ScanRecord) -> None:
+        counts["projects"] += 1
+        counts["integrated"] += record["integrated"]
+        out.progress("project", **record)
+        out.echo(json.dumps(to_jsonable(record)))
+
+    if not use_index:
+        for record in scan_projects(scan_dir, max_workers=jobs):
+            emit(record)
+    else:
+        from pantheon.project_index import ProjectIndex
+
+        with ProjectIndex(scan_dir) as index:
+            for record in index.refresh(walk=walk, max_workers=jobs):
+                emit(record)
+
+    out.result(counts)
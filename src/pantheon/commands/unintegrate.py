@@ -0,0 +1,118 @@
+"""`pantheon unintegrate`: remove DEV directives from Spec Kit commands."""
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, TextIO
+
+import click
+
+from pantheon.commands._roots import display_path, iter_roots, working_dir
+
+if TYPE_CHECKING:
+    from pantheon.output import Reporter
+
+
+@click.command()
+@click.option(
+    "--roots",
+    "roots_file",
+    type=click.File("r"),
+    default=None,
+    help="Unintegrate every project root listed in FILE, one per line "
+    "('-' for stdin)",
+)
+@click.option(
+    "--discover",
+    "discover_dir",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    default=None,
+    help="Unintegrate every Spec Kit project found under DIR",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of parallel workers for --roots/--discover (default: CPU count)",
+)
+@click.option(
+    "--executor",
+    type=click.Choice(["process", "thread"]),
+    default="process",
+    show_default=True,
+    help="Worker pool type for --roots/--discover",
+)
+def unintegrate(
+    roots_file: Optional[TextIO],
+    discover_dir: Optional[Path],
+    jobs: Optional[int],
+    executor: str,
+) -> None:
+    """Remove DEV agent directives from Spec Kit commands.
+
+    Strips the directives 'pantheon integrate' added to /implement, /plan
+    and /tasks in place, keeping any other edits. No backup is needed or
+    made.
+
+    With --roots or --discover, unintegrates many projects in parallel and
+    reports one line per project as each finishes.
+    """
+    from pantheon.integrations.spec_kit import unintegrate_spec_kit
+    from pantheon.output import reporter
+
+    out = reporter()
+    cwd = working_dir()
+
+    if roots_file is not None or discover_dir is not None:
+        _unintegrate_batch(out, cwd, roots_file, discover_dir, jobs, executor)
+        return
+
+    out.echo("Removing DEV agent directives from Spec Kit...\n")
+
+    result = unintegrate_spec_kit(cwd)
+    out.result(result)
+
+    if result["success"]:
+        if result["files_modified"]:
+            out.echo("✅ Unintegration successful!\n")
+            out.echo("Modified files:")
+            for filename in result["files_modified"]:
+                out.echo(f"  ✓ {filename}")
+        else:
+            out.echo("✅ Not integrated - nothing to remove")
+    else:
+        out.echo("❌ Unintegration failed!\n")
+        for error in result["errors"]:
+            out.echo(f"  • {error}")
+
+
+def _unintegrate_batch(
+    out: "Reporter",
+    cwd: Path,
+    roots_file: Optional[TextIO],
+    discover_dir: Optional[Path],
+    jobs: Optional[int],
+    executor: str,
+) -> None:
+    """Unintegrate many project roots, streaming one line per root."""
+    from pantheon.integrations.spec_kit import unintegrate_spec_kit_batch
+
+    out.echo("Removing DEV agent directives from Spec Kit projects...\n")
+
+    succeeded = 0
+    failed = 0
+    for root, result in unintegrate_spec_kit_batch(
+        iter_roots(roots_file, discover_dir), max_workers=jobs, executor=executor
+    ):
+        out.progress("project", project_root=root, result=result)
+        if result["success"]:
+            succeeded += 1
+            out.echo(f"  ✓ {display_path(root, cwd)}")
+        else:
+            failed += 1
+            errors = "; ".join(result["errors"])
+            out.echo(f"  ✗ {display_path(root, cwd)}: {errors}")
+
+    out.echo(f"\n{succeeded} unintegrated, {failed} failed")
+    out.result({"succeeded": succeeded, "failed": failed})
+    if failed:
+        click.get_current_context().exit(1)
@@ -0,0 +1,124 @@
+"""`pantheon upgrade`: bring DEV directives in Spec Kit commands up to date."""
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, TextIO
+
+import click
+
+from pantheon.commands._roots import display_path, iter_roots, working_dir
+
+if TYPE_CHECKING:
+    from pantheon.output import Reporter
+
+
+@click.command()
+@click.option(
+    "--roots",
+    "roots_file",
+    type=click.File("r"),
+    default=None,
+    help="Upgrade every project root listed in FILE, one per line ('-' for stdin)",
+)
+@click.option(
+    "--discover",
+    "discover_dir",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    default=None,
+    help="Upgrade every Spec Kit project found under DIR",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of parallel workers for --roots/--discover (default: CPU count)",
+)
+@click.option(
+    "--executor",
+    type=click.Choice(["process", "thread"]),
+    default="process",
+    show_default=True,
+    help="Worker pool type for --roots/--discover",
+)
+def upgrade(
+    roots_file: Optional[TextIO],
+    discover_dir: Optional[Path],
+    jobs: Optional[int],
+    executor: str,
+) -> None:
+    """Replace outdated DEV directives with the current ones.
+
+    Rewrites the directives an older Pantheon release added to /implement,
+    /plan and /tasks in place, keeping any other edits. Up-to-date files
+    are recognized from their first few hundred bytes and left alone.
+
+    With --roots or --discover, upgrades many projects in parallel and
+    reports one line per project as each finishes.
+    """
+    from pantheon.integrations.spec_kit import upgrade_spec_kit
+    from pantheon.output import reporter
+
+    out = reporter()
+    cwd = working_dir()
+
+    if roots_file is not None or discover_dir is not None:
+        _upgrade_batch(out, cwd, roots_file, discover_dir, jobs, executor)
+        return
+
+    out.echo("Upgrading DEV agent directives...\n")
+
+    result = upgrade_spec_kit(cwd)
+    out.result(result)
+
+    if result["success"]:
+        if result["files_upgraded"]:
+            out.echo("✅ Upgrade successful!\n")
+            out.echo("Upgraded files:")
+            for filename in result["files_upgraded"]:
+                out.echo(f"  ✓ {filename}")
+        else:
+            out.echo("✅ Already up to date - nothing to upgrade")
+    else:
+        out.echo("❌ Upgrade failed!\n")
+        for error in result["errors"]:
+            out.echo(f"  • {error}")
+        if result["files_upgraded"]:
+            out.echo(f"\nUpgraded anyway: {', '.join(result['files_upgraded'])}")
+
+
+def _upgrade_batch(
+    out: "Reporter",
+    cwd: Path,
+    roots_file: Optional[TextIO],
+    discover_dir: Optional[Path],
+    jobs: Optional[int],
+    executor: str,
+) -> None:
+    """Upgrade many project roots, streaming one line per root."""
+    from pantheon.integrations.spec_kit import upgrade_spec_kit_batch
+
+    out.echo("Upgrading DEV agent directives in Spec Kit projects...\n")
+
+    counts = {"upgraded": 0, "up_to_date": 0, "failed": 0}
+    for root, result in upgrade_spec_kit_batch(
+        iter_roots(roots_file, discover_dir), max_workers=jobs, executor=executor
+    ):
+        out.progress("project", project_root=root, result=result)
+        where = display_path(root, cwd)
+        if not result["success"]:
+            counts["failed"] += 1
+            out.echo(f"  ✗ {where}: {'; '.join(result['errors'])}")
+        elif result["files_upgraded"]:
+            counts["upgraded"] += 1
+            out.echo(f"  ✓ {where}: {', '.join(result['files_upgraded'])}")
+        else:
+            counts["up_to_date"] += 1
+            out.echo(f"  = {where}")
+
+    out.echo(
+        f"\n{counts['upgraded']} upgraded, {counts['up_to_date']} up to date, "
+        f"{counts['failed']} failed"
+    )
+    out.result(counts)
+    if counts["failed"]:
+        click.get_current_context().exit(1)
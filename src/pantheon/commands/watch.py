@@ -0,0 +1,112 @@
+"""`pantheon watch`: re-apply directives when command files are overwritten."""
+
+from pathlib import Path
+from typing import Optional, TextIO
+
+import click
+
+from pantheon.commands._roots import display_path, iter_roots
+
+
+@click.command()
+@click.argument(
+    "project_roots",
+    nargs=-1,
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+)
+@click.option(
+    "--roots",
+    "roots_file",
+    type=click.File("r"),
+    default=None,
+    help="Also watch every project root listed in FILE, one per line",
+)
+@click.option(
+    "--discover",
+    "discover_dir",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    default=None,
+    help="Also watch every Spec Kit project found under DIR",
+)
+@click.option(
+    "--debounce",
+    type=click.FloatRange(min=0),
+    default=50,
+    show_default=True,
+    help="Milliseconds to wait for a burst of changes to settle",
+)
+@click.option(
+    "--poll",
+    is_flag=True,
+    help="Poll for changes instead of using inotify",
+)
+@click.option(
+    "--interval",
+    type=click.FloatRange(min=0.01),
+    default=1.0,
+    show_default=True,
+    help="Seconds between scans when polling",
+)
+def watch(
+    project_roots: tuple[Path, ...],
+    roots_file: Optional[TextIO],
+    discover_dir: Optional[Path],
+    debounce: float,
+    poll: bool,
+    interval: float,
+) -> None:
+    """Keep DEV directives in place while Spec Kit rewrites command files.
+
+    Watches .claude/commands/ in each project (the current directory if none
+    are given) and re-inserts the integration directive into any command
+    file that is overwritten without it. Runs until interrupted.
+    """
+    from pantheon.integrations.spec_kit import SpecKitProject
+    from pantheon.output import reporter
+    from pantheon.watch import watch_projects
+
+    out = reporter()
+    cwd = Path.cwd()
+    candidates = [*iter_roots(roots_file, discover_dir, project_roots)]
+    if not candidates:
+        candidates = [cwd]
+
+    roots = []
+    for root in candidates:
+        project = SpecKitProject(root)
+        if not project.agents_installed or not project.spec_kit_detected:
+            out.echo(f"⚠ {display_path(root, cwd)}: not integrable (skipping)")
+            out.progress("skipped", project_root=root, reason="not integrable")
+        else:
+            roots.append(root)
+
+    if not roots:
+        out.echo("❌ No integrable Spec Kit projects to watch.")
+        out.result({"watched": 0, "repaired": 0, "errors": 0})
+        return
+
+    mode = "Polling" if poll else "Watching"
+    out.echo(f"👀 {mode} {len(roots)} project(s). Press Ctrl+C to stop.\n")
+    out.progress("watching", project_roots=roots, backend="poll" if poll else "auto")
+
+    repaired = 0
+    errors = 0
+    try:
+        for event in watch_projects(
+            roots,
+            debounce=debounce / 1000,
+            backend="poll" if poll else "auto",
+            poll_interval=interval,
+        ):
+            where = display_path(event["project_root"], cwd)
+            if event["error"]:
+                errors += 1
+                out.echo(f"  ✗ {where}: {event['filename']}: {event['error']}")
+            elif event["changed"]:
+                repaired += 1
+                out.echo(f"  ✓ {where}: re-applied directive to {event['filename']}")
+            if event["error"] or event["changed"]:
+                out.progress("repair", **event)
+    except KeyboardInterrupt:
+        out.echo("\nStopped watching.")
+    out.result({"watched": len(roots), "repaired": repaired, "errors": errors})
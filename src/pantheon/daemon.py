@@ -0,0 +1,387 @@
+"""`pantheon serve`: a warm daemon answering JSON-RPC over a Unix socket.
+
+Each connection sends JSON-RPC 2.0 requests, one object per line, and gets
+one response line per request. Methods:
+
+- "integrate" {project_root, force?, verify_on_disk?} -> IntegrationResult
+- "validate" {project_root, window?} -> ValidationResult
+- "rollback" {project_root, n?, to?, files?} -> RollbackResult
+- "status" {project_root} -> ScanRecord
+- "unintegrate" {project_root} -> UnintegrationResult
+- "upgrade" {project_root} -> UpgradeResult
+- "cli" {argv, cwd, version} -> {exit_code, stdout, stderr}, used by
+  pantheon.client to run a command line transparently
+- "ping" -> {version, pid}
+- "shutdown" -> null, then the daemon exits
+
+Requests run on a thread pool, so different projects are served
+concurrently; requests for the same project root are serialized.
+"""
+
+import asyncio
+import io
+import json
+import os
+import signal
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from pantheon import __version__
+from pantheon.client import FORWARDED_OPTIONS, forwardable
+from pantheon.integrations.spec_kit import SpecKitProject
+from pantheon.output import to_jsonable
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+VERSION_MISMATCH = -32000
+
+# Longest accepted request line
+_MAX_LINE = 1024 * 1024
+
+
+class RpcError(Exception):
+    """Raised by a method handler to return a JSON-RPC error."""
+
+    def __init__(self, code: int, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+
+
+def _project_root(params: dict[str, Any]) -> Path:
+    root = params.get("project_root")
+    if not isinstance(root, str) or not os.path.isabs(root):
+        raise RpcError(INVALID_PARAMS, "project_root must be an absolute path")
+    return Path(root)
+
+
+def _integrate(params: dict[str, Any]) -> Any:
+    project = SpecKitProject(_project_root(params))
+    return project.integrate(
+        force=bool(params.get("force", False)),
+        verify_on_disk=bool(params.get("verify_on_disk", False)),
+    )
+
+
+def _validate(params: dict[str, Any]) -> Any:
+    window = params.get("window")
+    if window is not None and (not isinstance(window, int) or window < 1):
+        raise RpcError(INVALID_PARAMS, "window must be a positive integer")
+    return SpecKitProject(_project_root(params)).validate(window=window)
+
+
+def _rollback(params: dict[str, Any]) -> Any:
+    n = params.get("n", 0)
+    if not isinstance(n, int) or n < 0:
+        raise RpcError(INVALID_PARAMS, "n must be a non-negative integer")
+    to = params.get("to")
+    if to is not None and not isinstance(to, str):
+        raise RpcError(INVALID_PARAMS, "to must be a string")
+    files = params.get("files")
+    if files is not None and (
+        not isinstance(files, list) or not all(isinstance(f, str) for f in files)
+    ):
+        raise RpcError(INVALID_PARAMS, "files must be a list of strings")
+    return SpecKitProject(_project_root(params)).rollback(n, files=files, to=to)
+
+
+def _status(params: dict[str, Any]) -> Any:
+    from pantheon.scan import check_project
+
+    return check_project(_project_root(params))
+
+
+def _unintegrate(params: dict[str, Any]) -> Any:
+    return SpecKitProject(_project_root(params)).unintegrate()
+
+
+def _upgrade(params: dict[str, Any]) -> Any:
+    return SpecKitProject(_project_root(params)).upgrade()
+
+
+def _cli(params: dict[str, Any]) -> Any:
+    """Run a forwarded command line with output captured."""
+    import click
+
+    from pantheon.cli import main
+
+    argv = params.get("argv")
+    cwd = params.get("cwd")
+    if params.get("version") != __version__:
+        raise RpcError(VERSION_MISMATCH, f"Daemon runs pantheon {__version__}")
+    if (
+        not isinstance(argv, list)
+        or not all(isinstance(arg, str) for arg in argv)
+        or not isinstance(cwd, str)
+        or not os.path.isabs(cwd)
+    ):
+        raise RpcError(INVALID_PARAMS, "argv must be a list and cwd absolute")
+    if not forwardable(argv):
+        raise RpcError(INVALID_PARAMS, f"Not a forwardable command: {argv}")
+
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    exit_code = 0
+    try:
+        returned = main.main(
+            args=argv,
+            prog_name="pantheon",
+            obj={"cwd": Path(cwd), "stream": stdout},
+            standalone_mode=False,
+        )
+        if isinstance(returned, int):
+            exit_code = returned
+    except click.ClickException as e:
+        e.show(file=stderr)
+        exit_code = e.exit_code
+    except click.Abort:
+        stderr.write("Aborted!\n")
+        exit_code = 1
+    except Exception:
+        stderr.write(traceback.format_exc())
+        exit_code = 1
+    return {
+        "exit_code": exit_code,
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+    }
+
+
+def _cli_root(params: dict[str, Any]) -> Optional[str]:
+    cwd = params.get("cwd")
+    return cwd if isinstance(cwd, str) else None
+
+
+# Method name -> (handler, function returning the project root to lock on)
+METHODS: dict[
+    str,
+    tuple[Callable[[dict[str, Any]], Any], Callable[[dict[str, Any]], Optional[str]]],
+] = {
+    "integrate": (_integrate, lambda p: p.get("project_root")),
+    "validate": (_validate, lambda p: p.get("project_root")),
+    "rollback": (_rollback, lambda p: p.get("project_root")),
+    "status": (_status, lambda p: p.get("project_root")),
+    "unintegrate": (_unintegrate, lambda p: p.get("project_root")),
+    "upgrade": (_upgrade, lambda p: p.get("project_root")),
+    "cli": (_cli, _cli_root),
+}
+
+
+class Daemon:
+    """Serve JSON-RPC requests on a Unix socket until stopped."""
+
+    def __init__(self, path: str, max_workers: Optional[int] = None) -> None:
+        """Prepare a daemon listening at path.
+
+        Args:
+            path: Unix socket path.
+            max_workers: Threads running requests. Defaults to the thread
+                pool default.
+        """
+        self.path = path
+        self.max_workers = max_workers
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._stopped: Optional[asyncio.Event] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._connections: dict[asyncio.Task[None], asyncio.StreamWriter] = {}
+        self._busy: set[asyncio.Task[None]] = set()
+
+    def _lock(self, root: Optional[str]) -> Optional[asyncio.Lock]:
+        if root is None:
+            return None
+        key = os.path.realpath(root)
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        return lock
+
+    async def dispatch(self, request: Any) -> Optional[dict[str, Any]]:
+        """Run one JSON-RPC request and build its response.
+
+        Returns:
+            The response object, or None for a notification (no id).
+        """
+        if not isinstance(request, dict) or not isinstance(
+            request.get("method"), str
+        ):
+            return _error(None, INVALID_REQUEST, "Invalid request")
+
+        request_id = request.get("id")
+        method = request["method"]
+        params = request.get("params", {})
+        if not isinstance(params, dict):
+            return _error(request_id, INVALID_PARAMS, "params must be an object")
+
+        try:
+            if method == "ping":
+                result: Any = {"version": __version__, "pid": os.getpid()}
+            elif method == "shutdown":
+                self.stop()
+                result = None
+            elif method in METHODS:
+                handler, root_of = METHODS[method]
+                loop = asyncio.get_running_loop()
+                lock = self._lock(root_of(params))
+                if lock is None:
+                    result = await loop.run_in_executor(self._pool, handler, params)
+                else:
+                    async with lock:
+                        result = await loop.run_in_executor(
+                            self._pool, handler, params
+                        )
+            else:
+                return _error(request_id, METHOD_NOT_FOUND, f"Unknown method: {method}")
+        except RpcError as e:
+            return _error(request_id, e.code, str(e))
+
+        if request_id is None:
+            return None
+        return {"jsonrpc": "2.0", "id": request_id, "result": to_jsonable(result)}
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        task = asyncio.current_task()
+        if task is not None:
+            self._connections[task] = writer
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    break  # Line longer than the limit
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    response: Optional[dict[str, Any]] = _error(
+                        None, PARSE_ERROR, "Parse error"
+                    )
+                else:
+                    if task is not None:
+                        self._busy.add(task)
+                    try:
+                        response = await self.dispatch(request)
+                    finally:
+                        self._busy.discard(task)
+                if response is not None:
+                    writer.write(json.dumps(response).encode() + b"\n")
+                    await writer.drain()
+                if self._stopped is not None and self._stopped.is_set():
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            if task is not None:
+                self._connections.pop(task, None)
+            writer.close()
+
+    def stop(self) -> None:
+        """Ask a running daemon to exit after the current requests."""
+        if self._stopped is not None:
+            self._stopped.set()
+
+    async def serve(self, ready: Optional[Callable[[], None]] = None) -> None:
+        """Listen until stop() is called, SIGTERM or SIGINT.
+
+        Args:
+            ready: Called once the socket is accepting connections.
+
+        Raises:
+            RuntimeError: If another daemon is already listening at path.
+        """
+        _claim_socket(self.path)
+        self._stopped = asyncio.Event()
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        # Only the owner may connect
+        old_umask = os.umask(0o177)
+        try:
+            server = await asyncio.start_unix_server(
+                self._handle, path=self.path, limit=_MAX_LINE
+            )
+        finally:
+            os.umask(old_umask)
+
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(signum, self.stop)
+            except (NotImplementedError, RuntimeError):
+                pass  # Not the main thread
+
+        try:
+            async with server:
+                if ready is not None:
+                    ready()
+                await self._stopped.wait()
+                server.close()
+                # End idle connections; busy ones close after answering
+                for task, writer in list(self._connections.items()):
+                    if task not in self._busy:
+                        writer.close()
+                if self._connections:
+                    await asyncio.gather(
+                        *self._connections, return_exceptions=True
+                    )
+        finally:
+            for signum in (signal.SIGTERM, signal.SIGINT):
+                try:
+                    loop.remove_signal_handler(signum)
+                except (NotImplementedError, RuntimeError):
+                    pass
+            self._pool.shutdown(wait=True)
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+
+
+def _error(request_id: Any, code: int, message: str) -> dict[str, Any]:
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "error": {"code": code, "message": message},
+    }
+
+
+def _claim_socket(path: str) -> None:
+    """Remove a stale socket left by a daemon that died.
+
+    Raises:
+        RuntimeError: If a daemon is still listening at path.
+    """
+    import socket
+
+    if not os.path.exists(path):
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(path)
+        except OSError:
+            os.unlink(path)
+            return
+    raise RuntimeError(f"A daemon is already listening on {path}")
+
+
+def serve(
+    path: str,
+    max_workers: Optional[int] = None,
+    ready: Optional[Callable[[], None]] = None,
+) -> None:
+    """Run a daemon in the foreground until it is stopped.
+
+    Args:
+        path: Unix socket path.
+        max_workers: Threads running requests.
+        ready: Called once the socket is accepting connections.
+    """
+    asyncio.run(Daemon(path, max_workers).serve(ready))
+
+
+__all__ = ["FORWARDED_OPTIONS", "METHODS", "Daemon", "RpcError", "serve"]
@@ -0,0 +1,177 @@
+"""Persisted fingerprints of Spec Kit command files for incremental integrate."""
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional, TypedDict
+
+from pantheon.backups import hash_file
+
+# State file kept next to the command files it describes
+STATE_FILE = ".pantheon-state.json"
+STATE_VERSION = 1
+
+# Files modified this close to the state being saved may change again
+# without their mtime moving, so their content hash is checked instead
+RACY_WINDOW_NS = 2_000_000_000
+
+
+class FileFingerprint(TypedDict):
+    """Type for a recorded command file fingerprint."""
+
+    size: int
+    mtime_ns: int
+    sha256: str
+    integrated: bool
+
+
+class IntegrationState(TypedDict):
+    """Type for the persisted integration state."""
+
+    version: int
+    directives: str
+    saved_ns: int
+    files: dict[str, FileFingerprint]
+
+
+def state_path(project_root: Path) -> Path:
+    """Return the path of the integration state file."""
+    return project_root / ".claude" / STATE_FILE
+
+
+def fingerprint(
+    path: Path, integrated: bool, sha256: Optional[str] = None
+) -> FileFingerprint:
+    """Fingerprint a file as it is on disk now.
+
+    Args:
+        path: File to fingerprint.
+        integrated: Whether the file carries its integration directive.
+        sha256: Content digest if already known (e.g. computed while the
+            file was written); otherwise the file is read and hashed.
+
+    Returns:
+        The file's size, mtime, content hash and integration status.
+    """
+    st = path.stat()
+    return {
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+        "sha256": sha256 if sha256 is not None else hash_file(path),
+        "integrated": integrated,
+    }
+
+
+def load_state(project_root: Path) -> Optional[IntegrationState]:
+    """Load the integration state file.
+
+    Args:
+        project_root: Root directory of the project.
+
+    Returns:
+        The saved state, or None if missing, unreadable or from another version.
+    """
+    try:
+        data = json.loads(state_path(project_root).read_text())
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(data, dict) or data.get("version") != STATE_VERSION:
+        return None
+
+    try:
+        state: IntegrationState = {
+            "version": STATE_VERSION,
+            "directives": str(data["directives"]),
+            "saved_ns": int(data["saved_ns"]),
+            "files": {
+                str(name): {
+                    "size": int(fp["size"]),
+                    "mtime_ns": int(fp["mtime_ns"]),
+                    "sha256": str(fp["sha256"]),
+                    "integrated": bool(fp["integrated"]),
+                }
+                for name, fp in data["files"].items()
+            },
+        }
+    except (KeyError, TypeError, ValueError, AttributeError):
+        return None
+
+    return state
+
+
+def save_state(
+    project_root: Path, directives: str, files: dict[str, FileFingerprint]
+) -> None:
+    """Atomically write the integration state file.
+
+    Args:
+        project_root: Root directory of the project.
+        directives: Digest of the directive registry the files were checked against.
+        files: Fingerprint of each command file, keyed by filename.
+    """
+    state: IntegrationState = {
+        "version": STATE_VERSION,
+        "directives": directives,
+        "saved_ns": time.time_ns(),
+        "files": files,
+    }
+
+    path = state_path(project_root)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{STATE_FILE}.")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(state, f, indent=2)
+            f.write("\n")
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def clear_state(project_root: Path) -> None:
+    """Remove the integration state file, forcing the next run to re-check."""
+    try:
+        state_path(project_root).unlink()
+    except FileNotFoundError:
+        pass
+
+
+def is_racy(recorded: FileFingerprint, saved_ns: int) -> bool:
+    """Whether a fingerprint was saved too soon after its file was modified.
+
+    is_unchanged() hashes such files instead of trusting their stat(). Saving
+    the state again once the file is confirmed unchanged (with a later
+    saved_ns) makes the fingerprint trustworthy from then on.
+    """
+    return saved_ns - recorded["mtime_ns"] <= RACY_WINDOW_NS
+
+
+def is_unchanged(path: Path, recorded: FileFingerprint, saved_ns: int) -> bool:
+    """Check whether a file still matches its recorded fingerprint.
+
+    Costs a single stat() unless the file was modified within the racy
+    window before the state was saved, in which case its content is hashed.
+
+    Args:
+        path: File to check.
+        recorded: Fingerprint recorded for the file.
+        saved_ns: When the fingerprint was saved (time.time_ns()).
+
+    Returns:
+        True if the file is unchanged since the fingerprint was taken.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return False
+
+    if st.st_size != recorded["size"] or st.st_mtime_ns != recorded["mtime_ns"]:
+        return False
+
+    if not is_racy(recorded, saved_ns):
+        return True
+
+    return hash_file(path) == recorded["sha256"]
@@ -0,0 +1,97 @@
+"""Install agent files into projects by copy, hardlink, symlink or reflink.
+
+"copy" writes an independent file. The other modes avoid duplicating the
+agent's bytes in every project:
+
+- "hardlink" shares the library file's inode; editing either edits both.
+- "symlink" points at the library file, so upgrading Pantheon upgrades
+  every project at once.
+- "reflink" makes a copy-on-write clone (FICLONE), which shares storage
+  on Btrfs, XFS and similar but behaves like a copy.
+
+Modes the platform or filesystem cannot provide fall back to a copy;
+install_file() reports the mode that was actually used.
+"""
+
+import os
+import shutil
+import sys
+from pathlib import Path
+
+LINK_MODES = ("copy", "hardlink", "symlink", "reflink")
+
+# ioctl(2) request for FICLONE from <linux/fs.h>
+_FICLONE = 0x40049409
+
+
+def _reflink(source: Path, dest: Path) -> bool:
+    """Clone source to a new file at dest without copying its bytes.
+
+    Returns:
+        True if FICLONE cloned the data, False if the platform or
+        filesystem cannot clone. dest is not left behind when False is
+        returned.
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+
+    import fcntl
+
+    with open(source, "rb") as src, open(dest, "xb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+            return True
+        except OSError:
+            pass
+
+    dest.unlink()
+    return False
+
+
+def install_file(source: Path, dest: Path, mode: str = "copy") -> str:
+    """Install source at dest using the given link mode.
+
+    Args:
+        source: Library file to install.
+        dest: Path to create. Must not already exist.
+        mode: One of LINK_MODES.
+
+    Returns:
+        The mode actually used: the requested one, or "copy" when the
+        platform or filesystem does not support it (e.g. a hardlink across
+        filesystems).
+
+    Raises:
+        ValueError: If mode is not one of LINK_MODES.
+        FileExistsError: If dest already exists.
+    """
+    if mode not in LINK_MODES:
+        raise ValueError(f"Unknown link mode: {mode}")
+    if os.path.lexists(dest):
+        raise FileExistsError(f"{dest} already exists")
+
+    if mode == "hardlink":
+        try:
+            os.link(source, dest)
+            return mode
+        except OSError:
+            pass
+    elif mode == "symlink":
+        try:
+            os.symlink(source.resolve(), dest)
+            return mode
+        except OSError:
+            pass
+    elif mode == "reflink":
+        try:
+            if _reflink(source, dest):
+                shutil.copystat(source, dest)
+                return mode
+        except FileExistsError:
+            raise
+        except OSError:
+            if os.path.lexists(dest):
+                dest.unlink()
+
+    shutil.copy2(source, dest)
+    return "copy"
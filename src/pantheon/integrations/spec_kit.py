@@ -1,9 +1,23 @@
 """Spec Kit integration utilities."""
 
+import difflib
+import functools
+import hashlib
+import os
+import re
 import shutil
-from datetime import datetime
+import tempfile
+import time
+from collections.abc import Container, Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, TypedDict
+from typing import BinaryIO, Callable, NamedTuple, Optional, TypedDict, TypeVar
+
+from pantheon import backups, fingerprints, journal, locking, trace
+from pantheon.markers import find_markers
+from pantheon.pool import imap_unordered
+
+R = TypeVar("R")
 
 
 class ValidationResult(TypedDict):
@@ -29,6 +43,7 @@ class RestoreResult(TypedDict):
 
     success: bool
     files_restored: list[str]
+    files_unchanged: list[str]
     errors: list[str]
 
 
@@ -38,6 +53,34 @@ class RollbackResult(TypedDict):
     success: bool
     backup_dir: Optional[Path]
     files_restored: list[str]
+    files_unchanged: list[str]
+    errors: list[str]
+
+
+class PreviewResult(TypedDict):
+    """Type for integration preview (dry run) result dictionary."""
+
+    success: bool
+    would_modify: list[str]
+    unchanged: list[str]
+    errors: list[str]
+    diff: Optional[str]
+
+
+class UpgradeResult(TypedDict):
+    """Type for directive upgrade result dictionary."""
+
+    success: bool
+    files_upgraded: list[str]
+    up_to_date: list[str]
+    errors: list[str]
+
+
+class UnintegrationResult(TypedDict):
+    """Type for unintegration result dictionary."""
+
+    success: bool
+    files_modified: list[str]
     errors: list[str]
 
 
@@ -50,11 +93,7 @@ def verify_agents_installed(project_root: Optional[Path] = None) -> bool:
     Returns:
         True if DEV agent exists in .claude/agents/, False otherwise.
     """
-    if project_root is None:
-        project_root = Path.cwd()
-
-    dev_agent = project_root / ".claude" / "agents" / "dev.md"
-    return dev_agent.exists()
+    return SpecKitProject(project_root).agents_installed
 
 
 def verify_spec_kit(project_root: Optional[Path] = None) -> bool:
@@ -66,18 +105,17 @@ def verify_spec_kit(project_root: Optional[Path] = None) -> bool:
     Returns:
         True if both .specify/ and .claude/commands/ exist, False otherwise.
     """
-    if project_root is None:
-        project_root = Path.cwd()
-
-    specify_dir = project_root / ".specify"
-    commands_dir = project_root / ".claude" / "commands"
-
-    return specify_dir.exists() and commands_dir.exists()
+    return SpecKitProject(project_root).spec_kit_detected
 
 
 def create_backup(project_root: Optional[Path] = None) -> Path:
     """Create timestamped backup of Spec Kit command files.
 
+    File contents go into the content-addressed object store under
+    .pantheon/objects/ and the backup directory hardlinks them, so content
+    that is already stored costs no additional bytes. A manifest.json in
+    the backup directory records the digest of each file.
+
     Args:
         project_root: Root directory of the project. Defaults to current directory.
 
@@ -87,30 +125,20 @@ def create_backup(project_root: Optional[Path] = None) -> Path:
     Raises:
         FileNotFoundError: If command files don't exist.
     """
-    if project_root is None:
-        project_root = Path.cwd()
+    return SpecKitProject(project_root).create_backup()
 
-    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-    backup_dir = project_root / f".integration-backup-{timestamp}"
-    backup_dir.mkdir(parents=True, exist_ok=True)
 
-    commands_dir = project_root / ".claude" / "commands"
-    files_to_backup = ["implement.md", "plan.md", "tasks.md"]
-
-    for filename in files_to_backup:
-        source = commands_dir / filename
-        if source.exists():
-            dest = backup_dir / filename
-            shutil.copy2(source, dest)
-
-    return backup_dir
-
-
-def validate_integration(project_root: Optional[Path] = None) -> ValidationResult:
+def validate_integration(
+    project_root: Optional[Path] = None, window: Optional[int] = None
+) -> ValidationResult:
     """Validate that integration was successful.
 
     Args:
         project_root: Root directory of the project. Defaults to current directory.
+        window: Only look for each marker in this many leading bytes of its
+            file (e.g. pantheon.markers.HEADER_WINDOW), which is enough for
+            directives inserted after ordinary frontmatter. Defaults to
+            scanning whole files.
 
     Returns:
         Dictionary with validation results:
@@ -120,45 +148,59 @@ def validate_integration(project_root: Optional[Path] = None) -> ValidationResul
             "files_checked": list of filenames
         }
     """
-    if project_root is None:
-        project_root = Path.cwd()
+    return SpecKitProject(project_root).validate(window=window)
 
-    commands_dir = project_root / ".claude" / "commands"
-    results: ValidationResult = {
-        "valid": True,
-        "errors": [],
-        "files_checked": []
-    }
 
-    # Check that command files exist and contain integration sections
-    expected_sections = {
-        "implement.md": "## Agent Integration",
-        "plan.md": "## Quality Standards (Required for DEV Integration)",
-        "tasks.md": "## Task Format (Required for DEV Integration)"
-    }
+def validate_command_file(
+    filepath: Path, section_marker: str, window: Optional[int] = None
+) -> Optional[str]:
+    """Check that one command file exists and contains its integration section.
 
-    for filename, section_marker in expected_sections.items():
-        filepath = commands_dir / filename
-        results["files_checked"].append(filename)
+    Args:
+        filepath: Command file to check.
+        section_marker: Marker line the integrated file must contain.
+        window: Only search this many leading bytes. Defaults to the whole file.
 
-        if not filepath.exists():
-            results["valid"] = False
-            results["errors"].append(f"{filename} not found")
-            continue
+    Returns:
+        None if the file is integrated, otherwise the validation error message.
+    """
+    filename = filepath.name
+    if not filepath.exists():
+        return f"{filename} not found"
 
-        try:
-            content = filepath.read_text()
-            if section_marker not in content:
-                results["valid"] = False
-                error_msg = (
-                    f"{filename} missing integration section: {section_marker}"
-                )
-                results["errors"].append(error_msg)
-        except Exception as e:
-            results["valid"] = False
-            results["errors"].append(f"Error reading {filename}: {str(e)}")
+    try:
+        found = find_markers(filepath, (section_marker,), window)
+    except OSError as e:
+        return f"Error reading {filename}: {str(e)}"
 
-    return results
+    if section_marker not in found:
+        return f"{filename} missing integration section: {section_marker}"
+    return None
+
+
+def locate_markers(
+    project_root: Optional[Path] = None,
+    markers: Optional[dict[str, list[str]]] = None,
+    window: Optional[int] = None,
+) -> dict[str, Optional[dict[str, int]]]:
+    """Find where markers sit in the project's command files.
+
+    Each file is memory-mapped and scanned once for all of its markers
+    (see pantheon.markers).
+
+    Args:
+        project_root: Root directory of the project. Defaults to current directory.
+        markers: Markers to look for, per command filename. Defaults to each
+            registered command file's directive marker.
+        window: Only search this many leading bytes of each file.
+            Defaults to whole files.
+
+    Returns:
+        Dictionary mapping each filename to {marker: byte offset} for the
+        markers found in it, or to None if the file is missing or
+        unreadable.
+    """
+    return SpecKitProject(project_root).locate_markers(markers, window)
 
 
 # Integration directives to be inserted into Spec Kit commands
@@ -220,108 +262,720 @@ Each task should include subtasks as acceptance criteria:
 """
 
 
-def integrate_implement_command(project_root: Optional[Path] = None) -> bool:
-    """Add DEV integration directive to /implement command.
+class CommandDirective(NamedTuple):
+    """Directive inserted into a Spec Kit command file."""
+
+    marker: str
+    text: str
+
+    @property
+    def stamp(self) -> bytes:
+        """Line inserted above the directive, identifying this version of it."""
+        digest = hashlib.sha256(self.text.encode()).hexdigest()
+        return f"<!-- pantheon:directive {digest[:STAMP_DIGEST_LENGTH]} -->\n".encode()
+
+
+# Registry of command files and the directive each one receives. Backup,
+# integration and validation are all driven from this table.
+COMMAND_DIRECTIVES: dict[str, CommandDirective] = {
+    "implement.md": CommandDirective("## Agent Integration", IMPLEMENT_DIRECTIVE),
+    "plan.md": CommandDirective(
+        "## Quality Standards (Required for DEV Integration)", PLAN_DIRECTIVE
+    ),
+    "tasks.md": CommandDirective(
+        "## Task Format (Required for DEV Integration)", TASKS_DIRECTIVE
+    ),
+}
+
+# Hex digits of the directive text's SHA-256 in its stamp line
+STAMP_DIGEST_LENGTH = 12
+_STAMP_LINE = re.compile(rb"^<!-- pantheon:directive [0-9a-f]+ -->\r?\n?$")
+
+# Outcomes of check_directive()
+DIRECTIVE_CURRENT = "current"
+DIRECTIVE_OUTDATED = "outdated"
+DIRECTIVE_MISSING = "missing"
+FILE_NOT_FOUND = "not_found"
+
+# Reasons integrate_spec_kit() fails before touching any file
+AGENT_MISSING_ERROR = "DEV agent not installed. Run 'pantheon init' first."
+SPEC_KIT_MISSING_ERROR = (
+    "Spec Kit not detected. Ensure .specify/ and .claude/commands/ exist."
+)
+
+# Read size used when streaming command files
+_CHUNK_SIZE = 64 * 1024
+
+# Lines of context around the insertion in dry-run diffs
+_DIFF_CONTEXT = 3
+_HUNK_HEADER = re.compile(r"^@@ -(\d+)(,\d+)? \+(\d+)(,\d+)? @@")
+
+
+def register_directive(filename: str, marker: str, text: str) -> None:
+    """Register a directive for a Spec Kit command file.
+
+    Registered commands are backed up, integrated and validated alongside
+    the built-in /implement, /plan and /tasks directives.
 
     Args:
-        project_root: Root directory of the project. Defaults to current directory.
+        filename: Command filename inside .claude/commands/ (e.g. "specify.md").
+        marker: Section heading used to detect an existing integration.
+        text: Directive text to insert after the YAML frontmatter.
+    """
+    COMMAND_DIRECTIVES[filename] = CommandDirective(marker, text)
+
+
+class InsertResult(TypedDict):
+    """Type for the outcome of applying a directive to one command file."""
+
+    exists: bool
+    changed: bool
+    integrated: bool
+    sha256: Optional[str]
+
+
+def _scan_for_marker(stream: BinaryIO, marker: bytes) -> tuple[bool, str]:
+    """Search a binary stream for marker in fixed-size chunks.
 
     Returns:
-        True if integration successful, False otherwise.
+        (whether marker occurs, SHA-256 hex digest of the whole stream).
+    """
+    digest = hashlib.sha256()
+    found = False
+    overlap = len(marker) - 1
+    tail = b""
+    while True:
+        chunk = stream.read(_CHUNK_SIZE)
+        if not chunk:
+            return found, digest.hexdigest()
+        digest.update(chunk)
+        if not found:
+            window = tail + chunk
+            found = marker in window
+            tail = window[-overlap:] if overlap else b""
+
+
+def _frontmatter_end(stream: BinaryIO) -> tuple[int, bool]:
+    """Locate the end of YAML frontmatter at the start of a binary stream.
+
+    Only the frontmatter prefix is read. Malformed frontmatter (no closing
+    ``---``) is treated the same as no frontmatter.
+
+    Returns:
+        (offset just past the closing ``---`` line or 0, whether that line
+        ends with a newline).
     """
-    if project_root is None:
-        project_root = Path.cwd()
+    stream.seek(0)
+    first = stream.readline(_CHUNK_SIZE)
+    if first.strip() != b"---":
+        return 0, True
+
+    at_line_start = first.endswith(b"\n")
+    while True:
+        line = stream.readline(_CHUNK_SIZE)
+        if not line:
+            return 0, True
+        if at_line_start and line.strip() == b"---":
+            return stream.tell(), line.endswith(b"\n")
+        at_line_start = line.endswith(b"\n")
+
+
+def _copy_bytes(
+    source: BinaryIO, dest: BinaryIO, count: int, *digests: "hashlib._Hash"
+) -> None:
+    """Copy count bytes (-1 for the rest) from source to dest, hashing them."""
+    while count != 0:
+        chunk = source.read(_CHUNK_SIZE if count < 0 else min(count, _CHUNK_SIZE))
+        if not chunk:
+            break
+        dest.write(chunk)
+        for digest in digests:
+            digest.update(chunk)
+        if count > 0:
+            count -= len(chunk)
+
+
+def _insertion_point(
+    stream: BinaryIO, directive: CommandDirective
+) -> tuple[int, bytes]:
+    """Work out where and what to insert for a directive.
+
+    Returns:
+        (offset just past the YAML frontmatter or 0, bytes to insert there:
+        the directive's stamp line and text, set off by blank lines).
+    """
+    head_size, head_ends_with_newline = _frontmatter_end(stream)
+    block = directive.stamp + directive.text.encode()
+    if head_size and not head_ends_with_newline:
+        # Closing --- is the last line of the file
+        return head_size, b"\n\n" + block
+    return head_size, b"\n" + block + b"\n"
+
+
+class StagedDirective(NamedTuple):
+    """A directive insertion written to a staging file, not yet in place."""
+
+    result: InsertResult
+    staged: Optional[Path]
+    original_sha256: Optional[str]
+
 
-    filepath = project_root / ".claude" / "commands" / "implement.md"
+def stage_directive(
+    filepath: Path, directive: CommandDirective
+) -> StagedDirective:
+    """Write a command file's content with a directive inserted, beside it.
+
+    The file is streamed into a temporary file in the same directory (so
+    it can be moved into place atomically with os.replace()), which is
+    fsynced before returning. Peak memory is bounded by the chunk size
+    rather than the file size. The digests of the original and the new
+    content are computed along the way, so callers can journal, validate
+    and fingerprint the file without reading it back.
+
+    Args:
+        filepath: Command file to update.
+        directive: Directive to insert.
+
+    Returns:
+        (result, staged, original_sha256): result describes the file as it
+        will be once the staged file is moved into place (see
+        apply_directive()); staged is the staging file, or None if nothing
+        needs to change; original_sha256 is the digest of the current
+        content, or None if the file is missing.
+    """
+    result: InsertResult = {
+        "exists": False,
+        "changed": False,
+        "integrated": False,
+        "sha256": None,
+    }
 
     if not filepath.exists():
-        return False
+        return StagedDirective(result, None, None)
 
-    content = filepath.read_text()
+    result["exists"] = True
 
-    # Check if already integrated
-    if "## Agent Integration" in content:
-        return True  # Already integrated
+    with open(filepath, "rb") as source:
+        # Check if already integrated
+        found, existing_digest = _scan_for_marker(source, directive.marker.encode())
+        if found:
+            result["integrated"] = True
+            result["sha256"] = existing_digest
+            return StagedDirective(result, None, existing_digest)
 
-    # Insert after YAML frontmatter or at beginning if no frontmatter
-    lines = content.split('\n')
-    insert_index = 0
-    in_frontmatter = False
-    frontmatter_end_found = False
+        # Insert after YAML frontmatter or at beginning if no frontmatter
+        head_size, insertion = _insertion_point(source, directive)
 
-    for i, line in enumerate(lines):
-        # Detect start of YAML frontmatter
-        if i == 0 and line.strip() == '---':
-            in_frontmatter = True
-            continue
+        digest = hashlib.sha256()
+        fd, tmp_name = tempfile.mkstemp(
+            dir=filepath.parent, prefix=f".{filepath.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as dest:
+                source.seek(0)
+                _copy_bytes(source, dest, head_size, digest)
+                dest.write(insertion)
+                digest.update(insertion)
+                _copy_bytes(source, dest, -1, digest)
+                dest.flush()
+                os.fsync(dest.fileno())
+            shutil.copymode(filepath, tmp_name)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+    result["changed"] = True
+    result["integrated"] = True
+    result["sha256"] = digest.hexdigest()
+    return StagedDirective(result, Path(tmp_name), existing_digest)
+
+
+def apply_directive(filepath: Path, directive: CommandDirective) -> InsertResult:
+    """Insert a directive after the YAML frontmatter of a command file.
+
+    The new content is staged with stage_directive() and atomically moved
+    into place with os.replace().
 
-        # Detect end of YAML frontmatter
-        if in_frontmatter and line.strip() == '---':
-            insert_index = i + 1
-            frontmatter_end_found = True
-            break
+    Args:
+        filepath: Command file to update.
+        directive: Directive to insert.
 
-    # If no frontmatter found, insert at beginning
-    if not frontmatter_end_found:
-        insert_index = 0
+    Returns:
+        Dictionary describing the file after the call:
+        {
+            "exists": bool,
+            "changed": bool (directive inserted now),
+            "integrated": bool (directive present),
+            "sha256": digest of the final content, or None if missing
+        }
+    """
+    result, staged, _ = stage_directive(filepath, directive)
+    if staged is not None:
+        try:
+            os.replace(staged, filepath)
+        except BaseException:
+            os.unlink(staged)
+            raise
+    return result
 
-    # Insert directive at the determined position
-    lines.insert(insert_index, '\n' + IMPLEMENT_DIRECTIVE)
 
-    filepath.write_text('\n'.join(lines))
-    return True
+def insert_directive(filepath: Path, directive: CommandDirective) -> bool:
+    """Insert a directive after the YAML frontmatter of a command file.
 
+    Args:
+        filepath: Command file to update.
+        directive: Directive to insert.
 
-def integrate_plan_command(project_root: Optional[Path] = None) -> bool:
-    """Add quality standards directive to /plan command.
+    Returns:
+        True if the directive is present after the call (inserted now or
+        already integrated), False if the file does not exist.
+    """
+    return apply_directive(filepath, directive)["integrated"]
+
+
+def _copy_replacing_block(
+    source: BinaryIO,
+    dest: BinaryIO,
+    marker: bytes,
+    digest: "hashlib._Hash",
+    original: "hashlib._Hash",
+    replacement: Optional[bytes] = None,
+) -> bool:
+    """Copy source to dest line by line, replacing or leaving out a directive.
+
+    The block runs from its stamp line, or the line holding marker in
+    unstamped directives, through the next ``---`` line. It is replaced by
+    replacement, or left out when replacement is None, together with the
+    blank lines just before and after it that every Pantheon release
+    inserted around it. digest hashes what is written and original
+    everything read.
+
+    Returns:
+        True if a block was found, False if no line starts one.
+
+    Raises:
+        ValueError: If the block has no closing ``---`` line.
+    """
+    def write(data: bytes) -> None:
+        dest.write(data)
+        digest.update(data)
+
+    state = "before"  # -> "inside" -> "after" -> "copy"
+    at_line_start = True
+    held = b""  # Blank line that may precede the block, when removing
+    while True:
+        line = source.readline(_CHUNK_SIZE)
+        if not line:
+            break
+        original.update(line)
+        starts_line = at_line_start
+        whole = starts_line and line.endswith(b"\n")
+        at_line_start = line.endswith(b"\n")
+
+        if state == "before":
+            if whole and (_STAMP_LINE.match(line) or line.rstrip() == marker):
+                if replacement is not None:
+                    write(held)
+                held = b""
+                state = "inside"
+                continue
+            write(held)
+            held = b""
+            if replacement is None and whole and not line.strip():
+                held = line
+                continue
+        elif state == "inside":
+            if starts_line and line.strip() == b"---":
+                if replacement is None:
+                    state = "after"
+                else:
+                    write(replacement)
+                    state = "copy"
+            continue
+        elif state == "after":
+            state = "copy"
+            if whole and not line.strip():
+                continue
+
+        write(line)
+
+    write(held)
+    if state == "inside":
+        raise ValueError("directive has no closing '---' line")
+    return state != "before"
+
+
+def _stage_edit(
+    filepath: Path,
+    source: BinaryIO,
+    edit: Callable[[BinaryIO, "hashlib._Hash", "hashlib._Hash"], bool],
+) -> tuple[Optional[Path], str, str]:
+    """Stream an edited copy of a command file into a staging file beside it.
 
     Args:
-        project_root: Root directory of the project. Defaults to current directory.
+        filepath: Command file being edited.
+        source: The file, open for reading; edit() reads it from the start.
+        edit: Copies source to the staging file it is given, hashing what
+            it writes and what it reads into the two digests, and returns
+            whether it changed anything.
 
     Returns:
-        True if integration successful, False otherwise.
+        (staging file, or None if edit() changed nothing, SHA-256 of the
+        edited content, SHA-256 of the original content).
     """
-    if project_root is None:
-        project_root = Path.cwd()
+    digest = hashlib.sha256()
+    original = hashlib.sha256()
+    fd, tmp_name = tempfile.mkstemp(
+        dir=filepath.parent, prefix=f".{filepath.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as dest:
+            source.seek(0)
+            changed = edit(dest, digest, original)
+            dest.flush()
+            os.fsync(dest.fileno())
+        if changed:
+            shutil.copymode(filepath, tmp_name)
+        else:
+            os.unlink(tmp_name)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+    staged = Path(tmp_name) if changed else None
+    return staged, digest.hexdigest(), original.hexdigest()
+
+
+def stage_removal(filepath: Path, directive: CommandDirective) -> StagedDirective:
+    """Write a command file's content with a directive removed, beside it.
+
+    The inverse of stage_directive(). A directive exactly as
+    stage_directive() inserted it is cut out byte for byte in a single
+    streaming pass, restoring the file as it was before integrating.
+    Otherwise (the directive was edited or moved, or inserted unstamped by
+    an older release) the block from the marker line through its ``---``
+    terminator is left out with the blank lines set around it, and files
+    without the marker are only scanned, never copied.
+
+    Args:
+        filepath: Command file to update.
+        directive: Directive to remove.
 
-    filepath = project_root / ".claude" / "commands" / "plan.md"
+    Returns:
+        (result, staged, original_sha256) as from stage_directive(), with
+        result["integrated"] False and result["changed"] True when a
+        directive is being removed.
+
+    Raises:
+        ValueError: If the directive's block has no closing ``---`` line.
+    """
+    result: InsertResult = {
+        "exists": False,
+        "changed": False,
+        "integrated": False,
+        "sha256": None,
+    }
 
     if not filepath.exists():
-        return False
+        return StagedDirective(result, None, None)
+
+    result["exists"] = True
+    marker = directive.marker.encode()
+
+    with open(filepath, "rb") as source:
+        # (offset, length) of the directive, if it is exactly as inserted
+        head_size, insertion = _insertion_point(source, directive)
+        source.seek(head_size)
+        window = source.read(len(insertion))
+        cut: Optional[tuple[int, int]] = None
+        if window == insertion:
+            cut = (head_size, len(insertion))
+        elif head_size and window == insertion[:-1] and not source.read(1):
+            # Inserted after a closing --- that ended the file
+            cut = (head_size - 1, len(insertion))
+        elif not _STAMP_LINE.match(window.lstrip(b"\r\n")):
+            source.seek(0)
+            found, existing_digest = _scan_for_marker(source, marker)
+            if not found:
+                result["sha256"] = existing_digest
+                return StagedDirective(result, None, existing_digest)
+
+        def edit(
+            dest: BinaryIO, digest: "hashlib._Hash", original: "hashlib._Hash"
+        ) -> bool:
+            if cut is None:
+                return _copy_replacing_block(source, dest, marker, digest, original)
+            offset, length = cut
+            _copy_bytes(source, dest, offset, digest, original)
+            original.update(source.read(length))
+            _copy_bytes(source, dest, -1, digest, original)
+            return True
+
+        staged, new_digest, original_digest = _stage_edit(filepath, source, edit)
+
+    if staged is None:
+        # The marker only occurs mid-line: nothing to remove
+        result["sha256"] = original_digest
+        return StagedDirective(result, None, original_digest)
+
+    result["changed"] = True
+    result["sha256"] = new_digest
+    return StagedDirective(result, staged, original_digest)
+
+
+def remove_directive(filepath: Path, directive: CommandDirective) -> InsertResult:
+    """Remove a directive from a command file, without a backup.
+
+    The new content is staged with stage_removal() and atomically moved
+    into place with os.replace().
 
-    content = filepath.read_text()
+    Args:
+        filepath: Command file to update.
+        directive: Directive to remove.
 
-    # Check if already integrated
-    if "## Quality Standards (Required for DEV Integration)" in content:
-        return True  # Already integrated
+    Returns:
+        Dictionary describing the file after the call, as from
+        apply_directive(); "changed" is True if a directive was removed.
 
-    # Insert after YAML frontmatter or at beginning if no frontmatter
-    lines = content.split('\n')
-    insert_index = 0
-    in_frontmatter = False
-    frontmatter_end_found = False
+    Raises:
+        ValueError: If the directive's block has no closing ``---`` line.
+    """
+    result, staged, _ = stage_removal(filepath, directive)
+    if staged is not None:
+        try:
+            os.replace(staged, filepath)
+        except BaseException:
+            os.unlink(staged)
+            raise
+    return result
 
-    for i, line in enumerate(lines):
-        # Detect start of YAML frontmatter
-        if i == 0 and line.strip() == '---':
-            in_frontmatter = True
-            continue
 
-        # Detect end of YAML frontmatter
-        if in_frontmatter and line.strip() == '---':
-            insert_index = i + 1
-            frontmatter_end_found = True
+def check_directive(filepath: Path, directive: CommandDirective) -> str:
+    """Check whether a command file has the current version of a directive.
+
+    A directive inserted by this version of Pantheon starts with its stamp
+    line right after the frontmatter, so files that are up to date (or
+    stamped by another version) are answered by reading only the
+    frontmatter and that line. Files without a stamp there are scanned for
+    the marker.
+
+    Args:
+        filepath: Command file to check.
+        directive: Directive the file should carry.
+
+    Returns:
+        DIRECTIVE_CURRENT; DIRECTIVE_OUTDATED if the file carries another
+        version of the directive (or an unstamped one, from a Pantheon
+        release that did not stamp directives); DIRECTIVE_MISSING if it
+        has none; or FILE_NOT_FOUND.
+    """
+    try:
+        source = open(filepath, "rb")
+    except FileNotFoundError:
+        return FILE_NOT_FOUND
+
+    with source:
+        head_size, insertion = _insertion_point(source, directive)
+        stamp_end = insertion.index(directive.stamp) + len(directive.stamp)
+        source.seek(head_size)
+        window = source.read(stamp_end)
+        if window == insertion[:stamp_end]:
+            return DIRECTIVE_CURRENT
+        if _STAMP_LINE.match(window.lstrip(b"\r\n")):
+            return DIRECTIVE_OUTDATED
+
+        source.seek(0)
+        found, _ = _scan_for_marker(source, directive.marker.encode())
+    return DIRECTIVE_OUTDATED if found else DIRECTIVE_MISSING
+
+
+def upgrade_directive(filepath: Path, directive: CommandDirective) -> str:
+    """Replace an outdated directive in a command file with the current one.
+
+    The directive block (stamp line, marker line through its ``---``
+    terminator) is swapped for the current stamp and text in a single
+    streaming pass into a staging file, which is moved into place with
+    os.replace(). The rest of the file is copied through unchanged.
+
+    Args:
+        filepath: Command file to update.
+        directive: Current version of the directive.
+
+    Returns:
+        What check_directive() reported before the call; the file was
+        rewritten if that is DIRECTIVE_OUTDATED.
+
+    Raises:
+        ValueError: If the directive's block has no closing ``---`` line.
+    """
+    status = check_directive(filepath, directive)
+    if status != DIRECTIVE_OUTDATED:
+        return status
+
+    replacement = directive.stamp + directive.text.encode()
+    with open(filepath, "rb") as source:
+
+        def edit(
+            dest: BinaryIO, digest: "hashlib._Hash", original: "hashlib._Hash"
+        ) -> bool:
+            return _copy_replacing_block(
+                source, dest, directive.marker.encode(), digest, original, replacement
+            )
+
+        staged, _, _ = _stage_edit(filepath, source, edit)
+
+    if staged is None:
+        # The marker only occurs mid-line: no block to replace
+        raise ValueError("directive block not found")
+    try:
+        os.replace(staged, filepath)
+    except BaseException:
+        os.unlink(staged)
+        raise
+    return status
+
+
+class DirectivePreview(TypedDict):
+    """Type for what apply_directive() would do to one command file."""
+
+    exists: bool
+    changed: bool
+    diff: Optional[str]
+
+
+def _diff_lines(data: bytes) -> list[str]:
+    """Split bytes into text lines for difflib, splitting on newlines only."""
+    parts = data.decode("utf-8", errors="replace").split("\n")
+    lines = [part + "\n" for part in parts[:-1]]
+    if parts[-1]:
+        lines.append(parts[-1])
+    return lines
+
+
+def _insertion_diff(
+    stream: BinaryIO, head_size: int, insertion: bytes, label: str
+) -> str:
+    """Render a unified diff of inserting bytes at head_size.
+
+    Only the frontmatter and a few lines after the insertion point are
+    read, so the diff costs the same for any file size. The window is
+    wider than the diff context because difflib may line the insertion up
+    a few lines earlier or later when its lines repeat nearby ones.
+    """
+    window = _DIFF_CONTEXT + insertion.count(b"\n") + 1
+    stream.seek(0)
+    head = stream.read(head_size)
+    before = head.splitlines(keepends=True)
+    start = max(len(before) - window, 0)
+    after = []
+    for _ in range(window):
+        raw = stream.readline(_CHUNK_SIZE)
+        if not raw:
             break
+        after.append(raw)
+
+    context = b"".join(before[start:])
+    tail = b"".join(after)
+    hunks = difflib.unified_diff(
+        _diff_lines(context + tail),
+        _diff_lines(context + insertion + tail),
+        fromfile=f"a/{label}",
+        tofile=f"b/{label}",
+        n=_DIFF_CONTEXT,
+    )
+
+    out = []
+    for line in hunks:
+        header = _HUNK_HEADER.match(line)
+        if header:
+            # Hunk line numbers are relative to the window read above
+            old_start, old_len, new_start, new_len = header.groups()
+            line = (
+                f"@@ -{int(old_start) + start}{old_len or ''} "
+                f"+{int(new_start) + start}{new_len or ''} @@\n"
+            )
+        elif not line.endswith("\n"):
+            line += "\n\\ No newline at end of file\n"
+        out.append(line)
+    return "".join(out)
+
+
+def preview_directive(
+    filepath: Path, directive: CommandDirective, diff_label: Optional[str] = None
+) -> DirectivePreview:
+    """Work out what apply_directive() would do, without writing anything.
+
+    Args:
+        filepath: Command file to check.
+        directive: Directive that would be inserted.
+        diff_label: Path shown in the diff headers. A unified diff is only
+            rendered when this is given.
 
-    # If no frontmatter found, insert at beginning
-    if not frontmatter_end_found:
-        insert_index = 0
+    Returns:
+        Dictionary describing the would-be change:
+        {
+            "exists": bool,
+            "changed": bool (the directive would be inserted),
+            "diff": unified diff, or None
+        }
+    """
+    result: DirectivePreview = {"exists": False, "changed": False, "diff": None}
+    if not filepath.exists():
+        return result
+
+    result["exists"] = True
+    with open(filepath, "rb") as source:
+        found, _ = _scan_for_marker(source, directive.marker.encode())
+        if found:
+            return result
+
+        result["changed"] = True
+        if diff_label is not None:
+            head_size, insertion = _insertion_point(source, directive)
+            result["diff"] = _insertion_diff(
+                source, head_size, insertion, diff_label
+            )
+    return result
+
+
+def integrate_command(filename: str, project_root: Optional[Path] = None) -> bool:
+    """Add the registered directive to a Spec Kit command.
+
+    Args:
+        filename: Command filename registered in COMMAND_DIRECTIVES.
+        project_root: Root directory of the project. Defaults to current directory.
+
+    Returns:
+        True if integration successful, False otherwise.
+
+    Raises:
+        KeyError: If no directive is registered for filename.
+    """
+    return SpecKitProject(project_root).integrate_command(filename)
 
-    # Insert directive at the determined position
-    lines.insert(insert_index, '\n' + PLAN_DIRECTIVE)
 
-    filepath.write_text('\n'.join(lines))
-    return True
+def integrate_implement_command(project_root: Optional[Path] = None) -> bool:
+    """Add DEV integration directive to /implement command.
+
+    Args:
+        project_root: Root directory of the project. Defaults to current directory.
+
+    Returns:
+        True if integration successful, False otherwise.
+    """
+    return integrate_command("implement.md", project_root)
+
+
+def integrate_plan_command(project_root: Optional[Path] = None) -> bool:
+    """Add quality standards directive to /plan command.
+
+    Args:
+        project_root: Root directory of the project. Defaults to current directory.
+
+    Returns:
+        True if integration successful, False otherwise.
+    """
+    return integrate_command("plan.md", project_root)
 
 
 def integrate_tasks_command(project_root: Optional[Path] = None) -> bool:
@@ -333,54 +987,138 @@ def integrate_tasks_command(project_root: Optional[Path] = None) -> bool:
     Returns:
         True if integration successful, False otherwise.
     """
-    if project_root is None:
-        project_root = Path.cwd()
+    return integrate_command("tasks.md", project_root)
 
-    filepath = project_root / ".claude" / "commands" / "tasks.md"
 
-    if not filepath.exists():
-        return False
+def directives_digest() -> str:
+    """Digest of the directive registry, used to invalidate cached state."""
+    digest = hashlib.sha256()
+    for filename, (marker, text) in sorted(COMMAND_DIRECTIVES.items()):
+        for part in (filename, marker, text):
+            digest.update(part.encode())
+            digest.update(b"\0")
+    return digest.hexdigest()
 
-    content = filepath.read_text()
 
-    # Check if already integrated
-    if "## Task Format (Required for DEV Integration)" in content:
-        return True  # Already integrated
+def _cached_integration(
+    project_root: Path, restamp: bool = True
+) -> Optional[IntegrationResult]:
+    """Return a result from the fingerprint cache if nothing has changed.
 
-    # Insert after YAML frontmatter or at beginning if no frontmatter
-    lines = content.split('\n')
-    insert_index = 0
-    in_frontmatter = False
-    frontmatter_end_found = False
+    A hit costs one stat() per command file. Any missing, changed or
+    unintegrated file, or a change to the directive registry, is a miss.
+    Files fingerprinted within the racy window are hashed; once they check
+    out, the state is re-stamped (unless restamp is False) so the next hit
+    is stat-only again.
+    """
+    state = fingerprints.load_state(project_root)
+    if state is None or state["directives"] != directives_digest():
+        return None
 
-    for i, line in enumerate(lines):
-        # Detect start of YAML frontmatter
-        if i == 0 and line.strip() == '---':
-            in_frontmatter = True
-            continue
+    commands_dir = project_root / ".claude" / "commands"
+    racy = False
+    for filename in COMMAND_DIRECTIVES:
+        recorded = state["files"].get(filename)
+        if recorded is None or not recorded["integrated"]:
+            return None
+        if not fingerprints.is_unchanged(
+            commands_dir / filename, recorded, state["saved_ns"]
+        ):
+            return None
+        racy = racy or fingerprints.is_racy(recorded, state["saved_ns"])
+
+    if racy and restamp:
+        _restamp_integration(project_root, state)
+
+    filenames = [*COMMAND_DIRECTIVES]
+    return {
+        "success": True,
+        "backup_dir": None,
+        "files_modified": filenames,
+        "errors": [],
+        "validation": {"valid": True, "errors": [], "files_checked": filenames},
+    }
 
-        # Detect end of YAML frontmatter
-        if in_frontmatter and line.strip() == '---':
-            insert_index = i + 1
-            frontmatter_end_found = True
-            break
 
-    # If no frontmatter found, insert at beginning
-    if not frontmatter_end_found:
-        insert_index = 0
+def _restamp_integration(
+    project_root: Path, state: fingerprints.IntegrationState
+) -> None:
+    """Save verified fingerprints again with a new saved_ns.
+
+    State saved straight after integrating is racy for every file, and
+    stays so until saved again. Skipped when another process holds the
+    project lock or has replaced the state since it was checked.
+    """
+    try:
+        with locking.project_lock(project_root, timeout=0):
+            if fingerprints.load_state(project_root) == state:
+                fingerprints.save_state(
+                    project_root, state["directives"], state["files"]
+                )
+    except (TimeoutError, OSError):
+        pass
+
 
-    # Insert directive at the determined position
-    lines.insert(insert_index, '\n' + TASKS_DIRECTIVE)
+def _record_integration(
+    project_root: Path, outcomes: Optional[dict[str, InsertResult]] = None
+) -> None:
+    """Save fingerprints of the freshly integrated command files.
+
+    Digests already computed by apply_directive() are reused, so only a
+    stat() per file is needed; files without a known digest are hashed.
+    """
+    commands_dir = project_root / ".claude" / "commands"
+    outcomes = outcomes or {}
+    files = {
+        filename: fingerprints.fingerprint(
+            commands_dir / filename,
+            integrated=True,
+            sha256=outcomes[filename]["sha256"] if filename in outcomes else None,
+        )
+        for filename in COMMAND_DIRECTIVES
+    }
+    fingerprints.save_state(project_root, directives_digest(), files)
 
-    filepath.write_text('\n'.join(lines))
-    return True
 
+def _validation_from_outcomes(outcomes: dict[str, InsertResult]) -> ValidationResult:
+    """Build a validation result from what apply_directive() just wrote.
 
-def integrate_spec_kit(project_root: Optional[Path] = None) -> IntegrationResult:
+    Mirrors validate_integration() without reading the files back.
+    """
+    results: ValidationResult = {"valid": True, "errors": [], "files_checked": []}
+
+    for filename, (section_marker, _) in COMMAND_DIRECTIVES.items():
+        results["files_checked"].append(filename)
+        outcome = outcomes.get(filename)
+
+        if outcome is None or not outcome["exists"]:
+            results["valid"] = False
+            results["errors"].append(f"{filename} not found")
+        elif not outcome["integrated"]:
+            results["valid"] = False
+            results["errors"].append(
+                f"{filename} missing integration section: {section_marker}"
+            )
+
+    return results
+
+
+def integrate_spec_kit(
+    project_root: Optional[Path] = None,
+    force: bool = False,
+    verify_on_disk: bool = False,
+) -> IntegrationResult:
     """Main integration flow: Add DEV agent directives to Spec Kit commands.
 
+    If every command file is unchanged since the last successful run
+    (according to the fingerprint cache in .claude/), the backup and
+    rewrite steps are skipped and the cached result is returned.
+
     Args:
         project_root: Root directory of the project. Defaults to current directory.
+        force: Ignore the fingerprint cache and always back up and re-check.
+        verify_on_disk: Re-read every command file with validate_integration()
+            after writing, instead of validating the content just written.
 
     Returns:
         Dictionary with integration results:
@@ -392,62 +1130,111 @@ def integrate_spec_kit(project_root: Optional[Path] = None) -> IntegrationResult
             "validation": dict from validate_integration()
         }
     """
-    if project_root is None:
-        project_root = Path.cwd()
+    return SpecKitProject(project_root).integrate(
+        force=force, verify_on_disk=verify_on_disk
+    )
 
-    result: IntegrationResult = {
-        "success": False,
-        "backup_dir": None,
-        "files_modified": [],
-        "errors": [],
-        "validation": {"valid": False, "errors": [], "files_checked": []}
-    }
 
-    # Step 1: Verify prerequisites
-    if not verify_agents_installed(project_root):
-        result["errors"].append("DEV agent not installed. Run 'pantheon init' first.")
-        return result
+def recover_integration(
+    project_root: Optional[Path] = None,
+) -> "journal.RecoveryResult":
+    """Replay or undo an integration that was interrupted part-way.
 
-    if not verify_spec_kit(project_root):
-        result["errors"].append(
-            "Spec Kit not detected. Ensure .specify/ and .claude/commands/ exist."
-        )
-        return result
+    integrate_spec_kit() commits its command file changes through a
+    write-ahead journal (see pantheon.journal). If a run dies while
+    committing, the next integrate, restore or rollback calls this first;
+    it only rewrites files named in a journal left behind. Staging files
+    of a run that died before journaling are deleted.
 
-    # Step 2: Create backup
-    try:
-        backup_dir = create_backup(project_root)
-        result["backup_dir"] = backup_dir
-    except Exception as e:
-        result["errors"].append(f"Failed to create backup: {str(e)}")
-        return result
+    Args:
+        project_root: Root directory of the project. Defaults to current directory.
 
-    # Step 3: Integrate commands
-    try:
-        if integrate_implement_command(project_root):
-            result["files_modified"].append("implement.md")
+    Returns:
+        Dictionary with recovery results:
+        {
+            "action": "replayed", "undone", or None if nothing was pending,
+            "files": list of files (relative to the project) rewritten,
+            "errors": list of error messages
+        }
+    """
+    return SpecKitProject(project_root).recover()
 
-        if integrate_plan_command(project_root):
-            result["files_modified"].append("plan.md")
 
-        if integrate_tasks_command(project_root):
-            result["files_modified"].append("tasks.md")
+def unintegrate_spec_kit(project_root: Optional[Path] = None) -> UnintegrationResult:
+    """Remove DEV agent directives from Spec Kit commands, in place.
 
-    except Exception as e:
-        result["errors"].append(f"Integration failed: {str(e)}")
-        # TODO: Rollback on failure
-        return result
+    The reverse of integrate_spec_kit() without going through a backup:
+    each command file is streamed once, with its directive block left out,
+    and moved into place atomically. Edits made since integrating are kept.
+    Files without a directive are left untouched, so running it again after
+    an interruption finishes the job.
 
-    # Step 4: Validate integration
-    validation = validate_integration(project_root)
-    result["validation"] = validation
+    Args:
+        project_root: Root directory of the project. Defaults to current directory.
 
-    if validation["valid"]:
-        result["success"] = True
-    else:
-        result["errors"].extend(validation["errors"])
+    Returns:
+        Dictionary with unintegration results:
+        {
+            "success": bool,
+            "files_modified": list of filenames a directive was removed from,
+            "errors": list of error messages
+        }
+    """
+    return SpecKitProject(project_root).unintegrate()
 
-    return result
+
+def upgrade_spec_kit(project_root: Optional[Path] = None) -> UpgradeResult:
+    """Bring outdated DEV agent directives up to date, in place.
+
+    Every inserted directive carries a stamp identifying its text, so
+    files integrated by an older Pantheon release are told apart from
+    current ones by reading a few hundred bytes. Outdated directive blocks
+    are replaced with the current text in one streaming pass per file;
+    the rest of each file, including edits made since integrating, is
+    kept. No backup is made.
+
+    Args:
+        project_root: Root directory of the project. Defaults to current directory.
+
+    Returns:
+        Dictionary with upgrade results:
+        {
+            "success": bool,
+            "files_upgraded": list of filenames rewritten,
+            "up_to_date": list of filenames already current,
+            "errors": list of error messages (missing or unintegrated files
+                are errors: run integrate first)
+        }
+    """
+    return SpecKitProject(project_root).upgrade()
+
+
+def preview_spec_kit(
+    project_root: Optional[Path] = None, force: bool = False, diff: bool = False
+) -> PreviewResult:
+    """Work out what integrate_spec_kit() would change, without writing.
+
+    Command files are read but nothing is created or modified (no backup,
+    lock file or fingerprint cache update), so this is safe to run over
+    any number of projects, including read-only checkouts.
+
+    Args:
+        project_root: Root directory of the project. Defaults to current directory.
+        force: Ignore the fingerprint cache and read every command file.
+        diff: Also render a unified diff of the changes.
+
+    Returns:
+        Dictionary with preview results:
+        {
+            "success": bool (integration would succeed),
+            "would_modify": list of filenames that would get a directive,
+            "unchanged": list of filenames already integrated,
+            "errors": list of reasons integration would fail,
+            "diff": unified diff (paths relative to the project), or None
+                if diff was not requested
+        }
+    """
+    return SpecKitProject(project_root).preview(force=force, diff=diff)
 
 
 def find_latest_backup(project_root: Optional[Path] = None) -> Optional[Path]:
@@ -459,106 +1246,1082 @@ def find_latest_backup(project_root: Optional[Path] = None) -> Optional[Path]:
     Returns:
         Path to the most recent backup directory, or None if no backups found.
     """
-    if project_root is None:
-        project_root = Path.cwd()
+    return find_backup(project_root, 0)
 
-    # Find all backup directories
-    backup_dirs = list(project_root.glob(".integration-backup-*"))
 
-    if not backup_dirs:
-        return None
+def find_backup(project_root: Optional[Path] = None, n: int = 0) -> Optional[Path]:
+    """Find the n-th most recent integration backup directory.
+
+    Reads one record of the backup index (.pantheon/backups.idx) instead of
+    scanning the project root; the index is rebuilt from disk if missing or
+    corrupt.
+
+    Args:
+        project_root: Root directory of the project. Defaults to current directory.
+        n: How many backups to step back from the latest (0 = latest).
+
+    Returns:
+        Path to the backup directory, or None if there are not enough backups.
+    """
+    return SpecKitProject(project_root).find_backup(n)
+
+
+def list_backups(project_root: Optional[Path] = None) -> list[Path]:
+    """List integration backup directories, newest first.
+
+    Args:
+        project_root: Root directory of the project. Defaults to current directory.
+
+    Returns:
+        Paths to the backup directories, newest first.
+    """
+    return SpecKitProject(project_root).list_backups()
+
+
+def resolve_backup(ref: str, project_root: Optional[Path] = None) -> Optional[Path]:
+    """Find an integration backup by ID or by age.
+
+    Args:
+        ref: The backup's directory name or ID, a unique leading part of
+            the ID (e.g. "20251001-1430"), or an age such as "2d" for the
+            newest backup at least that old.
+        project_root: Root directory of the project. Defaults to current directory.
+
+    Returns:
+        Path to the backup directory, or None if no backup matches.
+
+    Raises:
+        ValueError: If ref is a leading part of several backup IDs.
+    """
+    return SpecKitProject(project_root).resolve_backup(ref)
 
-    # Sort by name (which includes timestamp) and return the latest
-    backup_dirs.sort(reverse=True)
-    return backup_dirs[0]
+
+def _matches_backup(
+    target: Path,
+    source: Path,
+    digest: Optional[str],
+    state: Optional[fingerprints.IntegrationState],
+) -> bool:
+    """Check whether a command file already has a backed-up file's content.
+
+    Decided from metadata where possible. Files of a different size differ.
+    Files with the same size and modification time as the backup copy are
+    taken to match (shutil.copy2() keeps the time, so files restored before
+    or untouched since the backup qualify), unless modified within the racy
+    window. A fingerprint recorded by integrate supplies the file's digest
+    while it is still unchanged. Only the remaining files are hashed.
+
+    Args:
+        target: Current command file.
+        source: Backup copy, or its object in the store.
+        digest: SHA-256 of the backup copy from the manifest, or None to
+            hash it (legacy backups).
+        state: Fingerprint state from fingerprints.load_state().
+
+    Returns:
+        True if the contents are identical.
+    """
+    try:
+        current = target.stat()
+        backed_up = source.stat()
+    except OSError:
+        return False
+
+    if current.st_size != backed_up.st_size:
+        return False
+    if (
+        current.st_mtime_ns == backed_up.st_mtime_ns
+        and time.time_ns() - current.st_mtime_ns > fingerprints.RACY_WINDOW_NS
+    ):
+        return True
+
+    if digest is None:
+        digest = backups.hash_file(source)
+    recorded = state["files"].get(target.name) if state else None
+    if (
+        state is not None
+        and recorded is not None
+        and fingerprints.is_unchanged(target, recorded, state["saved_ns"])
+    ):
+        return recorded["sha256"] == digest
+    return backups.hash_file(target) == digest
 
 
 def restore_files(
-    backup_dir: Path, project_root: Optional[Path] = None
+    backup_dir: Path,
+    project_root: Optional[Path] = None,
+    files: Optional[Iterable[str]] = None,
 ) -> RestoreResult:
     """Restore command files from a backup directory.
 
+    Only files whose content differs from the backup are copied; the rest
+    are reported as unchanged without being touched. On a project where
+    most files already match, restoring is mostly a matter of comparing
+    sizes and modification times (see _matches_backup()).
+
+    A backup moved into the packed archive (see backups.pack_backups()) is
+    extracted to a temporary directory and restored from there.
+
     Args:
         backup_dir: Path to the backup directory containing files to restore.
         project_root: Root directory of the project. Defaults to current directory.
+        files: Only restore these command files (e.g. ["plan.md"]). Defaults
+            to every file in the backup.
 
     Returns:
         Dictionary with restoration results:
         {
             "success": bool,
-            "files_restored": list of filenames,
+            "files_restored": list of filenames copied from the backup,
+            "files_unchanged": list of filenames that already matched,
             "errors": list of error messages
         }
-    """
-    if project_root is None:
-        project_root = Path.cwd()
 
-    result: RestoreResult = {
-        "success": False,
-        "files_restored": [],
-        "errors": []
-    }
-
-    if not backup_dir.exists():
-        result["errors"].append(f"Backup directory not found: {backup_dir}")
-        return result
-
-    commands_dir = project_root / ".claude" / "commands"
-
-    # Restore each file from backup
-    for backup_file in backup_dir.glob("*.md"):
-        try:
-            dest_file = commands_dir / backup_file.name
-            shutil.copy2(backup_file, dest_file)
-            result["files_restored"].append(backup_file.name)
-        except Exception as e:
-            result["errors"].append(f"Failed to restore {backup_file.name}: {str(e)}")
-
-    if result["files_restored"] and not result["errors"]:
-        result["success"] = True
+        If files names anything the backup does not contain, nothing is
+        restored and each unknown name is reported in errors.
+    """
+    return SpecKitProject(project_root).restore(backup_dir, files)
 
-    return result
 
+def rollback_integration(
+    project_root: Optional[Path] = None,
+    n: int = 0,
+    files: Optional[Iterable[str]] = None,
+    to: Optional[str] = None,
+) -> RollbackResult:
+    """Rollback to the most recent backup, or an older one.
 
-def rollback_integration(project_root: Optional[Path] = None) -> RollbackResult:
-    """Rollback to the most recent backup.
+    Restores incrementally, like restore_files().
 
     Args:
         project_root: Root directory of the project. Defaults to current directory.
+        n: How many backups to step back from the latest (0 = latest).
+        files: Only restore these command files. Defaults to every file in
+            the backup.
+        to: Roll back to the backup with this ID, or the newest backup at
+            least this old (e.g. "2d"), instead of counting back n; see
+            backups.resolve_backup_name().
 
     Returns:
         Dictionary with rollback results:
         {
             "success": bool,
             "backup_dir": Path or None,
-            "files_restored": list of filenames,
+            "files_restored": list of filenames copied from the backup,
+            "files_unchanged": list of filenames that already matched,
             "errors": list of error messages
         }
     """
-    if project_root is None:
-        project_root = Path.cwd()
+    return SpecKitProject(project_root).rollback(n, files=files, to=to)
 
-    result: RollbackResult = {
-        "success": False,
-        "backup_dir": None,
-        "files_restored": [],
-        "errors": []
-    }
 
-    # Find latest backup
-    backup_dir = find_latest_backup(project_root)
+class SpecKitProject:
+    """A Spec Kit project, for callers that work with the same project repeatedly.
+
+    Paths are resolved once when the object is created, and the results of
+    the prerequisite checks (is the DEV agent installed, is Spec Kit
+    present) are memoized. Long-running callers should call invalidate()
+    when something outside this object may have added or removed those
+    files. Command file contents are never cached: integrate() and
+    validate() always see the files as they are on disk.
+
+    The module-level functions (integrate_spec_kit(), rollback_integration(),
+    ...) are thin wrappers that create a SpecKitProject per call.
+    """
+
+    def __init__(self, project_root: Optional[Path] = None) -> None:
+        """Resolve the project's paths.
+
+        Args:
+            project_root: Root directory of the project. Defaults to current
+                directory.
+        """
+        self.root = Path.cwd() if project_root is None else Path(project_root)
+        self.claude_dir = self.root / ".claude"
+        self.commands_dir = self.claude_dir / "commands"
+        self.agent_path = self.claude_dir / "agents" / "dev.md"
+        self.specify_dir = self.root / ".specify"
+        self._probes: dict[str, bool] = {}
+
+    def __repr__(self) -> str:
+        return f"SpecKitProject({str(self.root)!r})"
+
+    def command_path(self, filename: str) -> Path:
+        """Return the path of a command file in .claude/commands/."""
+        return self.commands_dir / filename
+
+    def invalidate(self) -> None:
+        """Forget memoized filesystem probes so the next check re-stats."""
+        self._probes.clear()
+
+    @property
+    def agents_installed(self) -> bool:
+        """True if the DEV agent exists in .claude/agents/ (memoized)."""
+        installed = self._probes.get("agents_installed")
+        if installed is None:
+            installed = self._probes["agents_installed"] = self.agent_path.exists()
+        return installed
+
+    @property
+    def spec_kit_detected(self) -> bool:
+        """True if both .specify/ and .claude/commands/ exist (memoized)."""
+        detected = self._probes.get("spec_kit_detected")
+        if detected is None:
+            detected = self._probes["spec_kit_detected"] = (
+                self.specify_dir.exists() and self.commands_dir.exists()
+            )
+        return detected
+
+    @locking.locked
+    def create_backup(self) -> Path:
+        """Create a timestamped backup of the command files.
+
+        See create_backup() for the backup layout.
+
+        Returns:
+            Path to the backup directory.
+        """
+        backed_up: dict[str, str] = {}
+
+        with trace.span("create_backup") as span:
+            backup_dir = backups.make_backup_dir(self.root)
+            for filename in COMMAND_DIRECTIVES:
+                source = self.command_path(filename)
+                if source.exists():
+                    digest = backups.store_object(self.root, source)
+                    backups.link_object(self.root, digest, backup_dir / filename)
+                    backed_up[filename] = digest
+
+            backups.write_manifest(backup_dir, backed_up)
+            if span:
+                span.set(
+                    files=len(backed_up),
+                    bytes=sum(
+                        self.command_path(f).stat().st_size for f in backed_up
+                    ),
+                )
+        return backup_dir
+
+    def validate(self, window: Optional[int] = None) -> ValidationResult:
+        """Check every registered command file on disk for its directive.
+
+        See validate_integration() for the arguments and result.
+        """
+        results: ValidationResult = {
+            "valid": True,
+            "errors": [],
+            "files_checked": []
+        }
+
+        # Check that command files exist and contain integration sections
+        for filename, (section_marker, _) in COMMAND_DIRECTIVES.items():
+            results["files_checked"].append(filename)
+            error = validate_command_file(
+                self.command_path(filename), section_marker, window
+            )
+            if error is not None:
+                results["valid"] = False
+                results["errors"].append(error)
+
+        return results
+
+    def locate_markers(
+        self,
+        markers: Optional[dict[str, list[str]]] = None,
+        window: Optional[int] = None,
+    ) -> dict[str, Optional[dict[str, int]]]:
+        """Find where markers sit in the project's command files.
+
+        See locate_markers() for the arguments and result.
+        """
+        if markers is None:
+            markers = {
+                filename: [directive.marker]
+                for filename, directive in COMMAND_DIRECTIVES.items()
+            }
+
+        located: dict[str, Optional[dict[str, int]]] = {}
+        for filename, wanted in markers.items():
+            with trace.span("locate_markers", file=filename) as span:
+                try:
+                    located[filename] = find_markers(
+                        self.command_path(filename), wanted, window
+                    )
+                except OSError:
+                    located[filename] = None
+                span.set(markers=len(wanted))
+        return located
+
+    @locking.locked
+    def recover(self) -> "journal.RecoveryResult":
+        """Replay or undo an integration interrupted part-way.
+
+        Staging files left in the commands directory by a run that died
+        before writing its journal are deleted as well.
+
+        See recover_integration() for the result.
+        """
+        recovery: journal.RecoveryResult = {"action": None, "files": [], "errors": []}
+        if journal.has_journal(self.root):
+            with trace.span("recover") as span:
+                recovery = journal.recover(self.root)
+                span.set(action=recovery["action"], files=len(recovery["files"]))
+        journal.discard_staging(self.commands_dir)
+        if recovery["files"]:
+            fingerprints.clear_state(self.root)
+        return recovery
+
+    @locking.locked
+    def integrate_command(self, filename: str) -> bool:
+        """Add the registered directive to one command file.
+
+        Returns:
+            True if the directive is present after the call.
+
+        Raises:
+            KeyError: If no directive is registered for filename.
+        """
+        directive = COMMAND_DIRECTIVES[filename]
+        self.recover()
+        return insert_directive(self.command_path(filename), directive)
+
+    @locking.locked
+    def repair(self, filename: str) -> InsertResult:
+        """Re-apply one command file's directive after it was overwritten.
+
+        Like integrate() for a single file, without a backup: an interrupted
+        run is recovered first, the new content is committed through the
+        journal, and the fingerprint state is dropped if the file changes.
+
+        Raises:
+            KeyError: If no directive is registered for filename.
+            OSError: If the file cannot be read or replaced.
+        """
+        directive = COMMAND_DIRECTIVES[filename]
+        self.recover()
+
+        filepath = self.command_path(filename)
+        with journal.Transaction(self.root) as transaction:
+            outcome, staged, original = stage_directive(filepath, directive)
+            if staged is not None:
+                assert original is not None and outcome["sha256"]
+                transaction.stage(filepath, staged, original, outcome["sha256"])
+            transaction.commit()
+
+        if outcome["changed"]:
+            fingerprints.clear_state(self.root)
+        return outcome
+
+    def integrate(
+        self, force: bool = False, verify_on_disk: bool = False
+    ) -> IntegrationResult:
+        """Add DEV agent directives to the project's command files.
+
+        See integrate_spec_kit() for the arguments and result.
+        """
+        result: IntegrationResult = {
+            "success": False,
+            "backup_dir": None,
+            "files_modified": [],
+            "errors": [],
+            "validation": {"valid": False, "errors": [], "files_checked": []}
+        }
 
-    if not backup_dir:
-        result["errors"].append("No backup found. Nothing to rollback.")
+        # Step 1: Verify prerequisites
+        with trace.span("verify_agents_installed"):
+            agents_installed = self.agents_installed
+        if not agents_installed:
+            result["errors"].append(AGENT_MISSING_ERROR)
+            return result
+
+        with trace.span("verify_spec_kit"):
+            spec_kit_found = self.spec_kit_detected
+        if not spec_kit_found:
+            result["errors"].append(SPEC_KIT_MISSING_ERROR)
+            return result
+
+        # An interrupted run's journal must be recovered before the cache
+        # can be trusted
+        pending = journal.has_journal(self.root)
+        if not force and not pending:
+            with trace.span("fingerprint_cache") as span:
+                cached = _cached_integration(self.root)
+                span.set(hit=cached is not None)
+            if cached is not None:
+                return cached
+
+        # Hold the project lock up to the fingerprint update. A run that
+        # waited for it re-checks the cache: the holder may have done the work
+        with locking.project_lock(self.root):
+            self.recover()
+            if not force:
+                cached = _cached_integration(self.root)
+                if cached is not None:
+                    return cached
+
+            # Step 2: Create backup
+            try:
+                backup_dir = self.create_backup()
+                result["backup_dir"] = backup_dir
+            except Exception as e:
+                result["errors"].append(f"Failed to create backup: {str(e)}")
+                return result
+
+            # Step 3: Integrate commands, all or nothing: new contents are
+            # staged, then journaled and moved into place together
+            outcomes: dict[str, InsertResult] = {}
+            try:
+                with journal.Transaction(self.root) as transaction:
+                    for filename, directive in COMMAND_DIRECTIVES.items():
+                        filepath = self.command_path(filename)
+                        with trace.span("apply_directive", file=filename) as span:
+                            outcome, staged, original = stage_directive(
+                                filepath, directive
+                            )
+                            span.set(changed=outcome["changed"])
+                            if span and outcome["exists"]:
+                                span.set(bytes=(staged or filepath).stat().st_size)
+                        if staged is not None:
+                            assert original is not None and outcome["sha256"]
+                            transaction.stage(
+                                filepath, staged, original, outcome["sha256"]
+                            )
+                        outcomes[filename] = outcome
+
+                    with trace.span("commit", files=len(transaction.entries)):
+                        transaction.commit()
+
+            except Exception as e:
+                result["errors"].append(f"Integration failed: {str(e)}")
+                return result
+
+            result["files_modified"] = [
+                filename
+                for filename, outcome in outcomes.items()
+                if outcome["integrated"]
+            ]
+
+            # Step 4: Validate integration against the content just written
+            with trace.span("validate_integration", on_disk=verify_on_disk) as span:
+                if verify_on_disk:
+                    validation = self.validate()
+                else:
+                    validation = _validation_from_outcomes(outcomes)
+                span.set(files=len(validation["files_checked"]))
+            result["validation"] = validation
+
+            if validation["valid"]:
+                result["success"] = True
+                try:
+                    with trace.span("record_fingerprints"):
+                        _record_integration(
+                            self.root, outcomes if not verify_on_disk else None
+                        )
+                except OSError:
+                    pass  # Cache is an optimization; next run just re-checks
+            else:
+                result["errors"].extend(validation["errors"])
+
+            return result
+
+    @locking.locked
+    def unintegrate(self) -> UnintegrationResult:
+        """Remove DEV agent directives from the project's command files.
+
+        See unintegrate_spec_kit() for the result.
+        """
+        result: UnintegrationResult = {
+            "success": False,
+            "files_modified": [],
+            "errors": [],
+        }
+
+        if not self.spec_kit_detected:
+            result["errors"].append(SPEC_KIT_MISSING_ERROR)
+            return result
+
+        self.recover()
+
+        for filename, directive in COMMAND_DIRECTIVES.items():
+            with trace.span("remove_directive", file=filename) as span:
+                try:
+                    outcome = remove_directive(self.command_path(filename), directive)
+                except (OSError, ValueError) as e:
+                    result["errors"].append(
+                        f"Failed to unintegrate {filename}: {str(e)}"
+                    )
+                    continue
+                span.set(changed=outcome["changed"])
+            if outcome["changed"]:
+                result["files_modified"].append(filename)
+
+        if result["files_modified"]:
+            fingerprints.clear_state(self.root)
+
+        result["success"] = not result["errors"]
         return result
 
-    result["backup_dir"] = backup_dir
+    @locking.locked
+    def upgrade(self) -> UpgradeResult:
+        """Replace outdated directives in the project's command files.
+
+        See upgrade_spec_kit() for the result.
+        """
+        result: UpgradeResult = {
+            "success": False,
+            "files_upgraded": [],
+            "up_to_date": [],
+            "errors": [],
+        }
 
-    # Restore files
-    restore_result = restore_files(backup_dir, project_root)
+        if not self.spec_kit_detected:
+            result["errors"].append(SPEC_KIT_MISSING_ERROR)
+            return result
+
+        self.recover()
+
+        for filename, directive in COMMAND_DIRECTIVES.items():
+            with trace.span("upgrade_directive", file=filename) as span:
+                try:
+                    status = upgrade_directive(self.command_path(filename), directive)
+                except (OSError, ValueError) as e:
+                    result["errors"].append(f"Failed to upgrade {filename}: {str(e)}")
+                    continue
+                span.set(status=status)
+            if status == DIRECTIVE_OUTDATED:
+                result["files_upgraded"].append(filename)
+            elif status == DIRECTIVE_CURRENT:
+                result["up_to_date"].append(filename)
+            elif status == DIRECTIVE_MISSING:
+                result["errors"].append(f"{filename} is not integrated")
+            else:
+                result["errors"].append(f"{filename} not found")
+
+        if result["files_upgraded"]:
+            fingerprints.clear_state(self.root)
+
+        result["success"] = not result["errors"]
+        return result
 
-    result["files_restored"] = restore_result["files_restored"]
-    result["errors"].extend(restore_result["errors"])
-    result["success"] = restore_result["success"]
+    def preview(self, force: bool = False, diff: bool = False) -> PreviewResult:
+        """Work out what integrate() would change, without writing.
+
+        See preview_spec_kit() for the arguments and result.
+        """
+        result: PreviewResult = {
+            "success": False,
+            "would_modify": [],
+            "unchanged": [],
+            "errors": [],
+            "diff": "" if diff else None,
+        }
 
-    return result
+        if not self.agents_installed:
+            result["errors"].append(AGENT_MISSING_ERROR)
+            return result
+        if not self.spec_kit_detected:
+            result["errors"].append(SPEC_KIT_MISSING_ERROR)
+            return result
+
+        if not force:
+            with trace.span("fingerprint_cache") as span:
+                cached = _cached_integration(self.root, restamp=False)
+                span.set(hit=cached is not None)
+            if cached is not None:
+                result["success"] = True
+                result["unchanged"] = list(cached["files_modified"])
+                return result
+
+        diffs = []
+        for filename, directive in COMMAND_DIRECTIVES.items():
+            filepath = self.command_path(filename)
+            label = filepath.relative_to(self.root).as_posix() if diff else None
+            with trace.span("preview_directive", file=filename):
+                preview = preview_directive(filepath, directive, label)
+            if not preview["exists"]:
+                result["errors"].append(f"{filename} not found")
+            elif preview["changed"]:
+                result["would_modify"].append(filename)
+                if preview["diff"]:
+                    diffs.append(preview["diff"])
+            else:
+                result["unchanged"].append(filename)
+
+        result["success"] = not result["errors"]
+        if diff:
+            result["diff"] = "".join(diffs)
+        return result
+
+    def find_backup(self, n: int = 0) -> Optional[Path]:
+        """Find the n-th most recent backup (0 = latest), or None."""
+        name = backups.backup_name_at(self.root, n)
+        return self.root / name if name else None
+
+    def list_backups(self) -> list[Path]:
+        """List backup directories (including packed backups), newest first."""
+        return [self.root / name for name in backups.list_backup_names(self.root)]
+
+    def resolve_backup(self, ref: str) -> Optional[Path]:
+        """Find a backup by ID or age (see resolve_backup()), or None.
+
+        Raises:
+            ValueError: If ref is a leading part of several backup IDs.
+        """
+        name = backups.resolve_backup_name(self.root, ref)
+        return self.root / name if name else None
+
+    @locking.locked
+    def restore(
+        self, backup_dir: Path, files: Optional[Iterable[str]] = None
+    ) -> RestoreResult:
+        """Restore command files from a backup directory or packed backup.
+
+        See restore_files() for the arguments and result.
+        """
+        result: RestoreResult = {
+            "success": False,
+            "files_restored": [],
+            "files_unchanged": [],
+            "errors": []
+        }
+        wanted = None if files is None else list(dict.fromkeys(files))
+
+        # Settle an interrupted integration first, or a later run could
+        # replay it over the restored files
+        self.recover()
+
+        if not backup_dir.exists():
+            if backup_dir.name in backups.list_packed_names(self.root):
+                store = self.root / backups.STORE_DIR
+                with tempfile.TemporaryDirectory(dir=store) as tmp:
+                    unpacked = Path(tmp) / backup_dir.name
+                    with trace.span("unpack_backup"):
+                        found = backups.unpack_backup(
+                            self.root, backup_dir.name, unpacked
+                        )
+                    if found:
+                        return self.restore(unpacked, wanted)
+            result["errors"].append(f"Backup directory not found: {backup_dir}")
+            return result
+
+        # Backups with a manifest restore from the object store when the
+        # backup directory's own copy is gone; legacy backups are plain copies
+        manifest = backups.read_manifest(backup_dir)
+        sources: dict[str, tuple[Path, Optional[str]]] = {}
+        if manifest is not None:
+            for filename, digest in manifest["files"].items():
+                source = backup_dir / filename
+                if not source.exists():
+                    source = backups.object_path(self.root, digest)
+                sources[filename] = (source, digest)
+        else:
+            for backup_file in backup_dir.glob("*.md"):
+                sources[backup_file.name] = (backup_file, None)
+
+        if wanted is not None:
+            # Refuse unknown names before touching any file
+            unknown = [f for f in wanted if f not in sources]
+            if unknown:
+                result["errors"].extend(
+                    f"{filename} is not in the backup" for filename in unknown
+                )
+                return result
+            sources = {f: sources[f] for f in wanted}
+
+        # Restore each file that differs from its backup copy
+        state = fingerprints.load_state(self.root)
+        with trace.span("restore_files") as span:
+            for filename, (source, expected) in sources.items():
+                target = self.command_path(filename)
+                try:
+                    if _matches_backup(target, source, expected, state):
+                        result["files_unchanged"].append(filename)
+                        continue
+                    shutil.copy2(source, target)
+                    result["files_restored"].append(filename)
+                except Exception as e:
+                    result["errors"].append(
+                        f"Failed to restore {filename}: {str(e)}"
+                    )
+            if span:
+                span.set(
+                    files=len(result["files_restored"]),
+                    unchanged=len(result["files_unchanged"]),
+                    bytes=sum(
+                        self.command_path(f).stat().st_size
+                        for f in result["files_restored"]
+                    ),
+                )
+
+        if result["files_restored"]:
+            fingerprints.clear_state(self.root)
+
+        if (
+            result["files_restored"] or result["files_unchanged"]
+        ) and not result["errors"]:
+            result["success"] = True
+
+        return result
+
+    @locking.locked
+    def rollback(
+        self,
+        n: int = 0,
+        files: Optional[Iterable[str]] = None,
+        to: Optional[str] = None,
+    ) -> RollbackResult:
+        """Restore the most recent backup, or an older one.
+
+        See rollback_integration() for the arguments and result.
+        """
+        result: RollbackResult = {
+            "success": False,
+            "backup_dir": None,
+            "files_restored": [],
+            "files_unchanged": [],
+            "errors": []
+        }
+
+        # Find requested backup
+        if to is not None:
+            with trace.span("find_backup", to=to):
+                try:
+                    backup_dir = self.resolve_backup(to)
+                except ValueError as e:
+                    result["errors"].append(str(e))
+                    return result
+            if not backup_dir:
+                result["errors"].append(f"No backup matches {to!r}.")
+                return result
+        else:
+            with trace.span("find_backup", n=n):
+                backup_dir = self.find_backup(n)
+            if not backup_dir:
+                if n == 0:
+                    result["errors"].append("No backup found. Nothing to rollback.")
+                else:
+                    result["errors"].append(f"No backup #{n + 1} found.")
+                return result
+
+        result["backup_dir"] = backup_dir
+
+        # Restore files
+        restore_result = self.restore(backup_dir, files)
+
+        result["files_restored"] = restore_result["files_restored"]
+        result["files_unchanged"] = restore_result["files_unchanged"]
+        result["errors"].extend(restore_result["errors"])
+        result["success"] = restore_result["success"]
+
+        return result
+
+
+# Directory names never descended into when discovering projects
+DISCOVERY_PRUNE_DIRS = frozenset({
+    ".git",
+    ".hg",
+    ".svn",
+    ".claude",
+    ".specify",
+    ".pantheon",
+    "node_modules",
+    "__pycache__",
+    ".venv",
+    "venv",
+    ".tox",
+    ".nox",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".ruff_cache",
+})
+
+
+def list_subdirectories(path: str) -> tuple[set[str], list[str]]:
+    """Read one directory of a discovery walk with a single os.scandir().
+
+    Args:
+        path: Directory to read.
+
+    Returns:
+        Names of all subdirectories (for project detection), and paths of
+        the subdirectories to descend into, in scandir order. Pruned
+        directories and symlinks are not descended into; unreadable
+        directories yield (set(), []).
+    """
+    subdirs = []
+    names = set()
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                except OSError:
+                    continue
+                names.add(entry.name)
+                if entry.name not in DISCOVERY_PRUNE_DIRS:
+                    subdirs.append(entry.path)
+    except OSError:
+        return set(), []
+    return names, subdirs
+
+
+def is_spec_kit_root(path: str, subdir_names: Container[str]) -> bool:
+    """Apply the verify_spec_kit() rule to a directory being walked.
+
+    Args:
+        path: Directory to check.
+        subdir_names: Names of its subdirectories, from list_subdirectories().
+
+    Returns:
+        True if path contains both .specify/ and .claude/commands/.
+    """
+    return (
+        ".specify" in subdir_names
+        and ".claude" in subdir_names
+        and os.path.isdir(os.path.join(path, ".claude", "commands"))
+    )
+
+
+def inspect_directory(path: str) -> tuple[bool, list[str]]:
+    """Read one directory of a discovery walk.
+
+    Args:
+        path: Directory to read.
+
+    Returns:
+        Whether path is a Spec Kit project root, and the subdirectories
+        to descend into (see list_subdirectories()).
+    """
+    names, subdirs = list_subdirectories(path)
+    return is_spec_kit_root(path, names), subdirs
+
+
+def discover_spec_kit_projects(base_dir: Optional[Path] = None) -> Iterator[Path]:
+    """Lazily walk a directory tree and yield every Spec Kit project root.
+
+    A directory is a project root under the same rule as verify_spec_kit():
+    it contains both .specify/ and .claude/commands/. Symlinks are not followed
+    and VCS, dependency and virtualenv directories are pruned.
+
+    Args:
+        base_dir: Directory to start from. Defaults to current directory.
+
+    Yields:
+        Path of each project root, in depth-first order.
+    """
+    if base_dir is None:
+        base_dir = Path.cwd()
+
+    stack = [str(base_dir)]
+    while stack:
+        current = stack.pop()
+        is_project, subdirs = inspect_directory(current)
+        if is_project:
+            yield Path(current)
+
+        # Reverse so siblings come out in scandir order
+        stack.extend(reversed(subdirs))
+
+
+def _integrate_root(
+    project_root: Path, force: bool = False, verify_on_disk: bool = False
+) -> tuple[Path, IntegrationResult]:
+    """Integrate a single root for integrate_spec_kit_batch() workers."""
+    try:
+        with trace.span("integrate_root", root=str(project_root)):
+            return project_root, integrate_spec_kit(
+                project_root, force=force, verify_on_disk=verify_on_disk
+            )
+    except Exception as e:
+        result: IntegrationResult = {
+            "success": False,
+            "backup_dir": None,
+            "files_modified": [],
+            "errors": [f"Integration failed: {str(e)}"],
+            "validation": {"valid": False, "errors": [], "files_checked": []}
+        }
+        return project_root, result
+
+
+def integrate_spec_kit_batch(
+    project_roots: Iterable[Path],
+    max_workers: Optional[int] = None,
+    executor: str = "process",
+    force: bool = False,
+    verify_on_disk: bool = False,
+) -> Iterator[tuple[Path, IntegrationResult]]:
+    """Integrate many project roots concurrently, streaming results.
+
+    Roots are pulled from ``project_roots`` lazily and at most a small,
+    fixed number of them are in flight at once, so memory stays flat no
+    matter how many roots the iterable produces.
+
+    Args:
+        project_roots: Project roots to integrate (any iterable, e.g. the
+            generator returned by discover_spec_kit_projects()).
+        max_workers: Pool size. Defaults to the number of CPUs.
+        executor: "process" for a process pool, "thread" for a thread pool.
+        force: Ignore each project's fingerprint cache (see integrate_spec_kit()).
+        verify_on_disk: Re-read files after writing (see integrate_spec_kit()).
+
+    Yields:
+        (project_root, IntegrationResult) tuples in completion order.
+
+    Raises:
+        ValueError: If executor is not "process" or "thread".
+    """
+    work = functools.partial(
+        _integrate_root, force=force, verify_on_disk=verify_on_disk
+    )
+    yield from _run_batch(project_roots, work, max_workers, executor)
+
+
+def _run_batch(
+    project_roots: Iterable[Path],
+    work: Callable[[Path], R],
+    max_workers: Optional[int],
+    executor: str,
+) -> Iterator[R]:
+    """Run work over project roots on a bounded pool, in completion order."""
+    if executor not in ("process", "thread"):
+        raise ValueError(f"Unknown executor: {executor}")
+
+    workers = max_workers or os.cpu_count() or 1
+    max_in_flight = workers * 2
+    pool: Executor = (
+        ProcessPoolExecutor(max_workers=workers)
+        if executor == "process"
+        else ThreadPoolExecutor(max_workers=workers)
+    )
+
+    with pool:
+        yield from imap_unordered(
+            pool, work, (Path(root) for root in project_roots), max_in_flight
+        )
+
+
+def _preview_root(
+    project_root: Path, force: bool = False, diff: bool = False
+) -> tuple[Path, PreviewResult]:
+    """Preview a single root for preview_spec_kit_batch() workers."""
+    try:
+        with trace.span("preview_root", root=str(project_root)):
+            return project_root, preview_spec_kit(
+                project_root, force=force, diff=diff
+            )
+    except Exception as e:
+        result: PreviewResult = {
+            "success": False,
+            "would_modify": [],
+            "unchanged": [],
+            "errors": [f"Preview failed: {str(e)}"],
+            "diff": None,
+        }
+        return project_root, result
+
+
+def preview_spec_kit_batch(
+    project_roots: Iterable[Path],
+    max_workers: Optional[int] = None,
+    executor: str = "process",
+    force: bool = False,
+    diff: bool = False,
+) -> Iterator[tuple[Path, PreviewResult]]:
+    """Preview integration of many project roots concurrently, streaming results.
+
+    The read-only counterpart of integrate_spec_kit_batch(), with the same
+    bounded number of roots in flight.
+
+    Args:
+        project_roots: Project roots to preview.
+        max_workers: Pool size. Defaults to the number of CPUs.
+        executor: "process" for a process pool, "thread" for a thread pool.
+        force: Ignore each project's fingerprint cache.
+        diff: Render a unified diff per project (see preview_spec_kit()).
+
+    Yields:
+        (project_root, PreviewResult) tuples in completion order.
+
+    Raises:
+        ValueError: If executor is not "process" or "thread".
+    """
+    work = functools.partial(_preview_root, force=force, diff=diff)
+    yield from _run_batch(project_roots, work, max_workers, executor)
+
+
+def _unintegrate_root(project_root: Path) -> tuple[Path, UnintegrationResult]:
+    """Unintegrate a single root for unintegrate_spec_kit_batch() workers."""
+    try:
+        with trace.span("unintegrate_root", root=str(project_root)):
+            return project_root, unintegrate_spec_kit(project_root)
+    except Exception as e:
+        result: UnintegrationResult = {
+            "success": False,
+            "files_modified": [],
+            "errors": [f"Unintegration failed: {str(e)}"],
+        }
+        return project_root, result
+
+
+def unintegrate_spec_kit_batch(
+    project_roots: Iterable[Path],
+    max_workers: Optional[int] = None,
+    executor: str = "process",
+) -> Iterator[tuple[Path, UnintegrationResult]]:
+    """Unintegrate many project roots concurrently, streaming results.
+
+    Runs with the same bounded number of roots in flight as
+    integrate_spec_kit_batch().
+
+    Args:
+        project_roots: Project roots to unintegrate.
+        max_workers: Pool size. Defaults to the number of CPUs.
+        executor: "process" for a process pool, "thread" for a thread pool.
+
+    Yields:
+        (project_root, UnintegrationResult) tuples in completion order.
+
+    Raises:
+        ValueError: If executor is not "process" or "thread".
+    """
+    yield from _run_batch(project_roots, _unintegrate_root, max_workers, executor)
+
+
+def _upgrade_root(project_root: Path) -> tuple[Path, UpgradeResult]:
+    """Upgrade a single root for upgrade_spec_kit_batch() workers."""
+    try:
+        with trace.span("upgrade_root", root=str(project_root)):
+            return project_root, upgrade_spec_kit(project_root)
+    except Exception as e:
+        result: UpgradeResult = {
+            "success": False,
+            "files_upgraded": [],
+            "up_to_date": [],
+            "errors": [f"Upgrade failed: {str(e)}"],
+        }
+        return project_root, result
+
+
+def upgrade_spec_kit_batch(
+    project_roots: Iterable[Path],
+    max_workers: Optional[int] = None,
+    executor: str = "process",
+) -> Iterator[tuple[Path, UpgradeResult]]:
+    """Upgrade directives in many project roots concurrently, streaming results.
+
+    Runs with the same bounded number of roots in flight as
+    integrate_spec_kit_batch().
+
+    Args:
+        project_roots: Project roots to upgrade.
+        max_workers: Pool size. Defaults to the number of CPUs.
+        executor: "process" for a process pool, "thread" for a thread pool.
+
+    Yields:
+        (project_root, UpgradeResult) tuples in completion order.
+
+    Raises:
+        ValueError: If executor is not "process" or "thread".
+    """
+    yield from _run_batch(project_roots, _upgrade_root, max_workers, executor)
@@ -0,0 +1,352 @@
+"""Write-ahead journal making multi-file command updates all-or-nothing.
+
+integrate stages each command file's new content in a temporary file next
+to it, then commits them together:
+
+1. Staged files are fsynced.
+2. .pantheon/journal.json is written and fsynced, naming each target, its
+   staged file and the SHA-256 of its content before and after.
+3. Every staged file is moved into place with os.replace().
+4. The journal is deleted.
+
+If a commit fails part-way, the files already replaced are put back from
+the object store, where create_backup() keeps their original content. If
+the process dies instead, the journal survives and recover() finishes the
+job on the next run: the commit is replayed when every staged file is
+intact, and undone otherwise. Either way only the files named in the
+journal are touched. A run that dies while staging, before step 2,
+leaves only staging files behind; discard_staging() deletes them.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from types import TracebackType
+from typing import Optional, TypedDict
+
+from pantheon import backups
+
+JOURNAL_NAME = "journal.json"
+JOURNAL_VERSION = 1
+
+
+class JournalEntry(TypedDict):
+    """Type for one file replacement recorded in the journal."""
+
+    file: str
+    staged: str
+    before: str
+    after: str
+
+
+class RecoveryResult(TypedDict):
+    """Type for the outcome of recovering an interrupted commit."""
+
+    action: Optional[str]
+    files: list[str]
+    errors: list[str]
+
+
+def journal_path(project_root: Path) -> Path:
+    """Return the path of a project's journal."""
+    return project_root / backups.STORE_DIR / JOURNAL_NAME
+
+
+def has_journal(project_root: Path) -> bool:
+    """True if a commit was interrupted and recover() has work to do."""
+    return journal_path(project_root).exists()
+
+
+def _fsync_dir(path: Path) -> None:
+    """Make renames and unlinks in a directory durable (POSIX only)."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _write_journal(project_root: Path, entries: list[JournalEntry]) -> None:
+    path = journal_path(project_root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = json.dumps({"version": JOURNAL_VERSION, "entries": entries}).encode()
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+    _fsync_dir(path.parent)
+
+
+def read_journal(project_root: Path) -> Optional[list[JournalEntry]]:
+    """Read the entries of an interrupted commit.
+
+    Returns:
+        The journal entries, or None if there is no readable journal.
+    """
+    try:
+        data = json.loads(journal_path(project_root).read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != JOURNAL_VERSION:
+        return None
+    if not isinstance(data.get("entries"), list):
+        return None
+
+    entries: list[JournalEntry] = []
+    for raw in data["entries"]:
+        if not isinstance(raw, dict):
+            return None
+        entries.append({
+            "file": str(raw.get("file", "")),
+            "staged": str(raw.get("staged", "")),
+            "before": str(raw.get("before", "")),
+            "after": str(raw.get("after", "")),
+        })
+        if not all(entries[-1].values()):
+            return None
+    return entries
+
+
+def discard_staging(directory: Path) -> list[str]:
+    """Delete staging files (``.<name>.*.tmp``) left in a directory.
+
+    A run that dies before writing its journal leaves its staged files
+    behind with nothing naming them. Call this after recover(), holding
+    the project lock, so no commit is being staged meanwhile.
+
+    Args:
+        directory: Directory the staged files were written to.
+
+    Returns:
+        Names of the deleted files.
+    """
+    discarded: list[str] = []
+    try:
+        candidates = sorted(directory.glob(".*.tmp"))
+    except OSError:
+        return discarded
+    for path in candidates:
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        discarded.append(path.name)
+    if discarded:
+        _fsync_dir(directory)
+    return discarded
+
+
+def _clear_journal(project_root: Path) -> None:
+    path = journal_path(project_root)
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        return
+    _fsync_dir(path.parent)
+
+
+def _digest(path: Path) -> Optional[str]:
+    try:
+        return backups.hash_file(path)
+    except OSError:
+        return None
+
+
+def _put_back(project_root: Path, target: Path, digest: str) -> None:
+    """Atomically restore target's content from the object store."""
+    source = backups.object_path(project_root, digest)
+    fd, tmp_name = tempfile.mkstemp(
+        dir=target.parent, prefix=f".{target.name}.", suffix=".tmp"
+    )
+    os.close(fd)
+    try:
+        with open(source, "rb") as src, open(tmp_name, "wb") as dst:
+            while True:
+                chunk = src.read(64 * 1024)
+                if not chunk:
+                    break
+                dst.write(chunk)
+            dst.flush()
+            os.fsync(dst.fileno())
+        if target.exists():
+            os.chmod(tmp_name, target.stat().st_mode & 0o7777)
+        os.replace(tmp_name, target)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+class Transaction:
+    """Replace several files with staged content, all or nothing.
+
+    Used as a context manager: staged files are discarded if the block
+    raises before commit().
+    """
+
+    def __init__(self, project_root: Path) -> None:
+        self.root = project_root
+        self.entries: list[JournalEntry] = []
+        self.committed = False
+
+    def __enter__(self) -> "Transaction":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        if not self.committed:
+            self.abort()
+
+    def stage(self, target: Path, staged: Path, before: str, after: str) -> None:
+        """Add a replacement of target by an already-written staged file.
+
+        Args:
+            target: File to replace.
+            staged: Fsynced file holding the new content, in the same
+                directory as target.
+            before: SHA-256 of target's current content, which is added to
+                the object store (if create_backup() has not already) so a
+                failed commit can restore it.
+            after: SHA-256 of the staged content.
+        """
+        if not backups.object_path(self.root, before).exists():
+            backups.store_object(self.root, target)
+        self.entries.append({
+            "file": os.path.relpath(target, self.root),
+            "staged": os.path.relpath(staged, self.root),
+            "before": before,
+            "after": after,
+        })
+
+    def commit(self) -> None:
+        """Journal the staged replacements, then apply them.
+
+        Raises:
+            OSError: If a replacement fails. Files already replaced are put
+                back first, so the project is left as it was.
+        """
+        if not self.entries:
+            self.committed = True
+            return
+
+        _write_journal(self.root, self.entries)
+        done: list[JournalEntry] = []
+        try:
+            for entry in self.entries:
+                os.replace(self.root / entry["staged"], self.root / entry["file"])
+                done.append(entry)
+            for directory in {(self.root / e["file"]).parent for e in done}:
+                _fsync_dir(directory)
+        except BaseException:
+            # If putting a file back fails too, the journal stays and
+            # recover() finishes the undo on the next run
+            for entry in reversed(done):
+                _put_back(self.root, self.root / entry["file"], entry["before"])
+            self.abort()
+            _clear_journal(self.root)
+            raise
+        self.committed = True
+        _clear_journal(self.root)
+
+    def abort(self) -> None:
+        """Discard staged files that were not moved into place."""
+        for entry in self.entries:
+            try:
+                (self.root / entry["staged"]).unlink()
+            except FileNotFoundError:
+                pass
+
+
+def recover(project_root: Path) -> RecoveryResult:
+    """Finish or undo a commit interrupted by a crash.
+
+    The commit is replayed if every file is either already replaced or has
+    its staged content intact. Otherwise the files already replaced are
+    restored from the object store. Files whose content matches neither
+    side of the journal were changed by something else since the crash
+    and are left alone.
+
+    Args:
+        project_root: Root directory of the project. The caller holds the
+            project lock.
+
+    Returns:
+        Dictionary describing the recovery:
+        {
+            "action": "replayed", "undone", or None if nothing was pending,
+            "files": list of files (relative to the root) written,
+            "errors": list of error messages
+        }
+    """
+    result: RecoveryResult = {"action": None, "files": [], "errors": []}
+    if not has_journal(project_root):
+        return result
+
+    entries = read_journal(project_root)
+    if entries is None:
+        result["errors"].append("Unreadable journal discarded")
+        _clear_journal(project_root)
+        return result
+
+    states = []
+    for entry in entries:
+        current = _digest(project_root / entry["file"])
+        if current == entry["after"]:
+            states.append("committed")
+        elif current != entry["before"]:
+            states.append("unknown")
+        elif _digest(project_root / entry["staged"]) == entry["after"]:
+            states.append("staged")
+        else:
+            states.append("original")
+
+    if all(state in ("committed", "staged") for state in states):
+        result["action"] = "replayed"
+        for entry, state in zip(entries, states):
+            if state == "staged":
+                os.replace(
+                    project_root / entry["staged"], project_root / entry["file"]
+                )
+                result["files"].append(entry["file"])
+    else:
+        result["action"] = "undone"
+        for entry, state in zip(entries, states):
+            if state == "committed":
+                try:
+                    _put_back(
+                        project_root, project_root / entry["file"], entry["before"]
+                    )
+                    result["files"].append(entry["file"])
+                except OSError as e:
+                    result["errors"].append(
+                        f"Failed to restore {entry['file']}: {str(e)}"
+                    )
+            elif state == "unknown":
+                result["errors"].append(
+                    f"{entry['file']} changed since the interrupted run; left as is"
+                )
+
+    for entry in entries:
+        try:
+            (project_root / entry["staged"]).unlink()
+        except FileNotFoundError:
+            pass
+    for directory in {(project_root / e["file"]).parent for e in entries}:
+        _fsync_dir(directory)
+    _clear_journal(project_root)
+    return result
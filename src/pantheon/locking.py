@@ -0,0 +1,189 @@
+"""Per-project advisory locks, so Pantheon operations can run in parallel.
+
+Every operation that writes a project's command files, backups or object
+store holds an exclusive flock(2) on .pantheon/lock in the project root
+for its duration. Operations on different projects never wait for each
+other; operations on the same project, from any number of processes or
+threads, run one at a time.
+
+Locks are reentrant within a thread, so a locked operation may call others
+(integrate creates a backup, rollback restores one). On platforms without
+fcntl, and in projects where the lock file cannot be created (read-only
+trees, where nothing can be written anyway), operations run unlocked.
+
+On release, the lock file records when it was last held (see last_hold()),
+so a file watcher can tell changes made by a Pantheon operation from
+changes made by other tools.
+"""
+
+import functools
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Optional, TypeVar
+
+from pantheon.backups import STORE_DIR
+
+LOCK_NAME = "lock"
+
+_held = threading.local()
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def lock_path(project_root: Path) -> Path:
+    """Return the path of a project's lock file."""
+    return project_root / STORE_DIR / LOCK_NAME
+
+
+def _held_counts() -> dict[str, int]:
+    counts = getattr(_held, "counts", None)
+    if counts is None:
+        counts = _held.counts = {}
+    return counts
+
+
+def _stamp(fd: int) -> int:
+    """Touch the lock file and return its new ctime.
+
+    File times come from the kernel's filesystem clock, which is coarser
+    than time.time_ns(); stamping the lock file gives hold times directly
+    comparable with the ctimes of files changed under the lock. (ctime,
+    unlike mtime, cannot be set back, e.g. by shutil.copy2().)
+    """
+    try:
+        os.utime(fd)
+        return os.fstat(fd).st_ctime_ns
+    except (OSError, NotImplementedError):
+        return 0
+
+
+def _record_hold(fd: int, acquired_ns: int) -> None:
+    """Write "<acquired_ns> <released_ns>" into the lock file."""
+    record = f"{acquired_ns} {_stamp(fd)}\n".encode()
+    try:
+        os.pwrite(fd, record, 0)
+        os.ftruncate(fd, len(record))
+    except OSError:
+        pass
+
+
+def last_hold(project_root: Path) -> Optional[tuple[int, int]]:
+    """When a project's lock was last acquired and released.
+
+    Times are file ctimes, so a file whose st_ctime_ns falls within the
+    hold was (as far as the filesystem clock can tell) changed while the
+    lock was held. While the lock is held, this is the previous hold.
+
+    Args:
+        project_root: Root directory of the project.
+
+    Returns:
+        (acquired_ns, released_ns), or None if the lock has never been
+        released (or the record is unreadable).
+    """
+    try:
+        acquired, released = lock_path(project_root).read_text().split()
+        hold = int(acquired), int(released)
+    except (OSError, ValueError):
+        return None
+    return hold if all(hold) else None
+
+
+def hold_started(project_root: Path) -> Optional[int]:
+    """When the current hold of a project's lock began, in last_hold() terms.
+
+    Only meaningful while the caller holds the lock.
+    """
+    try:
+        return lock_path(project_root).stat().st_ctime_ns
+    except OSError:
+        return None
+
+
+def _open_lock_file(project_root: Path) -> Optional[int]:
+    path = lock_path(project_root)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    except OSError:
+        return None
+
+
+@contextmanager
+def project_lock(
+    project_root: Path, timeout: Optional[float] = None
+) -> Iterator[None]:
+    """Hold the project's exclusive lock for the duration of the block.
+
+    Args:
+        project_root: Root directory of the project.
+        timeout: Seconds to wait for another holder before giving up.
+            Defaults to waiting indefinitely.
+
+    Raises:
+        TimeoutError: If the lock was not acquired within timeout.
+    """
+    try:
+        import fcntl
+    except ImportError:
+        yield
+        return
+
+    key = os.path.realpath(project_root)
+    counts = _held_counts()
+    if counts.get(key):
+        counts[key] += 1
+        try:
+            yield
+        finally:
+            counts[key] -= 1
+        return
+
+    fd = _open_lock_file(project_root)
+    if fd is None:
+        yield
+        return
+
+    try:
+        if timeout is None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        else:
+            deadline = time.monotonic() + timeout
+            delay = 0.001
+            while True:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    if time.monotonic() >= deadline:
+                        raise TimeoutError(
+                            f"Timed out waiting for the lock on {project_root}"
+                        ) from None
+                    time.sleep(delay)
+                    delay = min(delay * 2, 0.1)
+
+        acquired_ns = _stamp(fd)
+        counts[key] = 1
+        try:
+            yield
+        finally:
+            del counts[key]
+            _record_hold(fd, acquired_ns)
+    finally:
+        # Closing the descriptor releases the lock
+        os.close(fd)
+
+
+def locked(method: F) -> F:
+    """Run a method of an object with a .root while holding its project lock."""
+
+    @functools.wraps(method)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        with project_lock(self.root):
+            return method(self, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
@@ -0,0 +1,134 @@
+"""Machine-readable command output selected with ``pantheon --output``.
+
+Commands write human text through Reporter.echo() and structured data
+through Reporter.progress() and Reporter.result(). In the default "text"
+mode only the text is shown. The structured modes print no text:
+
+- "ndjson" prints one JSON object per line as it happens:
+  ``{"schema": 1, "type": "progress", "command": ..., "event": ..., ...}``
+  for progress events and
+  ``{"schema": 1, "type": "result", "command": ..., "result": {...}}``
+  for the final result.
+- "json" prints a single document when the command finishes:
+  ``{"schema": 1, "command": ..., "events": [...], "result": {...}}``,
+  where each event is ``{"event": ..., ...}``.
+
+Result objects are the library's result dictionaries (IntegrationResult,
+RollbackResult, ...) with paths rendered as strings.
+"""
+
+import json
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Optional, TextIO
+
+import click
+
+OUTPUT_FORMATS = ("text", "ndjson", "json")
+SCHEMA_VERSION = 1
+
+_REPORTER_KEY = "pantheon.reporter"
+
+
+def to_jsonable(value: Any) -> Any:
+    """Convert result dictionaries (with Paths, tuples, sets) to JSON types."""
+    if isinstance(value, Path):
+        return str(value)
+    if isinstance(value, Mapping):
+        return {str(k): to_jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_jsonable(v) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted(to_jsonable(v) for v in value)
+    return value
+
+
+class Reporter:
+    """Routes a command's output to text or structured records."""
+
+    def __init__(
+        self, output_format: str, command: str, stream: Optional[TextIO] = None
+    ) -> None:
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unknown output format: {output_format}")
+        self.format = output_format
+        self.command = command
+        self.stream = stream
+        self.events: list[dict[str, Any]] = []
+        self._result: Optional[dict[str, Any]] = None
+
+    @property
+    def structured(self) -> bool:
+        """True when text is suppressed in favour of JSON records."""
+        return self.format != "text"
+
+    def echo(self, message: str = "") -> None:
+        """Print human-readable text (text mode only)."""
+        if not self.structured:
+            click.echo(message, file=self.stream)
+
+    def _emit(self, record: dict[str, Any]) -> None:
+        click.echo(
+            json.dumps({"schema": SCHEMA_VERSION, **record}), file=self.stream
+        )
+
+    def progress(self, event: str, **fields: Any) -> None:
+        """Report a progress event (structured modes only)."""
+        if not self.structured:
+            return
+        data = {"event": event, **to_jsonable(fields)}
+        if self.format == "ndjson":
+            self._emit({"type": "progress", "command": self.command, **data})
+        else:
+            self.events.append(data)
+
+    def result(self, data: Mapping[str, Any]) -> None:
+        """Report the command's result (structured modes only)."""
+        if not self.structured:
+            return
+        self._result = to_jsonable(data)
+        if self.format == "ndjson":
+            self._emit(
+                {"type": "result", "command": self.command, "result": self._result}
+            )
+
+    def finish(self) -> None:
+        """Print the collected JSON document (json mode only)."""
+        if self.format == "json":
+            self._emit(
+                {
+                    "command": self.command,
+                    "events": self.events,
+                    "result": self._result,
+                }
+            )
+
+
+def reporter() -> Reporter:
+    """Return the Reporter for the currently running command.
+
+    The format comes from the global --output option. In json mode the
+    document is printed when the command's context closes. Output goes to
+    stdout unless the root context's obj names another "stream" (as the
+    daemon does to capture a forwarded command's output).
+    """
+    ctx = click.get_current_context()
+    existing = ctx.meta.get(_REPORTER_KEY)
+    if isinstance(existing, Reporter):
+        return existing
+
+    root = ctx.find_root()
+    obj = root.obj or {}
+    output_format = obj.get("output", "text")
+
+    names = []
+    current: Optional[click.Context] = ctx
+    while current is not None and current.parent is not None:
+        names.append(current.info_name or "")
+        current = current.parent
+    command = " ".join(reversed(names))
+
+    out = Reporter(output_format, command, obj.get("stream"))
+    ctx.meta[_REPORTER_KEY] = out
+    ctx.call_on_close(out.finish)
+    return out
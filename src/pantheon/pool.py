@@ -0,0 +1,51 @@
+"""Streaming helpers for running work over executor pools."""
+
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def imap_unordered(
+    pool: Executor,
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    max_in_flight: int,
+) -> Iterator[R]:
+    """Apply fn to items on pool, yielding results in completion order.
+
+    Items are pulled lazily and at most max_in_flight calls are pending at
+    once, so memory stays flat no matter how many items the iterable yields.
+
+    Args:
+        pool: Executor to submit calls to.
+        fn: Function to call with each item (picklable for process pools).
+        items: Items to process; consumed lazily.
+        max_in_flight: Upper bound on submitted but unfinished calls.
+
+    Yields:
+        fn(item) for each item, as each call finishes.
+    """
+    source = iter(items)
+    pending: set[Future[R]] = set()
+
+    for item in source:
+        pending.add(pool.submit(fn, item))
+        if len(pending) >= max_in_flight:
+            break
+
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        # Refill before yielding so workers stay busy while the caller
+        # handles results
+        for _ in done:
+            try:
+                item = next(source)
+            except StopIteration:
+                break
+            pending.add(pool.submit(fn, item))
+
+        for future in done:
+            yield future.result()
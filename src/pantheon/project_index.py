@@ -0,0 +1,378 @@
+"""Persistent SQLite index of Spec Kit projects for repeated fleet scans.
+
+The index lives in <base>/.pantheon/projects.db and records, relative to
+the scanned base directory:
+
+- every walked directory with its mtime and (non-pruned) subdirectories,
+  so later walks stat() a directory and only re-read it with os.scandir()
+  when its mtime moved;
+- every project root with a fingerprint (size, mtime_ns) and validation
+  outcome per command file, so only command files whose fingerprint moved
+  are re-read.
+
+Paths are stored relative to the base directory, so an index cached by CI
+stays valid when the checkout lands at a different absolute path.
+"""
+
+import json
+import os
+import sqlite3
+import time
+from collections.abc import Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from pathlib import Path
+from types import TracebackType
+from typing import Optional, TypedDict
+
+from pantheon import backups, fingerprints
+from pantheon.integrations.spec_kit import (
+    COMMAND_DIRECTIVES,
+    ValidationResult,
+    directives_digest,
+    is_spec_kit_root,
+    list_subdirectories,
+    validate_command_file,
+    verify_agents_installed,
+)
+from pantheon.scan import ScanRecord
+
+INDEX_NAME = "projects.db"
+INDEX_VERSION = 1
+
+# Subdirectory names that make a directory a candidate project root
+_MARKER_DIRS = frozenset({".specify", ".claude"})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS dirs (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    candidate INTEGER NOT NULL,
+    subdirs TEXT NOT NULL -- child names joined with "/"
+);
+CREATE TABLE IF NOT EXISTS projects (
+    root TEXT PRIMARY KEY,
+    files TEXT NOT NULL,
+    checked_ns INTEGER NOT NULL
+);
+"""
+
+
+class FileState(TypedDict):
+    """Type for the recorded state of one command file in the index."""
+
+    size: int
+    mtime_ns: int
+    error: Optional[str]
+
+
+def index_path(base_dir: Path) -> Path:
+    """Return the default index location for a scanned base directory."""
+    return base_dir / backups.STORE_DIR / INDEX_NAME
+
+
+def _file_key(path: str) -> Optional[tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def _split_names(joined: str) -> list[str]:
+    # Subdirectory names are stored "/"-joined; "/" cannot occur in a name
+    return joined.split("/") if joined else []
+
+
+def _join_rel(rel: str, name: str) -> str:
+    return name if rel == "." else rel + os.sep + name
+
+
+def _matches(
+    state: Optional[FileState], key: Optional[tuple[int, int]], checked_ns: int
+) -> bool:
+    """Whether a recorded file state still describes the file on disk."""
+    if state is None or key is None:
+        return state is None and key is None
+    if key != (state["size"], state["mtime_ns"]):
+        return False
+    # Files modified just before they were checked may change again unseen
+    return checked_ns - key[1] > fingerprints.RACY_WINDOW_NS
+
+
+def _revalidate(
+    project_root: Path, filenames: list[str]
+) -> tuple[Path, dict[str, Optional[FileState]]]:
+    """Re-read the given command files of a project (runs on the pool)."""
+    commands_dir = project_root / ".claude" / "commands"
+    states: dict[str, Optional[FileState]] = {}
+    for filename in filenames:
+        filepath = commands_dir / filename
+        key = _file_key(str(filepath))
+        if key is None:
+            states[filename] = None
+            continue
+        states[filename] = {
+            "size": key[0],
+            "mtime_ns": key[1],
+            "error": validate_command_file(
+                filepath, COMMAND_DIRECTIVES[filename].marker
+            ),
+        }
+    return project_root, states
+
+
+class ProjectIndex:
+    """Incrementally refreshed index of the Spec Kit projects under a directory."""
+
+    def __init__(self, base_dir: Path, path: Optional[Path] = None) -> None:
+        """Open (creating if needed) the index for base_dir.
+
+        Args:
+            base_dir: Directory whose projects are indexed.
+            path: Index database file. Defaults to index_path(base_dir).
+        """
+        self.base_dir = Path(base_dir)
+        self.path = path if path is not None else index_path(self.base_dir)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path)
+        self._db.executescript(_SCHEMA)
+        self._reset_if_incompatible()
+
+    def __enter__(self) -> "ProjectIndex":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Commit pending changes and close the database."""
+        self._db.commit()
+        self._db.close()
+
+    def _meta(self, key: str) -> Optional[str]:
+        row = self._db.execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)
+        ).fetchone()
+        return None if row is None else str(row[0])
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self._db.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+        )
+
+    def _reset_if_incompatible(self) -> None:
+        """Drop stale data after a format or directive registry change."""
+        if self._meta("version") != str(INDEX_VERSION):
+            self._db.execute("DELETE FROM dirs")
+            self._db.execute("DELETE FROM projects")
+            self._set_meta("version", str(INDEX_VERSION))
+
+        digest = directives_digest()
+        if self._meta("directives") != digest:
+            # Markers may have changed: every command file must be re-read
+            self._db.execute("DELETE FROM projects")
+            self._set_meta("directives", digest)
+        self._db.commit()
+
+    def _rel(self, path: str) -> str:
+        rel = os.path.relpath(path, self.base_dir)
+        return "." if rel == os.curdir else rel
+
+    def _forget(self, rel: str) -> None:
+        """Drop a removed directory and everything indexed below it."""
+        prefix = rel + os.sep
+        for table, column in (("dirs", "path"), ("projects", "root")):
+            self._db.execute(
+                f"DELETE FROM {table} WHERE {column} = ? "
+                f"OR substr({column}, 1, ?) = ?",
+                (rel, len(prefix), prefix),
+            )
+
+    def _walk(self, scanned_ns: int) -> Iterator[str]:
+        """Yield project roots, re-reading only directories whose mtime moved.
+
+        An unchanged tree costs one stat() and one index lookup per
+        directory and no writes.
+        """
+        # One query up front is much cheaper than a lookup per directory
+        known = {
+            row[0]: row[1:]
+            for row in self._db.execute(
+                "SELECT path, mtime_ns, candidate, subdirs FROM dirs"
+            )
+        }
+        # (absolute path, path relative to base_dir) pairs, depth-first
+        stack = [(str(self.base_dir), ".")]
+        while stack:
+            current, rel = stack.pop()
+            try:
+                mtime_ns = os.stat(current).st_mtime_ns
+            except OSError:
+                continue
+
+            row = known.get(rel)
+            if row is not None and row[0] == mtime_ns:
+                candidate = bool(row[1])
+                children = _split_names(row[2])
+            else:
+                names, subdirs = list_subdirectories(current)
+                candidate = ".specify" in names and ".claude" in names
+                children = [os.path.basename(d) for d in subdirs]
+                if row is not None:
+                    for removed in set(_split_names(row[2])) - set(children):
+                        self._forget(_join_rel(rel, removed))
+                if not candidate:
+                    self._db.execute("DELETE FROM projects WHERE root = ?", (rel,))
+                # A directory changed just before it was read may change
+                # again without its mtime moving, so it is read next time too
+                recorded_mtime = (
+                    mtime_ns
+                    if scanned_ns - mtime_ns > fingerprints.RACY_WINDOW_NS
+                    else -1
+                )
+                self._db.execute(
+                    "INSERT OR REPLACE INTO dirs VALUES (?, ?, ?, ?)",
+                    (rel, recorded_mtime, int(candidate), "/".join(children)),
+                )
+
+            # .claude/commands/ can appear without the root's mtime moving,
+            # so candidates are re-checked on every walk
+            if candidate:
+                if is_spec_kit_root(current, _MARKER_DIRS):
+                    yield current
+                else:
+                    self._db.execute("DELETE FROM projects WHERE root = ?", (rel,))
+
+            stack.extend(
+                (os.path.join(current, name), _join_rel(rel, name))
+                for name in reversed(children)
+            )
+
+    def _known_roots(self) -> Iterator[str]:
+        rels = [rel for (rel,) in self._db.execute("SELECT root FROM projects")]
+        for rel in sorted(rels):
+            yield os.path.normpath(os.path.join(self.base_dir, rel))
+
+    def _cached_files(
+        self, root: str
+    ) -> tuple[dict[str, Optional[FileState]], list[str]]:
+        """Return recorded file states and the files that must be re-read."""
+        row = self._db.execute(
+            "SELECT files, checked_ns FROM projects WHERE root = ?",
+            (self._rel(root),),
+        ).fetchone()
+        recorded: dict[str, Optional[FileState]] = (
+            json.loads(row[0]) if row is not None else {}
+        )
+        checked_ns = int(row[1]) if row is not None else 0
+
+        commands_dir = os.path.join(root, ".claude", "commands")
+        stale = [
+            filename
+            for filename in COMMAND_DIRECTIVES
+            if filename not in recorded
+            or not _matches(
+                recorded[filename],
+                _file_key(os.path.join(commands_dir, filename)),
+                checked_ns,
+            )
+        ]
+        return recorded, stale
+
+    def _save(
+        self, root: Path, files: dict[str, Optional[FileState]], checked_ns: int
+    ) -> None:
+        self._db.execute(
+            "INSERT OR REPLACE INTO projects VALUES (?, ?, ?)",
+            (self._rel(str(root)), json.dumps(files), checked_ns),
+        )
+
+    @staticmethod
+    def _record(root: Path, files: dict[str, Optional[FileState]]) -> ScanRecord:
+        """Build the scan record for a project from its file states."""
+        validation: ValidationResult = {
+            "valid": True,
+            "errors": [],
+            "files_checked": [],
+        }
+        for filename in COMMAND_DIRECTIVES:
+            validation["files_checked"].append(filename)
+            state = files.get(filename)
+            error = f"{filename} not found" if state is None else state["error"]
+            if error is not None:
+                validation["valid"] = False
+                validation["errors"].append(error)
+
+        return {
+            "project_root": root,
+            "agents_installed": verify_agents_installed(root),
+            "integrated": validation["valid"],
+            "validation": validation,
+        }
+
+    def refresh(
+        self, walk: bool = True, max_workers: Optional[int] = None
+    ) -> Iterator[ScanRecord]:
+        """Bring the index up to date and yield the state of every project.
+
+        Args:
+            walk: Walk the tree for new or removed projects (stat() per
+                directory, scandir() only where the mtime moved). With False,
+                only the projects already in the index are re-checked.
+            max_workers: Threads used to re-read changed command files.
+
+        Yields:
+            ScanRecord for each project; unchanged projects are answered
+            from the index without reading their command files.
+        """
+        checked_ns = time.time_ns()
+        workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        max_in_flight = workers * 2
+
+        roots = self._walk(checked_ns) if walk else self._known_roots()
+        pending: set[Future[tuple[Path, dict[str, Optional[FileState]]]]] = set()
+        recorded: dict[Path, dict[str, Optional[FileState]]] = {}
+
+        def finish(
+            future: Future[tuple[Path, dict[str, Optional[FileState]]]],
+        ) -> ScanRecord:
+            root, fresh = future.result()
+            files = {**recorded.pop(root), **fresh}
+            self._save(root, files, checked_ns)
+            return self._record(root, files)
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for current in roots:
+                    root = Path(current)
+                    files, stale = self._cached_files(current)
+                    if not stale:
+                        yield self._record(root, files)
+                        continue
+
+                    recorded[root] = files
+                    pending.add(pool.submit(_revalidate, root, stale))
+                    if len(pending) >= max_in_flight:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield finish(future)
+
+                for future in as_completed(pending):
+                    yield finish(future)
+        finally:
+            self._db.commit()
@@ -0,0 +1,102 @@
+"""Concurrent scanner reporting the integration state of many Spec Kit projects.
+
+scan_projects() walks a tree with os.scandir() on a thread pool, pruning
+the same directories as discover_spec_kit_projects(), and validates each
+project root on the same pool as soon as it is found. Records are yielded
+in completion order, so callers can stream them (e.g. as NDJSON) while the
+walk is still running.
+"""
+
+import os
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Optional, TypedDict
+
+from pantheon.integrations.spec_kit import (
+    SpecKitProject,
+    ValidationResult,
+    inspect_directory,
+)
+
+
+class ScanRecord(TypedDict):
+    """Type for the integration state of one discovered project."""
+
+    project_root: Path
+    agents_installed: bool
+    integrated: bool
+    validation: ValidationResult
+
+
+def check_project(project_root: Path) -> ScanRecord:
+    """Report the integration state of one Spec Kit project.
+
+    Args:
+        project_root: Root directory of the project.
+
+    Returns:
+        Dictionary with the project's state:
+        {
+            "project_root": Path,
+            "agents_installed": bool,
+            "integrated": bool (every command file carries its directive),
+            "validation": dict from validate_integration()
+        }
+    """
+    project = SpecKitProject(project_root)
+    validation = project.validate()
+    return {
+        "project_root": project_root,
+        "agents_installed": project.agents_installed,
+        "integrated": validation["valid"],
+        "validation": validation,
+    }
+
+
+def scan_projects(
+    base_dir: Optional[Path] = None, max_workers: Optional[int] = None
+) -> Iterator[ScanRecord]:
+    """Find and check every Spec Kit project under base_dir concurrently.
+
+    Directory scans and project checks share one thread pool; os.scandir()
+    and file reads release the GIL, so both overlap. At most a fixed number
+    of tasks are pending, and directories waiting to be scanned are kept
+    depth-first, so memory stays small on very large trees.
+
+    Args:
+        base_dir: Directory to start from. Defaults to current directory.
+        max_workers: Thread pool size. Defaults to the thread pool default.
+
+    Yields:
+        ScanRecord for each project root, in completion order.
+    """
+    if base_dir is None:
+        base_dir = Path.cwd()
+
+    workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+    max_in_flight = workers * 2
+
+    # Directories still to scan, used as a stack for depth-first order
+    frontier = [str(base_dir)]
+    # Pending tasks: directory scans map to their path, project checks to None
+    pending: dict[Future[Any], Optional[str]] = {}
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        while frontier or pending:
+            while frontier and len(pending) < max_in_flight:
+                path = frontier.pop()
+                pending[pool.submit(inspect_directory, path)] = path
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                scanned = pending.pop(future)
+                if scanned is None:
+                    record: ScanRecord = future.result()
+                    yield record
+                    continue
+
+                is_project, subdirs = future.result()
+                if is_project:
+                    pending[pool.submit(check_project, Path(scanned))] = None
+                frontier.extend(reversed(subdirs))
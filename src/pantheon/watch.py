@@ -0,0 +1,371 @@
+"""Watch Spec Kit command files and re-apply directives when they are overwritten.
+
+Spec Kit upgrades (and ``specify init --here``) rewrite .claude/commands/*.md,
+dropping the DEV integration directives. watch_projects() notices those
+rewrites through inotify on Linux, or by polling elsewhere, and re-inserts
+the directive into just the files that changed.
+
+Repairs go through SpecKitProject under the project lock, like any other
+write. Files last changed while another Pantheon operation held the lock
+(a rollback or an unintegrate, say) are left alone: those changes were
+made on purpose. Changes are attributed by comparing file ctimes with the
+lock's last hold (see locking.last_hold()); files the watcher itself just
+repaired are recognized by their exact stat() identity instead.
+"""
+
+import abc
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import NamedTuple, Optional, TypedDict
+
+from pantheon import locking
+from pantheon.integrations.spec_kit import COMMAND_DIRECTIVES, SpecKitProject
+
+# inotify(7) constants
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_WATCH_MASK = (
+    _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_ONLYDIR
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+# How long to block waiting for events while idle, so stop requests and
+# newly created commands directories are noticed
+_IDLE_TIMEOUT = 0.5
+
+
+class RepairEvent(TypedDict):
+    """Type for a watched command file that was re-checked."""
+
+    project_root: Path
+    filename: str
+    changed: bool
+    error: Optional[str]
+
+
+def _commands_dir(project_root: Path) -> Path:
+    return project_root / ".claude" / "commands"
+
+
+class _Backend(abc.ABC):
+    """Source of changed (project_root, filename) pairs."""
+
+    @abc.abstractmethod
+    def add(self, project_root: Path) -> None:
+        """Start watching a project's command files."""
+
+    @abc.abstractmethod
+    def wait(self, timeout: float) -> set[tuple[Path, str]]:
+        """Return files changed since the last call, waiting up to timeout."""
+
+    def close(self) -> None:
+        """Release the backend's resources."""
+
+
+class InotifyBackend(_Backend):
+    """Linux inotify backend, one watch per commands directory."""
+
+    def __init__(self) -> None:
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._roots: dict[int, Path] = {}
+        self._unwatched: set[Path] = set()
+
+    def add(self, project_root: Path) -> None:
+        path = os.fsencode(_commands_dir(project_root))
+        wd = self._libc.inotify_add_watch(self._fd, path, _WATCH_MASK)
+        if wd < 0:
+            # Directory missing for now; retried on every wait()
+            self._unwatched.add(project_root)
+            return
+        self._unwatched.discard(project_root)
+        self._roots[wd] = project_root
+
+    def wait(self, timeout: float) -> set[tuple[Path, str]]:
+        changed: set[tuple[Path, str]] = set()
+
+        # A recreated commands directory is entirely new content
+        for project_root in sorted(self._unwatched):
+            self.add(project_root)
+            if project_root not in self._unwatched:
+                changed.update((project_root, name) for name in COMMAND_DIRECTIVES)
+        if changed:
+            return changed
+
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return changed
+
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0").decode(
+                sys.getfilesystemencoding(), "surrogateescape"
+            )
+            offset += length
+
+            watched_root = self._roots.get(wd)
+            if watched_root is None:
+                continue
+            if mask & (_IN_DELETE_SELF | _IN_MOVE_SELF | _IN_IGNORED):
+                self._roots.pop(wd, None)
+                self._unwatched.add(watched_root)
+            elif name:
+                changed.add((watched_root, name))
+
+        return changed
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class PollingBackend(_Backend):
+    """Portable backend that compares stat() results of command files."""
+
+    def __init__(self, interval: float = 1.0) -> None:
+        self.interval = interval
+        self._snapshot: dict[tuple[Path, str], Optional[tuple[int, int, int]]] = {}
+
+    @staticmethod
+    def _stat(path: Path) -> Optional[tuple[int, int, int]]:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return st.st_ino, st.st_size, st.st_mtime_ns
+
+    def add(self, project_root: Path) -> None:
+        for name in COMMAND_DIRECTIVES:
+            key = (project_root, name)
+            self._snapshot[key] = self._stat(_commands_dir(project_root) / name)
+
+    def wait(self, timeout: float) -> set[tuple[Path, str]]:
+        time.sleep(min(timeout, self.interval))
+
+        changed: set[tuple[Path, str]] = set()
+        for project_root, name in [*self._snapshot]:
+            current = self._stat(_commands_dir(project_root) / name)
+            if current != self._snapshot[(project_root, name)]:
+                self._snapshot[(project_root, name)] = current
+                if current is not None:
+                    changed.add((project_root, name))
+        return changed
+
+
+def create_backend(backend: str = "auto", poll_interval: float = 1.0) -> _Backend:
+    """Create a change-notification backend.
+
+    Args:
+        backend: "inotify", "poll", or "auto" (inotify when available).
+        poll_interval: Seconds between scans for the polling backend.
+
+    Returns:
+        The backend instance.
+
+    Raises:
+        ValueError: If backend is not a known name.
+        OSError: If "inotify" is requested but unavailable.
+    """
+    if backend not in ("auto", "inotify", "poll"):
+        raise ValueError(f"Unknown watch backend: {backend}")
+
+    if backend in ("auto", "inotify") and sys.platform.startswith("linux"):
+        try:
+            return InotifyBackend()
+        except (OSError, AttributeError):
+            if backend == "inotify":
+                raise
+    elif backend == "inotify":
+        raise OSError("inotify is only available on Linux")
+
+    return PollingBackend(poll_interval)
+
+
+# (st_ino, st_size, st_ctime_ns) of a command file
+_FileId = tuple[int, int, int]
+
+
+class _OwnHold(NamedTuple):
+    """The watcher's latest hold of a project lock, and what it left behind."""
+
+    acquired: Optional[int]
+    previous: Optional[tuple[int, int]]
+    files: dict[str, Optional[_FileId]]
+
+
+def _file_id(path: Path) -> Optional[_FileId]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_ino, st.st_size, st.st_ctime_ns
+
+
+def _changed_under_lock(
+    file_id: Optional[_FileId],
+    filename: str,
+    hold: Optional[tuple[int, int]],
+    own: Optional[_OwnHold],
+) -> bool:
+    """Whether a command file was last changed by a Pantheon operation."""
+    if file_id is None:
+        return False
+    if own is not None and hold is not None and hold[0] == own.acquired:
+        # The last hold was the watcher's own: anything it did not leave
+        # exactly so was changed since
+        if filename in own.files:
+            return file_id == own.files[filename]
+        hold = own.previous
+    if hold is None:
+        return False
+    acquired, released = hold
+    return acquired <= file_id[2] <= released
+
+
+def _repair(
+    project_root: Path,
+    filenames: Iterable[str],
+    own: Optional[_OwnHold] = None,
+    skip_locked_changes: bool = True,
+) -> tuple[list[RepairEvent], _OwnHold]:
+    """Re-apply the registered directives to command files of one project.
+
+    Holds the project lock throughout, so a running Pantheon operation is
+    waited for. With skip_locked_changes, files changed by the last lock
+    holder are reported unchanged.
+
+    Args:
+        project_root: Project to repair.
+        filenames: Command files to check.
+        own: What the previous call for this project returned.
+        skip_locked_changes: Leave files changed under the lock alone.
+
+    Returns:
+        One RepairEvent per file, and the record of this hold to pass as
+        own next time.
+    """
+    project = SpecKitProject(project_root)
+    commands_dir = _commands_dir(project_root)
+    events: list[RepairEvent] = []
+    with locking.project_lock(project_root):
+        hold = locking.last_hold(project_root)
+        for filename in filenames:
+            event: RepairEvent = {
+                "project_root": project_root,
+                "filename": filename,
+                "changed": False,
+                "error": None,
+            }
+            events.append(event)
+            if skip_locked_changes and _changed_under_lock(
+                _file_id(commands_dir / filename), filename, hold, own
+            ):
+                continue
+            try:
+                event["changed"] = project.repair(filename)["changed"]
+            except Exception as e:
+                event["error"] = str(e)
+
+        if own is not None and hold is not None and hold[0] == own.acquired:
+            hold = own.previous
+        files = {e["filename"]: _file_id(commands_dir / e["filename"]) for e in events}
+        current = _OwnHold(locking.hold_started(project_root), hold, files)
+    return events, current
+
+
+def watch_projects(
+    project_roots: Iterable[Path],
+    debounce: float = 0.05,
+    backend: str = "auto",
+    poll_interval: float = 1.0,
+    initial_check: bool = True,
+    stop: Optional[threading.Event] = None,
+) -> Iterator[RepairEvent]:
+    """Watch command files of many projects and re-apply missing directives.
+
+    Bursts of events are debounced: once a change is seen, further changes
+    are collected until none arrive for ``debounce`` seconds, then each
+    changed command file is checked once.
+
+    Args:
+        project_roots: Project roots to watch.
+        debounce: Quiet period in seconds before acting on a burst of events.
+        backend: "inotify", "poll", or "auto" (see create_backend()).
+        poll_interval: Seconds between scans for the polling backend.
+        initial_check: Check every command file once before watching.
+        stop: Event that ends the watch when set. Closing the generator
+            also ends it.
+
+    Yields:
+        RepairEvent for each command file that was re-checked.
+    """
+    if stop is None:
+        stop = threading.Event()
+
+    roots = [Path(root) for root in project_roots]
+    watcher = create_backend(backend, poll_interval)
+    try:
+        for project_root in roots:
+            watcher.add(project_root)
+
+        own: dict[Path, _OwnHold] = {}
+        if initial_check:
+            for project_root in roots:
+                existing = [
+                    filename
+                    for filename in COMMAND_DIRECTIVES
+                    if (_commands_dir(project_root) / filename).exists()
+                ]
+                events, own[project_root] = _repair(
+                    project_root, existing, skip_locked_changes=False
+                )
+                yield from events
+
+        pending: set[tuple[Path, str]] = set()
+        deadline = 0.0
+        while not stop.is_set():
+            if pending:
+                timeout = max(0.0, deadline - time.monotonic())
+            else:
+                timeout = _IDLE_TIMEOUT
+
+            changed = watcher.wait(timeout)
+            changed = {key for key in changed if key[1] in COMMAND_DIRECTIVES}
+            if changed:
+                pending |= changed
+                deadline = time.monotonic() + debounce
+                continue
+
+            if pending and time.monotonic() >= deadline:
+                by_project: dict[Path, list[str]] = {}
+                for project_root, filename in sorted(pending):
+                    by_project.setdefault(project_root, []).append(filename)
+                pending.clear()
+                for project_root, filenames in by_project.items():
+                    events, own[project_root] = _repair(
+                        project_root, filenames, own.get(project_root)
+                    )
+                    yield from events
+    finally:
+        watcher.close()
@@ -1,5 +1,6 @@
 """Pytest configuration and shared fixtures."""
 
+import os
 import tempfile
 from collections.abc import Generator
 from pathlib import Path
@@ -7,6 +8,14 @@ from pathlib import Path
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def restore_cwd() -> Generator[None, None, None]:
+    """Return to the original directory after tests that chdir into temp dirs."""
+    cwd = os.getcwd()
+    yield
+    os.chdir(cwd)
+
+
 @pytest.fixture
 def temp_dir() -> Generator[Path, None, None]:
     """Create a temporary directory for testing."""
@@ -111,3 +120,26 @@ Test content for DEV agent.
     dev_file = agents_dir / "dev.md"
     dev_file.write_text(dev_content)
     return dev_file
+
+
+@pytest.fixture
+def spec_kit_fleet(temp_dir: Path) -> list[Path]:
+    """Create several integrable Spec Kit projects under one directory."""
+    roots = []
+    for name in ["alpha", "beta", "nested/gamma"]:
+        root = temp_dir / "fleet" / name
+        commands_dir = root / ".claude" / "commands"
+        commands_dir.mkdir(parents=True)
+        (root / ".claude" / "agents").mkdir()
+        (root / ".specify").mkdir()
+        (root / ".claude" / "agents" / "dev.md").write_text("---\nname: DEV\n---\n")
+        for command in ["implement", "plan", "tasks"]:
+            (commands_dir / f"{command}.md").write_text(
+                f"---\ndescription: {command}\n---\n\n{command} body.\n"
+            )
+        roots.append(root)
+
+    # Directories that must never be reported as projects
+    (temp_dir / "fleet" / "node_modules" / "pkg" / ".specify").mkdir(parents=True)
+    (temp_dir / "fleet" / "plain").mkdir()
+    return roots
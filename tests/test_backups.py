@@ -0,0 +1,568 @@
+"""Unit tests for the content-addressed backup store."""
+
+import json
+import os
+import shutil
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from pantheon.backups import (
+    INDEX_RECORD_SIZE,
+    MANIFEST_NAME,
+    append_to_index,
+    archive_path,
+    expired_backups,
+    gc_objects,
+    hash_file,
+    index_path,
+    list_packed_names,
+    object_path,
+    pack_backups,
+    packed_index_path,
+    parse_age,
+    prune_backups,
+    read_manifest,
+    read_packed_manifest,
+    resolve_backup_name,
+)
+from pantheon.cli import main
+from pantheon.integrations.spec_kit import (
+    create_backup,
+    find_backup,
+    find_latest_backup,
+    list_backups,
+    resolve_backup,
+    restore_files,
+    rollback_integration,
+)
+
+
+class TestContentAddressedBackups:
+    """Tests for backups stored as deduplicated objects."""
+
+    def test_backup_writes_manifest(self, mock_spec_kit_project: Path):
+        """Test that each backed up file is recorded by digest."""
+        backup_dir = create_backup(mock_spec_kit_project)
+
+        manifest = read_manifest(backup_dir)
+        assert manifest is not None
+        assert sorted(manifest["files"]) == ["implement.md", "plan.md", "tasks.md"]
+        implement = mock_spec_kit_project / ".claude" / "commands" / "implement.md"
+        assert manifest["files"]["implement.md"] == hash_file(implement)
+
+    def test_unchanged_files_share_storage(self, mock_spec_kit_project: Path):
+        """Test that repeated backups of unchanged files reuse one object."""
+        first = create_backup(mock_spec_kit_project)
+        shutil.move(str(first), str(mock_spec_kit_project / ".integration-backup-0"))
+        second = create_backup(mock_spec_kit_project)
+
+        old_copy = mock_spec_kit_project / ".integration-backup-0" / "plan.md"
+        new_copy = second / "plan.md"
+        assert old_copy.stat().st_ino == new_copy.stat().st_ino
+        objects = list((mock_spec_kit_project / ".pantheon" / "objects").rglob("*"))
+        assert len([o for o in objects if o.is_file()]) == 3
+
+    def test_restore_from_object_store(self, mock_spec_kit_project: Path):
+        """Test restoring when the backup directory's own copy is missing."""
+        commands_dir = mock_spec_kit_project / ".claude" / "commands"
+        original = (commands_dir / "plan.md").read_text()
+        backup_dir = create_backup(mock_spec_kit_project)
+
+        (backup_dir / "plan.md").unlink()
+        (commands_dir / "plan.md").write_text("MODIFIED")
+
+        result = restore_files(backup_dir, mock_spec_kit_project)
+        assert result["success"] is True
+        assert (commands_dir / "plan.md").read_text() == original
+
+    def test_restore_legacy_backup_without_manifest(
+        self, mock_spec_kit_project: Path
+    ):
+        """Test that plain-copy backups from older versions still restore."""
+        backup_dir = mock_spec_kit_project / ".integration-backup-20240101-120000"
+        backup_dir.mkdir()
+        (backup_dir / "tasks.md").write_text("legacy tasks")
+
+        result = restore_files(backup_dir, mock_spec_kit_project)
+        assert result["files_restored"] == ["tasks.md"]
+        tasks = mock_spec_kit_project / ".claude" / "commands" / "tasks.md"
+        assert tasks.read_text() == "legacy tasks"
+
+
+class TestIncrementalRestore:
+    """Tests for restores that only copy files differing from the backup."""
+
+    @staticmethod
+    def _age(*paths: Path, seconds: int = 60) -> None:
+        """Move modification times out of the racy window."""
+        for path in paths:
+            st = path.stat()
+            old = st.st_mtime_ns - seconds * 1_000_000_000
+            os.utime(path, ns=(old, old))
+
+    def test_only_changed_files_are_copied(self, mock_spec_kit_project: Path):
+        commands_dir = mock_spec_kit_project / ".claude" / "commands"
+        original = (commands_dir / "plan.md").read_text()
+        backup_dir = create_backup(mock_spec_kit_project)
+        (commands_dir / "plan.md").write_text("MODIFIED")
+        tasks_before = (commands_dir / "tasks.md").stat()
+
+        result = restore_files(backup_dir, mock_spec_kit_project)
+
+        assert result["success"] is True
+        assert result["files_restored"] == ["plan.md"]
+        assert sorted(result["files_unchanged"]) == ["implement.md", "tasks.md"]
+        assert (commands_dir / "plan.md").read_text() == original
+        tasks_after = (commands_dir / "tasks.md").stat()
+        assert tasks_after.st_ino == tasks_before.st_ino
+        assert tasks_after.st_mtime_ns == tasks_before.st_mtime_ns
+
+    def test_same_size_edit_is_detected(self, mock_spec_kit_project: Path):
+        """Test that equal sizes alone do not count as a match."""
+        plan = mock_spec_kit_project / ".claude" / "commands" / "plan.md"
+        original = plan.read_text()
+        backup_dir = create_backup(mock_spec_kit_project)
+        plan.write_text(original.swapcase())
+
+        result = restore_files(backup_dir, mock_spec_kit_project)
+
+        assert "plan.md" in result["files_restored"]
+        assert plan.read_text() == original
+
+    def test_repeated_rollback_is_metadata_only(
+        self, mock_spec_kit_project: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that files matching by size and time are not read."""
+        commands_dir = mock_spec_kit_project / ".claude" / "commands"
+        backup_dir = create_backup(mock_spec_kit_project)
+        (commands_dir / "plan.md").write_text("MODIFIED")
+        assert rollback_integration(mock_spec_kit_project)["success"] is True
+        self._age(*commands_dir.iterdir(), *backup_dir.glob("*.md"))
+
+        def fail(path: Path) -> str:
+            raise AssertionError(f"hashed {path}")
+
+        monkeypatch.setattr("pantheon.backups.hash_file", fail)
+        result = rollback_integration(mock_spec_kit_project)
+
+        assert result["success"] is True
+        assert result["files_restored"] == []
+        assert len(result["files_unchanged"]) == 3
+
+    def test_selective_restore(self, mock_spec_kit_project: Path):
+        commands_dir = mock_spec_kit_project / ".claude" / "commands"
+        original = (commands_dir / "plan.md").read_text()
+        backup_dir = create_backup(mock_spec_kit_project)
+        for filename in ("plan.md", "tasks.md"):
+            (commands_dir / filename).write_text("MODIFIED")
+
+        result = restore_files(backup_dir, mock_spec_kit_project, files=["plan.md"])
+
+        assert result["success"] is True
+        assert result["files_restored"] == ["plan.md"]
+        assert result["files_unchanged"] == []
+        assert (commands_dir / "plan.md").read_text() == original
+        assert (commands_dir / "tasks.md").read_text() == "MODIFIED"
+
+    def test_selective_restore_of_unknown_file(self, mock_spec_kit_project: Path):
+        """Test that an unknown name is refused before any file is restored."""
+        backup_dir = create_backup(mock_spec_kit_project)
+        plan = mock_spec_kit_project / ".claude" / "commands" / "plan.md"
+        plan.write_text("MODIFIED")
+
+        result = restore_files(
+            backup_dir, mock_spec_kit_project, files=["plan.md", "other.md"]
+        )
+
+        assert result["success"] is False
+        assert result["files_restored"] == []
+        assert result["files_unchanged"] == []
+        assert result["errors"] == ["other.md is not in the backup"]
+        assert plan.read_text() == "MODIFIED"
+
+
+class TestResolveBackup:
+    """Tests for finding backups by ID or age."""
+
+    @pytest.fixture
+    def names(self, temp_dir: Path) -> list[str]:
+        names = [
+            ".integration-backup-20240101-120000",
+            ".integration-backup-20240105-120000",
+            ".integration-backup-20240105-180000",
+        ]
+        for name in names:
+            (temp_dir / name).mkdir()
+            append_to_index(temp_dir, name)
+        return names
+
+    def test_by_id(self, temp_dir: Path, names: list[str]):
+        assert resolve_backup_name(temp_dir, names[1]) == names[1]
+        assert resolve_backup_name(temp_dir, "20240101-120000") == names[0]
+        assert resolve_backup_name(temp_dir, "20240105-18") == names[2]
+        assert resolve_backup_name(temp_dir, "20231231") is None
+        assert resolve_backup(names[0][-15:], temp_dir) == temp_dir / names[0]
+
+    def test_ambiguous_id(self, temp_dir: Path, names: list[str]):
+        with pytest.raises(ValueError, match="ambiguous"):
+            resolve_backup_name(temp_dir, "20240105")
+
+    def test_by_age(self, temp_dir: Path, names: list[str]):
+        now = datetime(2024, 1, 6, 12, 0)
+
+        assert resolve_backup_name(temp_dir, "12h", now=now) == names[2]
+        assert resolve_backup_name(temp_dir, "1d", now=now) == names[1]
+        assert resolve_backup_name(temp_dir, "3d", now=now) == names[0]
+        assert resolve_backup_name(temp_dir, "1w", now=now) is None
+
+    def test_rollback_to(self, mock_spec_kit_project: Path):
+        commands_dir = mock_spec_kit_project / ".claude" / "commands"
+        original = (commands_dir / "plan.md").read_text()
+        first = create_backup(mock_spec_kit_project)
+        first.rename(mock_spec_kit_project / ".integration-backup-20240101-120000")
+        index_path(mock_spec_kit_project).unlink()
+        (commands_dir / "plan.md").write_text("SECOND")
+        create_backup(mock_spec_kit_project)
+
+        result = rollback_integration(mock_spec_kit_project, to="20240101")
+        assert result["success"] is True
+        assert result["files_restored"] == ["plan.md"]
+        assert (commands_dir / "plan.md").read_text() == original
+
+        result = rollback_integration(mock_spec_kit_project, to="19990101")
+        assert result["success"] is False
+        assert result["errors"] == ["No backup matches '19990101'."]
+
+
+class TestGcObjects:
+    """Tests for gc_objects function."""
+
+    def test_gc_keeps_referenced_objects(self, mock_spec_kit_project: Path):
+        """Test that objects used by a backup survive gc."""
+        create_backup(mock_spec_kit_project)
+
+        result = gc_objects(mock_spec_kit_project)
+        assert result["objects_removed"] == 0
+        assert result["objects_kept"] == 3
+
+    def test_gc_removes_unreferenced_objects(self, mock_spec_kit_project: Path):
+        """Test that deleting a backup lets gc reclaim its objects."""
+        backup_dir = create_backup(mock_spec_kit_project)
+        digest = read_manifest(backup_dir)["files"]["implement.md"]
+        shutil.rmtree(backup_dir)
+
+        result = gc_objects(mock_spec_kit_project)
+        assert result["objects_removed"] == 3
+        assert result["bytes_freed"] > 0
+        assert not object_path(mock_spec_kit_project, digest).exists()
+
+    def test_gc_ignores_unreadable_manifest(self, mock_spec_kit_project: Path):
+        """Test that a corrupt manifest does not crash gc."""
+        backup_dir = create_backup(mock_spec_kit_project)
+        (backup_dir / MANIFEST_NAME).write_text("{not json")
+
+        assert gc_objects(mock_spec_kit_project)["objects_removed"] == 3
+
+
+class TestBackupIndex:
+    """Tests for the append-only backup index."""
+
+    def _make_backups(self, project_root: Path, count: int) -> list[Path]:
+        backup_dirs = []
+        for i in range(count):
+            backup_dir = project_root / f".integration-backup-2024010{i + 1}-120000"
+            backup_dir.mkdir()
+            append_to_index(project_root, backup_dir.name)
+            backup_dirs.append(backup_dir)
+        return backup_dirs
+
+    def test_create_backup_appends_record(self, mock_spec_kit_project: Path):
+        """Test that each new backup adds one fixed-width record."""
+        backup_dir = create_backup(mock_spec_kit_project)
+
+        data = index_path(mock_spec_kit_project).read_bytes()
+        assert len(data) == INDEX_RECORD_SIZE
+        assert data.decode().rstrip() == backup_dir.name
+
+    def test_latest_comes_from_index(self, temp_dir: Path):
+        """Test that lookups trust the index rather than scanning the root."""
+        older, newer = self._make_backups(temp_dir, 2)
+
+        # An unindexed directory is not seen while the index is valid
+        (temp_dir / ".integration-backup-20991231-000000").mkdir()
+
+        assert find_latest_backup(temp_dir) == newer
+
+    def test_nth_backup(self, temp_dir: Path):
+        """Test stepping back through older backups."""
+        first, second, third = self._make_backups(temp_dir, 3)
+
+        assert find_backup(temp_dir, 0) == third
+        assert find_backup(temp_dir, 2) == first
+        assert find_backup(temp_dir, 3) is None
+        assert list_backups(temp_dir) == [third, second, first]
+
+    def test_rebuild_when_index_missing(self, temp_dir: Path):
+        """Test fallback to the directories on disk without an index."""
+        backup_dirs = self._make_backups(temp_dir, 2)
+        index_path(temp_dir).unlink()
+
+        assert find_latest_backup(temp_dir) == backup_dirs[-1]
+        assert index_path(temp_dir).stat().st_size == 2 * INDEX_RECORD_SIZE
+
+    def test_rebuild_when_index_corrupt(self, temp_dir: Path):
+        """Test fallback when the index has a torn record."""
+        backup_dirs = self._make_backups(temp_dir, 2)
+        with open(index_path(temp_dir), "ab") as f:
+            f.write(b"garbage")
+
+        assert find_latest_backup(temp_dir) == backup_dirs[-1]
+        assert list_backups(temp_dir) == backup_dirs[::-1]
+
+    def test_rebuild_when_latest_deleted(self, temp_dir: Path):
+        """Test fallback when the indexed backup was removed by hand."""
+        older, newer = self._make_backups(temp_dir, 2)
+        newer.rmdir()
+
+        assert find_latest_backup(temp_dir) == older
+
+    def test_rollback_to_older_backup(self, mock_spec_kit_project: Path):
+        """Test rolling back to a backup other than the latest."""
+        commands_dir = mock_spec_kit_project / ".claude" / "commands"
+        first = create_backup(mock_spec_kit_project)
+        first.rename(mock_spec_kit_project / ".integration-backup-00000000-000000")
+        index_path(mock_spec_kit_project).unlink()
+        original = (commands_dir / "plan.md").read_text()
+
+        (commands_dir / "plan.md").write_text("SECOND")
+        create_backup(mock_spec_kit_project)
+        (commands_dir / "plan.md").write_text("THIRD")
+
+        result = rollback_integration(mock_spec_kit_project, n=1)
+        assert result["success"] is True
+        assert (commands_dir / "plan.md").read_text() == original
+
+        result = rollback_integration(mock_spec_kit_project, n=5)
+        assert result["success"] is False
+
+
+class TestRetention:
+    """Tests for pruning and packing backups."""
+
+    def _make_history(self, project_root: Path, contents: list[str]) -> list[str]:
+        """Back up plan.md once per content, a day apart, oldest first."""
+        commands_dir = project_root / ".claude" / "commands"
+        names = []
+        for day, content in enumerate(contents, start=1):
+            (commands_dir / "plan.md").write_text(content)
+            backup_dir = create_backup(project_root)
+            name = f".integration-backup-202401{day:02d}-120000"
+            backup_dir.rename(project_root / name)
+            names.append(name)
+        index_path(project_root).unlink()
+        return names
+
+    def test_parse_age(self):
+        """Test the accepted age units."""
+        assert parse_age("90m") == timedelta(minutes=90)
+        assert parse_age("30d") == timedelta(days=30)
+        assert parse_age("2w") == timedelta(weeks=2)
+        with pytest.raises(ValueError):
+            parse_age("30 days")
+
+    def test_expired_backups(self):
+        """Test count and age policies, alone and combined."""
+        names = [f".integration-backup-202401{d:02d}-120000" for d in (9, 5, 1)]
+        now = datetime(2024, 1, 10, 12, 0, 0)
+
+        assert expired_backups(names, keep=1) == names[1:]
+        assert expired_backups(names, older_than=timedelta(days=3), now=now) == (
+            names[1:]
+        )
+        assert expired_backups(
+            names, keep=2, older_than=timedelta(days=3), now=now
+        ) == names[2:]
+        with pytest.raises(ValueError):
+            expired_backups(names)
+
+    def test_prune_keeps_newest(self, mock_spec_kit_project: Path):
+        """Test pruning by count."""
+        names = self._make_history(mock_spec_kit_project, ["A", "B", "C"])
+
+        result = prune_backups(mock_spec_kit_project, keep=1)
+
+        assert result == {"backups_removed": names[1::-1], "backups_kept": 1}
+        assert [p.name for p in list_backups(mock_spec_kit_project)] == names[2:]
+        assert not (mock_spec_kit_project / names[0]).exists()
+
+    def test_prune_dry_run(self, mock_spec_kit_project: Path):
+        """Test that a dry run deletes nothing."""
+        names = self._make_history(mock_spec_kit_project, ["A", "B"])
+
+        result = prune_backups(mock_spec_kit_project, keep=0, dry_run=True)
+
+        assert result["backups_removed"] == names[::-1]
+        assert all((mock_spec_kit_project / name).is_dir() for name in names)
+
+    @pytest.mark.parametrize("compression", ["xz", "gz"])
+    def test_pack_and_restore(self, mock_spec_kit_project: Path, compression: str):
+        """Test that packed backups stay listed and restore transparently."""
+        commands_dir = mock_spec_kit_project / ".claude" / "commands"
+        names = self._make_history(mock_spec_kit_project, ["A", "B", "C"])
+        (commands_dir / "plan.md").write_text("CURRENT")
+
+        result = pack_backups(mock_spec_kit_project, keep=1, compression=compression)
+
+        assert result["backups_packed"] == names[1::-1]
+        assert result["archive"] == (
+            mock_spec_kit_project / ".pantheon" / f"backups.tar.{compression}"
+        )
+        assert not (mock_spec_kit_project / names[0]).exists()
+        assert [p.name for p in list_backups(mock_spec_kit_project)] == names[::-1]
+        manifest = read_packed_manifest(mock_spec_kit_project, names[0])
+        assert manifest is not None
+        assert "plan.md" in manifest["files"]
+
+        # Objects of packed backups may be collected; the archive has them
+        gc_objects(mock_spec_kit_project)
+        result = rollback_integration(mock_spec_kit_project, n=2)
+
+        assert result["success"] is True
+        assert result["backup_dir"] == mock_spec_kit_project / names[0]
+        assert (commands_dir / "plan.md").read_text() == "A"
+
+    def test_repack_merges_archive(self, mock_spec_kit_project: Path):
+        """Test that packing again keeps previously packed backups."""
+        commands_dir = mock_spec_kit_project / ".claude" / "commands"
+        names = self._make_history(mock_spec_kit_project, ["A", "B", "C"])
+        pack_backups(mock_spec_kit_project, keep=2)
+
+        result = pack_backups(mock_spec_kit_project, keep=0)
+
+        assert result["packed_total"] == 3
+        assert list_packed_names(mock_spec_kit_project) == names
+        rollback_integration(mock_spec_kit_project, n=2)
+        assert (commands_dir / "plan.md").read_text() == "A"
+        rollback_integration(mock_spec_kit_project, n=0)
+        assert (commands_dir / "plan.md").read_text() == "C"
+
+    def test_prune_removes_packed_backups(self, mock_spec_kit_project: Path):
+        """Test that pruning also drops backups from the archive."""
+        names = self._make_history(mock_spec_kit_project, ["A", "B", "C"])
+        pack_backups(mock_spec_kit_project, keep=0)
+
+        prune_backups(mock_spec_kit_project, keep=1)
+
+        assert list_packed_names(mock_spec_kit_project) == names[2:]
+        assert [p.name for p in list_backups(mock_spec_kit_project)] == names[2:]
+
+        prune_backups(mock_spec_kit_project, keep=0)
+
+        assert archive_path(mock_spec_kit_project) is None
+        assert list_backups(mock_spec_kit_project) == []
+
+    def test_packed_index_recovered_from_archive(self, mock_spec_kit_project: Path):
+        """Test that a lost packed.idx is rebuilt from the archive."""
+        names = self._make_history(mock_spec_kit_project, ["A", "B"])
+        pack_backups(mock_spec_kit_project, keep=0)
+        packed_index_path(mock_spec_kit_project).unlink()
+
+        assert list_packed_names(mock_spec_kit_project) == names
+
+
+class TestBackupsCommands:
+    """Tests for `pantheon backups prune/pack`."""
+
+    def test_prune_requires_policy(self, mock_spec_kit_project: Path):
+        """Test that prune refuses to run without a retention policy."""
+        os.chdir(mock_spec_kit_project)
+        result = CliRunner().invoke(main, ["backups", "prune"])
+        assert result.exit_code == 2
+
+    def test_invalid_age(self, mock_spec_kit_project: Path):
+        """Test that a malformed --older-than is a usage error."""
+        os.chdir(mock_spec_kit_project)
+        result = CliRunner().invoke(
+            main, ["backups", "prune", "--older-than", "soon"]
+        )
+        assert result.exit_code == 2
+        assert "Invalid age" in result.output
+
+    def test_rollback_to_with_file(self, mock_spec_kit_project: Path):
+        """Test restoring one file from a backup chosen by ID."""
+        os.chdir(mock_spec_kit_project)
+        commands_dir = mock_spec_kit_project / ".claude" / "commands"
+        original = (commands_dir / "plan.md").read_text()
+        first = create_backup(mock_spec_kit_project)
+        first.rename(mock_spec_kit_project / ".integration-backup-20240101-120000")
+        index_path(mock_spec_kit_project).unlink()
+        for filename in ("plan.md", "tasks.md"):
+            (commands_dir / filename).write_text("MODIFIED")
+        create_backup(mock_spec_kit_project)
+
+        result = CliRunner().invoke(
+            main,
+            ["rollback", "--force", "--to", "20240101", "--file", "plan.md"],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "✓ plan.md" in result.output
+        assert "tasks.md" not in result.output
+        assert (commands_dir / "plan.md").read_text() == original
+        assert (commands_dir / "tasks.md").read_text() == "MODIFIED"
+
+    def test_rollback_unknown_file(self, mock_spec_kit_project: Path):
+        """Test that an unknown --file is refused before anything is restored."""
+        os.chdir(mock_spec_kit_project)
+        create_backup(mock_spec_kit_project)
+        plan = mock_spec_kit_project / ".claude" / "commands" / "plan.md"
+        plan.write_text("MODIFIED")
+
+        result = CliRunner().invoke(
+            main,
+            ["rollback", "--force", "--file", "plan.md", "--file", "other.md"],
+        )
+
+        assert result.exit_code == 2
+        assert "other.md not in backup" in result.output
+        assert plan.read_text() == "MODIFIED"
+
+    def test_rollback_to_without_match(self, mock_spec_kit_project: Path):
+        """Test that text and structured output report the same message."""
+        os.chdir(mock_spec_kit_project)
+        create_backup(mock_spec_kit_project)
+
+        text = CliRunner().invoke(main, ["rollback", "--force", "--to", "1d"])
+        structured = CliRunner().invoke(
+            main, ["--output", "json", "rollback", "--force", "--to", "1d"]
+        )
+
+        assert "❌ No backup matches '1d'." in text.output
+        document = json.loads(structured.output)
+        assert document["result"]["errors"] == ["No backup matches '1d'."]
+
+    def test_rollback_nth_and_to_conflict(self, mock_spec_kit_project: Path):
+        os.chdir(mock_spec_kit_project)
+        result = CliRunner().invoke(
+            main, ["rollback", "--force", "--nth", "2", "--to", "1d"]
+        )
+        assert result.exit_code == 2
+
+    def test_pack_then_list(self, mock_spec_kit_project: Path):
+        """Test that packed backups are labelled in the listing."""
+        os.chdir(mock_spec_kit_project)
+        first = create_backup(mock_spec_kit_project)
+        first.rename(mock_spec_kit_project / ".integration-backup-20240101-120000")
+        index_path(mock_spec_kit_project).unlink()
+        create_backup(mock_spec_kit_project)
+
+        packed = CliRunner().invoke(main, ["backups", "pack"])
+        listed = CliRunner().invoke(main, ["backups", "list"])
+
+        assert "Packed 1 backup(s)" in packed.output
+        lines = listed.output.splitlines()
+        assert lines[-1].endswith(".integration-backup-20240101-120000/ (packed)")
+        assert "(packed)" not in lines[-2]
@@ -0,0 +1,75 @@
+"""Tests for the benchmark suite and its synthetic project trees."""
+
+from pathlib import Path
+
+from benchmarks.suite import compare, run_suite
+from benchmarks.synthetic import make_fleet, make_project
+from pantheon.backups import list_backup_names
+from pantheon.integrations.spec_kit import (
+    COMMAND_DIRECTIVES,
+    discover_spec_kit_projects,
+    integrate_spec_kit,
+)
+
+
+class TestSyntheticTrees:
+    """Tests for synthetic project generation."""
+
+    def test_make_project_is_integrable(self, temp_dir: Path):
+        """Test that a synthetic project integrates like a real one."""
+        root = make_project(temp_dir / "project", command_size=4096, backups=3)
+
+        for filename in COMMAND_DIRECTIVES:
+            size = (root / ".claude" / "commands" / filename).stat().st_size
+            assert 3500 < size <= 4096
+        assert len(list_backup_names(root)) == 3
+        assert integrate_spec_kit(root)["success"] is True
+
+    def test_make_fleet_is_discoverable(self, temp_dir: Path):
+        """Test that every root of a synthetic fleet is discovered."""
+        roots = make_fleet(temp_dir / "fleet", 5)
+        assert sorted(discover_spec_kit_projects(temp_dir / "fleet")) == sorted(roots)
+
+
+class TestSuite:
+    """Tests for running and comparing benchmark results."""
+
+    def test_smoke_profile_covers_every_operation(self):
+        """Test that the smoke profile measures each benchmarked operation."""
+        results = run_suite("smoke")
+
+        operations = {case.split("[")[0] for case in results}
+        assert operations == {
+            "init",
+            "integrate_spec_kit",
+            "integrate_spec_kit_batch",
+            "find_latest_backup",
+            "rollback_integration",
+            "scan_projects",
+            "project_index_refresh",
+            "list",
+        }
+        for result in results.values():
+            assert result["seconds"] >= 0
+            assert result["peak_bytes"] > 0
+
+    def test_compare_flags_only_large_regressions(self):
+        """Test that regressions beyond tolerance and noise are reported."""
+        baseline = {
+            "slow": {"seconds": 1.0, "peak_bytes": 1_000_000},
+            "noisy": {"seconds": 0.0001, "peak_bytes": 100},
+            "fine": {"seconds": 1.0, "peak_bytes": 1_000_000},
+        }
+        current = {
+            "slow": {"seconds": 2.0, "peak_bytes": 2_000_000},
+            "noisy": {"seconds": 0.0005, "peak_bytes": 400},
+            "fine": {"seconds": 1.1, "peak_bytes": 1_100_000},
+            "new": {"seconds": 5.0, "peak_bytes": 5},
+        }
+
+        regressions = compare(current, baseline)  # type: ignore[arg-type]
+
+        assert {(r["case"], r["metric"]) for r in regressions} == {
+            ("slow", "seconds"),
+            ("slow", "peak_bytes"),
+        }
@@ -0,0 +1,136 @@
+"""Tests for the precomputed agent catalog and `pantheon list`."""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from pantheon.catalog import (
+    AGENTS_DIR,
+    CATALOG_NAME,
+    build_catalog,
+    install_status,
+    load_catalog,
+    parse_frontmatter,
+    render_catalog,
+    write_catalog,
+)
+from pantheon.cli import main
+
+
+class TestCatalog:
+    """Tests for building and loading the catalog."""
+
+    def test_committed_catalog_is_current(self):
+        """Test that agents/catalog.json matches the agent files.
+
+        Regenerate with: python -c "from pantheon.catalog import write_catalog;
+        write_catalog()"
+        """
+        committed = (AGENTS_DIR / CATALOG_NAME).read_text()
+        assert committed == render_catalog(build_catalog())
+
+    def test_entry_holds_frontmatter_hash_and_size(self, mock_dev_agent: Path):
+        """Test that each entry records the parsed frontmatter and content."""
+        catalog = build_catalog(mock_dev_agent.parent)
+
+        [entry] = catalog["agents"]
+        assert entry["name"] == "DEV"
+        assert entry["file"] == "dev.md"
+        assert entry["size"] == mock_dev_agent.stat().st_size
+        assert entry["frontmatter"]["model"] == "claude-sonnet-4-5"
+        assert entry["frontmatter"]["tools"] == ["Read", "Write", "Edit", "Bash"]
+
+    def test_parse_frontmatter_without_frontmatter(self):
+        """Test that files without frontmatter yield an empty mapping."""
+        assert parse_frontmatter("# Agent\n") == {}
+        assert parse_frontmatter("---\nname: X\n") == {}
+
+    def test_write_catalog_only_when_changed(self, mock_dev_agent: Path):
+        """Test that an up-to-date catalog is not rewritten."""
+        agents_dir = mock_dev_agent.parent
+        assert write_catalog(agents_dir) is True
+        assert write_catalog(agents_dir) is False
+
+        mock_dev_agent.write_text("---\nname: DEV\n---\nChanged\n")
+        assert write_catalog(agents_dir) is True
+        assert load_catalog(agents_dir)["agents"][0]["size"] == len(
+            "---\nname: DEV\n---\nChanged\n"
+        )
+
+    def test_load_falls_back_without_manifest(self, mock_dev_agent: Path):
+        """Test that a missing manifest is built from the agent files."""
+        catalog = load_catalog(mock_dev_agent.parent)
+        assert [e["file"] for e in catalog["agents"]] == ["dev.md"]
+
+
+class TestInstallStatus:
+    """Tests for comparing installed agents with the catalog."""
+
+    def test_statuses(self, mock_dev_agent: Path, temp_dir: Path):
+        """Test missing, matching and modified installed agents."""
+        [entry] = build_catalog(mock_dev_agent.parent)["agents"]
+        installed = temp_dir / "installed.md"
+
+        assert install_status(entry, installed) == "missing"
+
+        shutil.copy2(mock_dev_agent, installed)
+        assert install_status(entry, installed) == "installed"
+
+        # Same size, different content is still caught by the hash
+        content = mock_dev_agent.read_text()
+        installed.write_text(content.replace("Test", "Best"))
+        assert install_status(entry, installed) == "stale"
+
+
+class TestListCommand:
+    """Tests for `pantheon list`."""
+
+    def test_json_output(self, temp_dir: Path):
+        """Test that --json reports catalog entries with install status."""
+        os.chdir(temp_dir)
+        agents_dir = temp_dir / ".claude" / "agents"
+        agents_dir.mkdir(parents=True)
+        shutil.copy2(AGENTS_DIR / "dev.md", agents_dir / "dev.md")
+
+        result = CliRunner().invoke(main, ["list", "--json"])
+
+        assert result.exit_code == 0
+        [agent] = json.loads(result.output)["agents"]
+        assert agent["name"] == "DEV"
+        assert agent["status"] == "installed"
+        assert agent["frontmatter"]["description"]
+
+    def test_text_output_marks_outdated(self, temp_dir: Path):
+        """Test that a locally modified agent is shown as outdated."""
+        os.chdir(temp_dir)
+        agents_dir = temp_dir / ".claude" / "agents"
+        agents_dir.mkdir(parents=True)
+        (agents_dir / "dev.md").write_text("---\nname: DEV\n---\nOld\n")
+
+        result = CliRunner().invoke(main, ["list"])
+
+        assert result.exit_code == 0
+        assert "outdated" in result.output
+
+    def test_list_does_not_parse_agents(self, temp_dir: Path):
+        """Test that list answers from the catalog without importing yaml."""
+        proc = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys; sys.argv = ['pantheon', 'list']\n"
+                "from pantheon.cli import main\n"
+                "main(standalone_mode=False)\n"
+                "print('yaml' in sys.modules)",
+            ],
+            cwd=temp_dir,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert proc.stdout.strip().endswith("False")
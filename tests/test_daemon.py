@@ -0,0 +1,235 @@
+"""Tests for the `pantheon serve` daemon and its client."""
+
+import os
+import sys
+import tempfile
+import threading
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from pantheon import __version__, client, daemon
+from pantheon.cli import main
+from pantheon.client import DaemonError, call, forward, forwardable
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(os, "fork") or sys.platform == "win32",
+    reason="Unix domain sockets required",
+)
+
+
+@pytest.fixture
+def socket_file() -> Generator[str, None, None]:
+    """A socket path short enough for AF_UNIX (108 bytes)."""
+    with tempfile.TemporaryDirectory(prefix="pd", dir="/tmp") as tmpdir:
+        yield os.path.join(tmpdir, "d.sock")
+
+
+@pytest.fixture
+def running_daemon(
+    socket_file: str, monkeypatch: pytest.MonkeyPatch
+) -> Generator[str, None, None]:
+    """Run a daemon on a background thread for the duration of a test."""
+    monkeypatch.setenv(client.SOCKET_ENV, socket_file)
+    monkeypatch.delenv(client.NO_DAEMON_ENV, raising=False)
+    ready = threading.Event()
+    thread = threading.Thread(
+        target=daemon.serve, args=(socket_file,), kwargs={"ready": ready.set}
+    )
+    thread.start()
+    assert ready.wait(10)
+    try:
+        yield socket_file
+    finally:
+        call("shutdown", path=socket_file, timeout=10)
+        thread.join(10)
+
+
+@pytest.fixture
+def project(mock_spec_kit_project: Path) -> Path:
+    """A Spec Kit project with the DEV agent installed."""
+    agent = mock_spec_kit_project / ".claude" / "agents" / "dev.md"
+    agent.write_text("---\nname: DEV\n---\n")
+    return mock_spec_kit_project
+
+
+class TestForwardable:
+    """Tests for which command lines are sent to the daemon."""
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["integrate"],
+            ["integrate", "--force", "--verify-on-disk"],
+            ["status"],
+            ["rollback", "--force", "--nth", "2"],
+            ["rollback", "--nth=2", "--force"],
+            ["rollback", "--force", "--to", "2d", "--file", "plan.md"],
+            ["--output", "json", "rollback"],
+            ["--output=ndjson", "status"],
+        ],
+    )
+    def test_forwarded(self, argv: list[str]):
+        assert forwardable(argv)
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            [],
+            ["list"],
+            ["init"],
+            ["serve"],
+            ["rollback"],
+            ["--output", "text", "rollback"],
+            ["integrate", "--roots", "roots.txt"],
+            ["integrate", "--discover", "."],
+            ["status", "--scan", "."],
+            ["rollback", "--force", "--nth"],
+            ["--trace", "t.json", "status"],
+            ["integrate", "--help"],
+            ["--output"],
+        ],
+    )
+    def test_run_in_process(self, argv: list[str]):
+        assert not forwardable(argv)
+
+
+class TestDaemonMethods:
+    """Tests for the JSON-RPC methods."""
+
+    def test_ping(self, running_daemon: str):
+        result = call("ping", path=running_daemon, timeout=10)
+        assert result == {"version": __version__, "pid": os.getpid()}
+
+    def test_integrate_status_rollback(
+        self, running_daemon: str, project: Path
+    ):
+        """Test a full integrate/status/rollback cycle over the socket."""
+        params = {"project_root": str(project)}
+
+        result = call("integrate", params, path=running_daemon, timeout=30)
+        assert result["success"]
+        assert result["backup_dir"].startswith(str(project))
+
+        record = call("status", params, path=running_daemon, timeout=30)
+        assert record["integrated"]
+        assert call("validate", params, path=running_daemon, timeout=30)["valid"]
+
+        result = call("rollback", params, path=running_daemon, timeout=30)
+        assert result["success"]
+        assert not call("status", params, path=running_daemon, timeout=30)[
+            "integrated"
+        ]
+
+    def test_unknown_method(self, running_daemon: str):
+        with pytest.raises(DaemonError) as exc_info:
+            call("explode", path=running_daemon, timeout=10)
+        assert exc_info.value.code == daemon.METHOD_NOT_FOUND
+
+    def test_relative_root_rejected(self, running_daemon: str):
+        with pytest.raises(DaemonError) as exc_info:
+            call("status", {"project_root": "."}, path=running_daemon, timeout=10)
+        assert exc_info.value.code == daemon.INVALID_PARAMS
+
+    def test_parse_error_keeps_connection(self, running_daemon: str):
+        """Test that a malformed line gets an error and later lines still work."""
+        import json
+        import socket
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(10)
+            sock.connect(running_daemon)
+            sock.sendall(b"{not json\n")
+            sock.sendall(b'{"jsonrpc": "2.0", "id": 7, "method": "ping"}\n')
+            with sock.makefile("rb") as stream:
+                first = json.loads(stream.readline())
+                second = json.loads(stream.readline())
+
+        assert first["error"]["code"] == daemon.PARSE_ERROR
+        assert second["id"] == 7
+        assert second["result"]["version"] == __version__
+
+    def test_projects_served_concurrently(
+        self, running_daemon: str, spec_kit_fleet: list[Path]
+    ):
+        """Test that requests for several projects, twice each, all succeed."""
+        roots = spec_kit_fleet * 2
+
+        def integrate(root: Path) -> bool:
+            params = {"project_root": str(root)}
+            return call("integrate", params, path=running_daemon, timeout=60)[
+                "success"
+            ]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            assert all(pool.map(integrate, roots))
+
+    def test_second_daemon_refused(self, running_daemon: str):
+        with pytest.raises(RuntimeError):
+            daemon.serve(running_daemon)
+
+
+class TestForwarding:
+    """Tests for transparent forwarding from the command line."""
+
+    def test_forwarded_output_matches_in_process(
+        self,
+        running_daemon: str,
+        project: Path,
+        capsys: pytest.CaptureFixture[str],
+    ):
+        os.chdir(project)
+        assert forward(["--output", "json", "status"]) == 0
+        forwarded = capsys.readouterr().out
+
+        in_process = CliRunner().invoke(main, ["--output", "json", "status"])
+
+        assert forwarded == in_process.output
+
+    def test_forwarded_integrate(
+        self,
+        running_daemon: str,
+        project: Path,
+        capsys: pytest.CaptureFixture[str],
+    ):
+        os.chdir(project)
+        assert forward(["integrate"]) == 0
+
+        assert "Integration successful" in capsys.readouterr().out
+        implement = project / ".claude" / "commands" / "implement.md"
+        assert "DEV" in implement.read_text()
+
+    def test_forwarded_usage_error(
+        self,
+        running_daemon: str,
+        temp_dir: Path,
+        capsys: pytest.CaptureFixture[str],
+    ):
+        """Test that exit codes and stderr come back from the daemon."""
+        os.chdir(temp_dir)
+        assert forward(["--output", "json", "rollback", "--nth", "0"]) == 2
+        assert "--nth" in capsys.readouterr().err
+
+    def test_no_daemon_runs_in_process(
+        self, socket_file: str, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setenv(client.SOCKET_ENV, socket_file)
+        assert forward(["status"]) is None
+
+    def test_stale_socket_runs_in_process(
+        self, socket_file: str, monkeypatch: pytest.MonkeyPatch
+    ):
+        import socket
+
+        monkeypatch.setenv(client.SOCKET_ENV, socket_file)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.bind(socket_file)  # Bound but never listening
+
+        assert forward(["status"]) is None
+
+    def test_opt_out(self, running_daemon: str, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv(client.NO_DAEMON_ENV, "1")
+        assert forward(["status"]) is None
@@ -0,0 +1,133 @@
+"""Tests for the fingerprint cache used by incremental integrate."""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from pantheon import fingerprints
+from pantheon.integrations import spec_kit
+from pantheon.integrations.spec_kit import (
+    integrate_spec_kit,
+    list_backups,
+    register_directive,
+    rollback_integration,
+)
+
+
+@pytest.fixture
+def integrated_project(mock_spec_kit_project: Path) -> Path:
+    """A Spec Kit project that has been integrated once."""
+    (mock_spec_kit_project / ".claude" / "agents" / "dev.md").write_text("# DEV")
+    assert integrate_spec_kit(mock_spec_kit_project)["success"] is True
+    return mock_spec_kit_project
+
+
+class TestIncrementalIntegrate:
+    """Tests for skipping work on unchanged projects."""
+
+    def test_state_saved_after_integration(self, integrated_project: Path):
+        """Test that a successful run records every command file."""
+        state = fingerprints.load_state(integrated_project)
+        assert state is not None
+        assert sorted(state["files"]) == ["implement.md", "plan.md", "tasks.md"]
+        assert all(fp["integrated"] for fp in state["files"].values())
+
+    def test_unchanged_project_skips_backup(self, integrated_project: Path):
+        """Test that a repeat run creates no backup and rewrites nothing."""
+        implement = integrated_project / ".claude" / "commands" / "implement.md"
+        mtime = implement.stat().st_mtime_ns
+
+        result = integrate_spec_kit(integrated_project)
+
+        assert result["success"] is True
+        assert result["backup_dir"] is None
+        assert len(list_backups(integrated_project)) == 1
+        assert implement.stat().st_mtime_ns == mtime
+
+    def test_hit_needs_only_stat(self, mock_spec_kit_project: Path, monkeypatch):
+        """Test that repeat runs stop hashing once past the racy window."""
+        monkeypatch.setattr(fingerprints, "RACY_WINDOW_NS", 200_000_000)
+        hashed: list[Path] = []
+        hash_file = fingerprints.hash_file
+
+        def counting_hash(path):
+            hashed.append(path)
+            return hash_file(path)
+
+        monkeypatch.setattr(fingerprints, "hash_file", counting_hash)
+        (mock_spec_kit_project / ".claude" / "agents" / "dev.md").write_text("# DEV")
+        assert integrate_spec_kit(mock_spec_kit_project)["success"] is True
+        time.sleep(0.3)
+
+        # State saved right after writing is racy: this run hashes, then
+        # re-stamps the state
+        hashed.clear()
+        assert integrate_spec_kit(mock_spec_kit_project)["backup_dir"] is None
+        assert len(hashed) == 3
+
+        hashed.clear()
+        assert integrate_spec_kit(mock_spec_kit_project)["backup_dir"] is None
+        assert hashed == []
+
+    def test_preview_does_not_restamp(self, integrated_project: Path):
+        """Test that a dry run leaves the state file alone."""
+        state = fingerprints.state_path(integrated_project)
+        before = state.read_bytes()
+
+        assert spec_kit.preview_spec_kit(integrated_project)["success"] is True
+        assert state.read_bytes() == before
+
+    def test_changed_file_is_reintegrated(self, integrated_project: Path):
+        """Test that an overwritten command file misses the cache."""
+        plan = integrated_project / ".claude" / "commands" / "plan.md"
+        plan.write_text("---\ndescription: new\n---\n\nRegenerated plan.\n")
+
+        result = integrate_spec_kit(integrated_project)
+
+        assert result["backup_dir"] is not None
+        assert "## Quality Standards" in plan.read_text()
+
+    def test_racy_rewrite_detected_by_hash(self, integrated_project: Path):
+        """Test same-size edits keeping the mtime are caught by the hash."""
+        plan = integrated_project / ".claude" / "commands" / "plan.md"
+        st = plan.stat()
+        plan.write_text(plan.read_text().replace("Lint", "LINT"))
+        os.utime(plan, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        assert integrate_spec_kit(integrated_project)["backup_dir"] is not None
+
+    def test_force_bypasses_cache(self, integrated_project: Path):
+        """Test that force=True always backs up and re-checks."""
+        result = integrate_spec_kit(integrated_project, force=True)
+        assert result["backup_dir"] is not None
+
+    def test_new_directive_invalidates_cache(
+        self, integrated_project: Path, monkeypatch
+    ):
+        """Test that changing the directive registry misses the cache."""
+        monkeypatch.setattr(spec_kit, "COMMAND_DIRECTIVES", dict(
+            spec_kit.COMMAND_DIRECTIVES
+        ))
+        commands_dir = integrated_project / ".claude" / "commands"
+        (commands_dir / "specify.md").write_text("Specify.\n")
+        register_directive("specify.md", "## Spec Rules", "## Spec Rules\n")
+
+        result = integrate_spec_kit(integrated_project)
+        assert result["backup_dir"] is not None
+        assert "## Spec Rules" in (commands_dir / "specify.md").read_text()
+
+    def test_rollback_clears_state(self, integrated_project: Path):
+        """Test that restoring files drops the cached state."""
+        rollback_integration(integrated_project)
+
+        assert fingerprints.load_state(integrated_project) is None
+        result = integrate_spec_kit(integrated_project)
+        assert result["backup_dir"] is not None
+
+    def test_corrupt_state_is_ignored(self, integrated_project: Path):
+        """Test that an unreadable state file just means a full run."""
+        fingerprints.state_path(integrated_project).write_text("{oops")
+
+        assert integrate_spec_kit(integrated_project)["backup_dir"] is not None
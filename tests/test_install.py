@@ -0,0 +1,132 @@
+"""Tests for agent installation link modes."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from pantheon import install
+from pantheon.cli import main
+from pantheon.install import LINK_MODES, install_file
+
+
+@pytest.fixture
+def source(temp_dir: Path) -> Path:
+    path = temp_dir / "library" / "dev.md"
+    path.parent.mkdir()
+    path.write_text("---\nname: DEV\n---\n# DEV\n")
+    return path
+
+
+class TestInstallFile:
+    """Tests for install_file()."""
+
+    @pytest.mark.parametrize("mode", LINK_MODES)
+    def test_installs_same_content(self, source: Path, temp_dir: Path, mode: str):
+        """Test that every mode yields a file with the library content."""
+        dest = temp_dir / "dev.md"
+        used = install_file(source, dest, mode)
+
+        assert used in (mode, "copy")
+        assert dest.read_text() == source.read_text()
+
+    def test_hardlink_shares_inode(self, source: Path, temp_dir: Path):
+        """Test that hardlink mode does not duplicate the file."""
+        dest = temp_dir / "dev.md"
+        assert install_file(source, dest, "hardlink") == "hardlink"
+        assert os.path.samefile(source, dest)
+
+    def test_symlink_follows_library(self, source: Path, temp_dir: Path):
+        """Test that a symlinked agent sees library upgrades."""
+        dest = temp_dir / "dev.md"
+        assert install_file(source, dest, "symlink") == "symlink"
+
+        source.write_text("# DEV v2\n")
+
+        assert dest.is_symlink()
+        assert dest.read_text() == "# DEV v2\n"
+
+    def test_reflink_is_independent(self, source: Path, temp_dir: Path):
+        """Test that a reflinked agent does not change with the library."""
+        dest = temp_dir / "dev.md"
+        install_file(source, dest, "reflink")
+
+        source.write_text("# DEV v2\n")
+
+        assert not dest.is_symlink()
+        assert dest.read_text() == "---\nname: DEV\n---\n# DEV\n"
+
+    def test_hardlink_falls_back_to_copy(self, source: Path, temp_dir: Path):
+        """Test the copy fallback when hardlinks are unsupported."""
+        dest = temp_dir / "dev.md"
+        with patch("os.link", side_effect=OSError("cross-device link")):
+            assert install_file(source, dest, "hardlink") == "copy"
+        assert not os.path.samefile(source, dest)
+        assert dest.read_text() == source.read_text()
+
+    def test_reflink_falls_back_to_copy(self, source: Path, temp_dir: Path):
+        """Test the copy fallback when cloning is unsupported."""
+        dest = temp_dir / "dev.md"
+        with patch.object(install, "_reflink", return_value=False):
+            assert install_file(source, dest, "reflink") == "copy"
+        assert dest.read_text() == source.read_text()
+
+    def test_failed_clone_reported_as_copy(self, source: Path, temp_dir: Path):
+        """Test that a byte copy after a failed FICLONE is not called a clone."""
+        dest = temp_dir / "dev.md"
+        with patch("fcntl.ioctl", side_effect=OSError("not supported")):
+            assert install_file(source, dest, "reflink") == "copy"
+        assert dest.read_text() == source.read_text()
+
+    def test_existing_dest_rejected(self, source: Path, temp_dir: Path):
+        """Test that an existing file is never overwritten."""
+        dest = temp_dir / "dev.md"
+        dest.write_text("local edits")
+        with pytest.raises(FileExistsError):
+            install_file(source, dest, "reflink")
+        assert dest.read_text() == "local edits"
+
+    def test_unknown_mode(self, source: Path, temp_dir: Path):
+        """Test that an unknown mode is rejected."""
+        with pytest.raises(ValueError):
+            install_file(source, temp_dir / "dev.md", "bind")
+
+
+class TestInitLinkMode:
+    """Tests for `pantheon init --link-mode`."""
+
+    def test_symlink_mode(self, temp_dir: Path):
+        """Test that init can symlink the DEV agent."""
+        os.chdir(temp_dir)
+        result = CliRunner().invoke(main, ["init", "--link-mode", "symlink"])
+
+        assert result.exit_code == 0
+        dest = temp_dir / ".claude" / "agents" / "dev.md"
+        assert dest.is_symlink()
+        assert "Symlinked DEV agent" in result.output
+
+    def test_reflink_fallback_says_copied(self, temp_dir: Path):
+        """Test that init does not claim a clone when it had to copy."""
+        os.chdir(temp_dir)
+        with patch("fcntl.ioctl", side_effect=OSError("not supported")):
+            result = CliRunner().invoke(main, ["init", "--link-mode", "reflink"])
+
+        assert result.exit_code == 0
+        assert "Copied DEV agent" in result.output
+        assert "Cloned" not in result.output
+        assert "reflink not supported here" in result.output
+
+    def test_replaces_dangling_symlink(self, temp_dir: Path):
+        """Test that a symlink to a removed install is replaced."""
+        os.chdir(temp_dir)
+        agents_dir = temp_dir / ".claude" / "agents"
+        agents_dir.mkdir(parents=True)
+        (agents_dir / "dev.md").symlink_to(temp_dir / "gone" / "dev.md")
+
+        result = CliRunner().invoke(main, ["init", "--link-mode", "copy"])
+
+        assert result.exit_code == 0
+        assert not (agents_dir / "dev.md").is_symlink()
+        assert "name: DEV" in (agents_dir / "dev.md").read_text()
@@ -1,16 +1,42 @@
 """Integration tests for the full workflow."""
 
+import json
 import os
 import shutil
+import subprocess
 from pathlib import Path
+from unittest.mock import patch
 
+import pytest
+from click.testing import CliRunner
+
+from pantheon.cli import main
+from pantheon.integrations import spec_kit
 from pantheon.integrations.spec_kit import (
+    COMMAND_DIRECTIVES,
     create_backup,
     integrate_spec_kit,
+    integrate_spec_kit_batch,
+    preview_spec_kit,
+    preview_spec_kit_batch,
     rollback_integration,
+    unintegrate_spec_kit,
+    unintegrate_spec_kit_batch,
+    upgrade_spec_kit,
 )
 
 
+def _snapshot(root: Path) -> dict[str, tuple[bytes, int]]:
+    """Map every path under root to its content and mtime."""
+    return {
+        str(path.relative_to(root)): (
+            path.read_bytes() if path.is_file() else b"",
+            path.stat().st_mtime_ns,
+        )
+        for path in sorted(root.rglob("*"))
+    }
+
+
 class TestFullIntegrationWorkflow:
     """Test complete integration workflow."""
 
@@ -242,3 +268,493 @@ class TestEdgeCases:
         # Verify directive added
         implement_content = Path(".claude/commands/implement.md").read_text()
         assert "## Agent Integration" in implement_content
+
+
+class TestBatchIntegration:
+    """Test integrating many project roots at once."""
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_batch_integrates_every_root(
+        self, spec_kit_fleet: list[Path], executor: str
+    ):
+        """Test that each root is integrated and reported exactly once."""
+        results = dict(
+            integrate_spec_kit_batch(spec_kit_fleet, max_workers=2, executor=executor)
+        )
+
+        assert sorted(results) == sorted(spec_kit_fleet)
+        for root, result in results.items():
+            assert result["success"] is True
+            implement = root / ".claude" / "commands" / "implement.md"
+            assert "## Agent Integration" in implement.read_text()
+
+    def test_batch_reports_failures_per_root(
+        self, spec_kit_fleet: list[Path], temp_dir: Path
+    ):
+        """Test that a bad root fails on its own without stopping the batch."""
+        missing = temp_dir / "does-not-exist"
+        results = dict(
+            integrate_spec_kit_batch(
+                [*spec_kit_fleet, missing], max_workers=2, executor="thread"
+            )
+        )
+
+        assert results[missing]["success"] is False
+        assert all(results[root]["success"] for root in spec_kit_fleet)
+
+    @pytest.mark.parametrize(
+        "argv",
+        [["integrate"], ["integrate", "--dry-run"], ["unintegrate"], ["upgrade"]],
+    )
+    def test_cli_exits_nonzero_on_partial_failure(
+        self, spec_kit_fleet: list[Path], temp_dir: Path, argv: list[str]
+    ):
+        """Test that scripts can tell when some roots of a batch failed."""
+        os.chdir(temp_dir)
+        roots_file = temp_dir / "roots.txt"
+        roots_file.write_text(f"{spec_kit_fleet[0]}\n{temp_dir / 'does-not-exist'}\n")
+
+        result = CliRunner().invoke(
+            main, [*argv, "--roots", str(roots_file), "--executor", "thread"]
+        )
+
+        assert result.exit_code == 1, result.output
+        assert "does-not-exist" in result.output
+
+    def test_batch_consumes_roots_lazily(self, spec_kit_fleet: list[Path]):
+        """Test that roots are pulled from the iterable as work completes."""
+        many_roots = spec_kit_fleet * 4
+        pulled = []
+
+        def roots():
+            for root in many_roots:
+                pulled.append(root)
+                yield root
+
+        stream = integrate_spec_kit_batch(roots(), max_workers=1, executor="thread")
+        next(stream)
+        assert len(pulled) <= 3  # two in flight plus one refill, not the fleet
+        assert len(list(stream)) == len(many_roots) - 1
+
+    def test_batch_rejects_unknown_executor(self):
+        """Test that an invalid executor name raises ValueError."""
+        with pytest.raises(ValueError):
+            list(integrate_spec_kit_batch([], executor="cluster"))
+
+
+class TestFusedValidation:
+    """Test validation against the content integration just wrote."""
+
+    @pytest.fixture
+    def project(self, mock_spec_kit_project: Path) -> Path:
+        (mock_spec_kit_project / ".claude" / "agents" / "dev.md").write_text("# DEV")
+        return mock_spec_kit_project
+
+    def test_validation_does_not_reread_files(self, project: Path, monkeypatch):
+        """Test that the default path never validates from disk."""
+        def fail(self):
+            raise AssertionError("command files were re-read")
+
+        monkeypatch.setattr(spec_kit.SpecKitProject, "validate", fail)
+        result = integrate_spec_kit(project)
+
+        assert result["success"] is True
+        assert result["validation"]["valid"] is True
+        assert result["validation"]["files_checked"] == [
+            "implement.md", "plan.md", "tasks.md"
+        ]
+
+    def test_verify_on_disk_rereads_files(self, project: Path, monkeypatch):
+        """Test that verify_on_disk validates from disk."""
+        calls = []
+        original = spec_kit.SpecKitProject.validate
+
+        def spy(self):
+            calls.append(self.root)
+            return original(self)
+
+        monkeypatch.setattr(spec_kit.SpecKitProject, "validate", spy)
+        result = integrate_spec_kit(project, verify_on_disk=True)
+
+        assert result["success"] is True
+        assert calls == [project]
+
+    def test_missing_command_file_fails_validation(self, project: Path):
+        """Test that a missing command file is still reported as invalid."""
+        (project / ".claude" / "commands" / "tasks.md").unlink()
+
+        result = integrate_spec_kit(project)
+
+        assert result["success"] is False
+        assert "tasks.md not found" in result["errors"]
+
+
+class TestDryRun:
+    """Test previewing integration without writing."""
+
+    @pytest.fixture
+    def project(self, spec_kit_fleet: list[Path]) -> Path:
+        return spec_kit_fleet[0]
+
+    def test_preview_writes_nothing(self, project: Path):
+        """Test that a preview leaves the project byte-for-byte unchanged."""
+        before = _snapshot(project)
+
+        result = preview_spec_kit(project, diff=True)
+
+        assert _snapshot(project) == before
+        assert result["success"] is True
+        assert result["would_modify"] == ["implement.md", "plan.md", "tasks.md"]
+        assert result["unchanged"] == []
+
+    def test_preview_after_integration(self, project: Path):
+        """Test that an integrated project previews as unchanged."""
+        integrate_spec_kit(project)
+
+        for force in (False, True):
+            result = preview_spec_kit(project, force=force, diff=True)
+            assert result["success"] is True
+            assert result["would_modify"] == []
+            assert sorted(result["unchanged"]) == [
+                "implement.md", "plan.md", "tasks.md"
+            ]
+            assert result["diff"] == ""
+
+    def test_preview_reports_partial_integration(self, project: Path):
+        """Test that only files missing their directive are reported."""
+        spec_kit.integrate_plan_command(project)
+
+        result = preview_spec_kit(project)
+
+        assert result["would_modify"] == ["implement.md", "tasks.md"]
+        assert result["unchanged"] == ["plan.md"]
+        assert result["diff"] is None
+
+    def test_preview_reports_failures(self, project: Path):
+        """Test that a preview predicts the errors integrate would hit."""
+        (project / ".claude" / "commands" / "tasks.md").unlink()
+        assert preview_spec_kit(project)["errors"] == ["tasks.md not found"]
+
+        (project / ".claude" / "agents" / "dev.md").unlink()
+        result = preview_spec_kit(project)
+        assert result["success"] is False
+        assert "DEV agent not installed" in result["errors"][0]
+
+    @pytest.mark.skipif(shutil.which("patch") is None, reason="needs patch(1)")
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "---\ndescription: x\n---\n\nBody.\nMore.\n",
+            "---\ndescription: x\n---",
+            "No frontmatter.\n",
+            "",
+        ],
+    )
+    def test_diff_applies_to_integrated_content(
+        self, project: Path, temp_dir: Path, content: str
+    ):
+        """Test that applying the diff gives exactly what integrate writes."""
+        for name in ("implement.md", "plan.md", "tasks.md"):
+            (project / ".claude" / "commands" / name).write_text(content)
+        copy = temp_dir / "copy"
+        shutil.copytree(project, copy)
+
+        diff = preview_spec_kit(project, diff=True)["diff"]
+        assert diff
+        subprocess.run(
+            ["patch", "-p1", "--quiet", "--fuzz=0"],
+            cwd=copy,
+            input=diff.encode(),
+            check=True,
+        )
+        integrate_spec_kit(project)
+
+        for name in ("implement.md", "plan.md", "tasks.md"):
+            integrated = project / ".claude" / "commands" / name
+            patched = copy / ".claude" / "commands" / name
+            assert patched.read_bytes() == integrated.read_bytes()
+
+    def test_batch_preview(self, spec_kit_fleet: list[Path], temp_dir: Path):
+        """Test previewing a fleet in parallel."""
+        integrate_spec_kit(spec_kit_fleet[0])
+        missing = temp_dir / "does-not-exist"
+        before = [_snapshot(root) for root in spec_kit_fleet]
+
+        results = dict(
+            preview_spec_kit_batch(
+                [*spec_kit_fleet, missing], max_workers=2, executor="thread"
+            )
+        )
+
+        assert [_snapshot(root) for root in spec_kit_fleet] == before
+        assert results[spec_kit_fleet[0]]["would_modify"] == []
+        assert all(results[root]["would_modify"] for root in spec_kit_fleet[1:])
+        assert results[missing]["success"] is False
+
+    def test_cli_dry_run(self, project: Path):
+        """Test that `integrate --dry-run` lists only the files that would change."""
+        os.chdir(project)
+        spec_kit.integrate_plan_command(project)
+
+        result = CliRunner().invoke(main, ["integrate", "--dry-run", "--diff"])
+
+        assert result.exit_code == 0
+        assert "  - .claude/commands/implement.md" in result.output
+        assert "  ✓ .claude/commands/plan.md" in result.output
+        assert "+++ b/.claude/commands/tasks.md" in result.output
+        assert not list(project.glob(".integration-backup-*"))
+
+    def test_cli_diff_requires_dry_run(self, project: Path):
+        os.chdir(project)
+        result = CliRunner().invoke(main, ["integrate", "--diff"])
+        assert result.exit_code == 2
+
+    def test_cli_fleet_dry_run(self, spec_kit_fleet: list[Path], temp_dir: Path):
+        """Test sizing a rollout over a discovered fleet."""
+        os.chdir(temp_dir)
+        integrate_spec_kit(spec_kit_fleet[0])
+
+        result = CliRunner().invoke(
+            main,
+            [
+                "--output", "json", "integrate", "--dry-run",
+                "--discover", "fleet", "--executor", "thread",
+            ],
+        )
+
+        assert result.exit_code == 0
+        document = json.loads(result.output)
+        assert document["result"] == {
+            "dry_run": True,
+            "projects": 3,
+            "would_change": 2,
+            "up_to_date": 1,
+            "failed": 0,
+        }
+        assert len(document["events"]) == 3
+
+
+class TestUnintegrate:
+    """Test removing directives in place, without a backup."""
+
+    @pytest.fixture
+    def project(self, spec_kit_fleet: list[Path]) -> Path:
+        return spec_kit_fleet[0]
+
+    @staticmethod
+    def _commands(project: Path) -> dict[str, bytes]:
+        return {
+            name: (project / ".claude" / "commands" / name).read_bytes()
+            for name in ("implement.md", "plan.md", "tasks.md")
+        }
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "---\ndescription: x\n---\n\nBody.\nMore.\n",
+            "---\ndescription: x\n---",
+            "No frontmatter.\n",
+            "",
+        ],
+    )
+    def test_restores_original_bytes(self, project: Path, content: str):
+        """Test that unintegrate exactly reverses integrate."""
+        for name in ("implement.md", "plan.md", "tasks.md"):
+            (project / ".claude" / "commands" / name).write_text(content)
+        before = self._commands(project)
+        integrate_spec_kit(project)
+        backups = sorted(project.glob(".integration-backup-*"))
+
+        result = unintegrate_spec_kit(project)
+
+        assert result == {
+            "success": True,
+            "files_modified": ["implement.md", "plan.md", "tasks.md"],
+            "errors": [],
+        }
+        assert self._commands(project) == before
+        assert sorted(project.glob(".integration-backup-*")) == backups
+
+    @pytest.mark.parametrize(
+        ("content", "baseline"),
+        [
+            (
+                "---\ndescription: x\n---\n\nBody\n",
+                "---\ndescription: x\n---\n\nDIRECTIVE\n\nBody\n",
+            ),
+            ("No frontmatter.\n", "\nDIRECTIVE\nNo frontmatter.\n"),
+        ],
+    )
+    def test_restores_bytes_of_unstamped_insert(
+        self, project: Path, content: str, baseline: str
+    ):
+        """Test removing directives inserted, unstamped, by older releases."""
+        commands_dir = project / ".claude" / "commands"
+        for name, directive in COMMAND_DIRECTIVES.items():
+            (commands_dir / name).write_text(
+                baseline.replace("DIRECTIVE", directive.text)
+            )
+
+        assert unintegrate_spec_kit(project)["success"] is True
+        assert self._commands(project) == {
+            name: content.encode() for name in COMMAND_DIRECTIVES
+        }
+
+    def test_keeps_edits_made_after_integrating(self, project: Path):
+        """Test that edits around and inside the directive are handled."""
+        integrate_spec_kit(project)
+        plan = project / ".claude" / "commands" / "plan.md"
+        plan.write_text(plan.read_text() + "\nAdded later.\n")
+        implement = project / ".claude" / "commands" / "implement.md"
+        implement.write_text(
+            implement.read_text().replace("DEV sub-agent.", "DEV, edited.")
+        )
+
+        assert unintegrate_spec_kit(project)["success"] is True
+
+        assert plan.read_text().endswith("\nAdded later.\n")
+        assert "Quality Standards" not in plan.read_text()
+        content = implement.read_text()
+        assert "## Agent Integration" not in content
+        assert "DEV, edited." not in content
+        assert "implement body." in content
+
+    def test_not_integrated_is_a_no_op(self, project: Path):
+        commands_dir = project / ".claude" / "commands"
+        before = _snapshot(commands_dir)
+        result = unintegrate_spec_kit(project)
+        assert result["success"] is True
+        assert result["files_modified"] == []
+        assert _snapshot(commands_dir) == before
+
+    def test_unterminated_directive_is_left_alone(self, project: Path):
+        """Test that a directive missing its --- terminator is not guessed at."""
+        tasks = project / ".claude" / "commands" / "tasks.md"
+        tasks.write_text("## Task Format (Required for DEV Integration)\n\nBody.\n")
+
+        result = unintegrate_spec_kit(project)
+
+        assert result["success"] is False
+        assert "tasks.md" in result["errors"][0]
+        assert tasks.read_text().startswith("## Task Format")
+        assert not list(tasks.parent.glob(".*.tmp"))
+
+    def test_reintegrate_after_unintegrate(self, project: Path):
+        """Test that the fingerprint cache does not hide the removal."""
+        integrate_spec_kit(project)
+        unintegrate_spec_kit(project)
+
+        result = integrate_spec_kit(project)
+
+        assert result["success"] is True
+        assert result["backup_dir"] is not None
+        assert spec_kit.validate_integration(project)["valid"] is True
+
+    def test_batch_unintegrate(self, spec_kit_fleet: list[Path], temp_dir: Path):
+        """Test unintegrating a fleet in parallel."""
+        originals = [self._commands(root) for root in spec_kit_fleet]
+        for root in spec_kit_fleet[:2]:
+            integrate_spec_kit(root)
+        missing = temp_dir / "does-not-exist"
+
+        results = dict(
+            unintegrate_spec_kit_batch(
+                [*spec_kit_fleet, missing], max_workers=2, executor="thread"
+            )
+        )
+
+        assert [self._commands(root) for root in spec_kit_fleet] == originals
+        assert results[spec_kit_fleet[0]]["files_modified"]
+        assert results[spec_kit_fleet[2]]["files_modified"] == []
+        assert results[missing]["success"] is False
+
+    def test_cli_fleet(self, spec_kit_fleet: list[Path], temp_dir: Path):
+        os.chdir(temp_dir)
+        for root in spec_kit_fleet:
+            integrate_spec_kit(root)
+
+        result = CliRunner().invoke(
+            main, ["unintegrate", "--discover", "fleet", "--executor", "thread"]
+        )
+
+        assert result.exit_code == 0
+        assert "3 unintegrated, 0 failed" in result.output
+        for root in spec_kit_fleet:
+            assert spec_kit.validate_integration(root)["valid"] is False
+
+    def test_cli(self, project: Path):
+        os.chdir(project)
+        integrate_spec_kit(project)
+
+        result = CliRunner().invoke(main, ["unintegrate"])
+
+        assert result.exit_code == 0
+        assert "  ✓ implement.md" in result.output
+
+
+class TestUpgrade:
+    """Test bringing directives from an older release up to date."""
+
+    @pytest.fixture
+    def new_release(self):
+        """Change the /plan directive text, as a new Pantheon release would."""
+        marker, text = spec_kit.COMMAND_DIRECTIVES["plan.md"]
+        changed = spec_kit.CommandDirective(marker, text.replace("80%", "90%"))
+        with patch.dict(spec_kit.COMMAND_DIRECTIVES, {"plan.md": changed}):
+            yield changed
+
+    def test_upgrades_only_outdated_files(
+        self, spec_kit_fleet: list[Path], new_release: spec_kit.CommandDirective
+    ):
+        project = spec_kit_fleet[0]
+        old = spec_kit.CommandDirective(new_release.marker, spec_kit.PLAN_DIRECTIVE)
+        with patch.dict(spec_kit.COMMAND_DIRECTIVES, {"plan.md": old}):
+            integrate_spec_kit(project)
+        plan = project / ".claude" / "commands" / "plan.md"
+        implement = project / ".claude" / "commands" / "implement.md"
+        implement_mtime = implement.stat().st_mtime_ns
+
+        # The marker is unchanged, so integrate sees nothing to do
+        assert integrate_spec_kit(project)["success"] is True
+        assert "80%" in plan.read_text()
+
+        result = upgrade_spec_kit(project)
+
+        assert result == {
+            "success": True,
+            "files_upgraded": ["plan.md"],
+            "up_to_date": ["implement.md", "tasks.md"],
+            "errors": [],
+        }
+        assert "90%" in plan.read_text() and "80%" not in plan.read_text()
+        assert implement.stat().st_mtime_ns == implement_mtime
+        assert upgrade_spec_kit(project)["files_upgraded"] == []
+
+    def test_unintegrated_files_are_errors(self, spec_kit_fleet: list[Path]):
+        result = upgrade_spec_kit(spec_kit_fleet[0])
+        assert result["success"] is False
+        assert "plan.md is not integrated" in result["errors"]
+        assert result["files_upgraded"] == []
+
+    def test_cli_fleet(
+        self,
+        spec_kit_fleet: list[Path],
+        temp_dir: Path,
+        new_release: spec_kit.CommandDirective,
+    ):
+        os.chdir(temp_dir)
+        old = spec_kit.CommandDirective(new_release.marker, spec_kit.PLAN_DIRECTIVE)
+        with patch.dict(spec_kit.COMMAND_DIRECTIVES, {"plan.md": old}):
+            integrate_spec_kit(spec_kit_fleet[0])
+            integrate_spec_kit(spec_kit_fleet[1])
+        integrate_spec_kit(spec_kit_fleet[2])
+
+        result = CliRunner().invoke(
+            main,
+            ["--output", "json", "upgrade", "--discover", "fleet",
+             "--executor", "thread"],
+        )
+
+        assert result.exit_code == 0
+        document = json.loads(result.output)
+        assert document["result"] == {"upgraded": 2, "up_to_date": 1, "failed": 0}
@@ -0,0 +1,199 @@
+"""Tests for transactional integrate and crash recovery."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from pantheon import journal
+from pantheon.backups import gc_objects, prune_backups
+from pantheon.integrations import spec_kit
+from pantheon.integrations.spec_kit import (
+    COMMAND_DIRECTIVES,
+    create_backup,
+    integrate_spec_kit,
+    recover_integration,
+    restore_files,
+    stage_directive,
+)
+from pantheon.journal import JournalEntry, has_journal
+
+
+@pytest.fixture
+def project(spec_kit_fleet: list[Path]) -> Path:
+    return spec_kit_fleet[0]
+
+
+def _commands(project: Path) -> dict[str, bytes]:
+    commands_dir = project / ".claude" / "commands"
+    return {path.name: path.read_bytes() for path in commands_dir.iterdir()}
+
+
+def _crash_mid_commit(project: Path, replaced: int) -> list[JournalEntry]:
+    """Leave a project as if integrate died after `replaced` os.replace() calls."""
+    create_backup(project)
+    transaction = journal.Transaction(project)
+    for filename, directive in COMMAND_DIRECTIVES.items():
+        path = project / ".claude" / "commands" / filename
+        outcome, staged, original = stage_directive(path, directive)
+        assert staged is not None and original and outcome["sha256"]
+        transaction.stage(path, staged, original, outcome["sha256"])
+    journal._write_journal(project, transaction.entries)
+    for entry in transaction.entries[:replaced]:
+        os.replace(project / entry["staged"], project / entry["file"])
+    return transaction.entries
+
+
+class TestTransactionalIntegrate:
+    """Tests for all-or-nothing integration."""
+
+    def test_failure_while_staging_leaves_project_untouched(self, project: Path):
+        """Test that an error on the second file leaves the first unchanged."""
+        before = _commands(project)
+        real_stage = spec_kit.stage_directive
+
+        def failing_stage(filepath: Path, directive: spec_kit.CommandDirective):
+            if filepath.name == "plan.md":
+                raise OSError("disk full")
+            return real_stage(filepath, directive)
+
+        with patch.object(spec_kit, "stage_directive", failing_stage):
+            result = integrate_spec_kit(project)
+
+        assert result["success"] is False
+        assert "Integration failed: disk full" in result["errors"]
+        assert result["files_modified"] == []
+        assert _commands(project) == before
+        assert not has_journal(project)
+
+    def test_failure_while_committing_puts_files_back(self, project: Path):
+        """Test that files already replaced are restored when a replace fails."""
+        before = _commands(project)
+        real_replace = os.replace
+        calls = []
+
+        def failing_replace(src: str, dst: str) -> None:
+            if str(dst).endswith(".md"):
+                calls.append(dst)
+                if len(calls) == 2:
+                    raise OSError("I/O error")
+            real_replace(src, dst)
+
+        with patch("os.replace", failing_replace):
+            result = integrate_spec_kit(project)
+
+        assert result["success"] is False
+        assert _commands(project) == before
+        assert not has_journal(project)
+
+    def test_success_leaves_no_journal(self, project: Path):
+        assert integrate_spec_kit(project)["success"] is True
+        assert not has_journal(project)
+        assert set(_commands(project)) == set(COMMAND_DIRECTIVES)
+
+
+class TestRecovery:
+    """Tests for recovering a commit interrupted by a crash."""
+
+    def test_nothing_to_recover(self, project: Path):
+        result = recover_integration(project)
+        assert result == {"action": None, "files": [], "errors": []}
+
+    @pytest.mark.parametrize("replaced", [0, 1, 2, 3])
+    def test_replays_when_staged_files_intact(self, project: Path, replaced: int):
+        """Test that a commit is finished, touching only the pending files."""
+        entries = _crash_mid_commit(project, replaced)
+
+        result = recover_integration(project)
+
+        assert result["action"] == "replayed"
+        assert result["files"] == [e["file"] for e in entries[replaced:]]
+        assert set(_commands(project)) == set(COMMAND_DIRECTIVES)
+        assert spec_kit.validate_integration(project)["valid"] is True
+        assert not has_journal(project)
+
+    def test_undoes_when_staged_file_lost(self, project: Path):
+        """Test that replaced files are put back if the commit cannot finish."""
+        before = _commands(project)
+        entries = _crash_mid_commit(project, 1)
+        (project / entries[2]["staged"]).unlink()
+
+        result = recover_integration(project)
+
+        assert result["action"] == "undone"
+        assert result["files"] == [entries[0]["file"]]
+        assert _commands(project) == before
+        assert not has_journal(project)
+
+    def test_leaves_files_changed_since_crash(self, project: Path):
+        """Test that a file edited after the crash is not overwritten."""
+        entries = _crash_mid_commit(project, 2)
+        edited = project / entries[1]["file"]
+        edited.write_text("hand edited\n")
+
+        result = recover_integration(project)
+
+        assert result["action"] == "undone"
+        assert edited.read_text() == "hand edited\n"
+        assert any(entries[1]["file"] in error for error in result["errors"])
+
+    def test_crash_before_journal_leaves_no_staging_files(self, project: Path):
+        """Test that staging files of a run killed before journaling go away."""
+        before = _commands(project)
+        with patch.object(
+            journal, "_write_journal", side_effect=SystemExit("killed")
+        ), pytest.raises(SystemExit):
+            transaction = journal.Transaction(project)
+            for filename, directive in COMMAND_DIRECTIVES.items():
+                path = project / ".claude" / "commands" / filename
+                outcome, staged, original = stage_directive(path, directive)
+                assert staged is not None and original and outcome["sha256"]
+                transaction.stage(path, staged, original, outcome["sha256"])
+            transaction.commit()
+        commands_dir = project / ".claude" / "commands"
+        assert list(commands_dir.glob(".*.tmp"))
+
+        result = recover_integration(project)
+
+        assert result["action"] is None
+        assert _commands(project) == before
+        assert not has_journal(project)
+
+    def test_undo_after_prune_and_gc(self, project: Path):
+        """Test that gc keeps the objects a pending journal restores from."""
+        before = _commands(project)
+        entries = _crash_mid_commit(project, 1)
+        (project / entries[2]["staged"]).unlink()
+        prune_backups(project, keep=0)
+
+        gc_objects(project)
+        result = recover_integration(project)
+
+        assert result["action"] == "undone"
+        assert result["errors"] == []
+        assert _commands(project) == before
+
+    def test_integrate_recovers_first(self, project: Path):
+        """Test that the next integrate finishes an interrupted one."""
+        integrate_spec_kit(project)  # Warm the fingerprint cache
+        spec_kit.rollback_integration(project)
+        _crash_mid_commit(project, 1)
+
+        result = integrate_spec_kit(project)
+
+        assert result["success"] is True
+        for filename, (marker, _) in COMMAND_DIRECTIVES.items():
+            content = (project / ".claude" / "commands" / filename).read_text()
+            assert content.count(marker) == 1
+        assert not has_journal(project)
+
+    def test_restore_is_not_replayed_over(self, project: Path):
+        """Test that restoring a backup settles the journal first."""
+        original = _commands(project)
+        backup_dir = create_backup(project)
+        _crash_mid_commit(project, 1)
+
+        assert restore_files(backup_dir, project)["success"] is True
+        assert recover_integration(project)["action"] is None
+        assert _commands(project) == original
@@ -0,0 +1,212 @@
+"""Tests for per-project locking and collision-free backup names."""
+
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from pantheon import backups
+from pantheon.backups import (
+    BACKUP_PREFIX,
+    INDEX_RECORD_SIZE,
+    index_path,
+    list_backup_names,
+    new_backup_name,
+    read_manifest,
+)
+from pantheon.integrations.spec_kit import (
+    COMMAND_DIRECTIVES,
+    create_backup,
+    integrate_spec_kit,
+)
+from pantheon.locking import last_hold, lock_path, project_lock
+
+fcntl = pytest.importorskip("fcntl")
+
+
+@pytest.fixture
+def project(mock_spec_kit_project: Path) -> Path:
+    """A Spec Kit project with the DEV agent installed."""
+    agent = mock_spec_kit_project / ".claude" / "agents" / "dev.md"
+    agent.write_text("---\nname: DEV\n---\n")
+    return mock_spec_kit_project
+
+
+def _hammer(project_root: str, worker: int, rounds: int) -> list[str]:
+    """Run a mix of writing operations on one project (in a worker process)."""
+    root = Path(project_root)
+    names = []
+    for i in range(rounds):
+        if (worker + i) % 3 == 0:
+            backups.gc_objects(root)
+        result = integrate_spec_kit(root, force=True)
+        assert result["success"], result["errors"]
+        assert result["backup_dir"] is not None
+        names.append(result["backup_dir"].name)
+        names.append(create_backup(root).name)
+    return names
+
+
+class TestProjectLock:
+    """Tests for project_lock()."""
+
+    def test_creates_lock_file(self, temp_dir: Path):
+        with project_lock(temp_dir):
+            assert lock_path(temp_dir).exists()
+
+    def test_reentrant(self, temp_dir: Path):
+        """Test that a thread can take a lock it already holds."""
+        with project_lock(temp_dir):
+            with project_lock(temp_dir, timeout=0.1):
+                pass
+
+    def test_excludes_other_threads(self, temp_dir: Path):
+        """Test that a lock held by one thread times out in another."""
+        acquired = threading.Event()
+        release = threading.Event()
+
+        def hold() -> None:
+            with project_lock(temp_dir):
+                acquired.set()
+                release.wait(10)
+
+        holder = threading.Thread(target=hold)
+        holder.start()
+        try:
+            assert acquired.wait(10)
+            with pytest.raises(TimeoutError):
+                with project_lock(temp_dir, timeout=0.05):
+                    pass
+        finally:
+            release.set()
+            holder.join(10)
+
+        with project_lock(temp_dir, timeout=1):
+            pass
+
+    def test_other_projects_not_blocked(self, temp_dir: Path):
+        """Test that locks are per project."""
+        (temp_dir / "a").mkdir()
+        (temp_dir / "b").mkdir()
+        acquired = threading.Event()
+        release = threading.Event()
+
+        def hold() -> None:
+            with project_lock(temp_dir / "a"):
+                acquired.set()
+                release.wait(10)
+
+        holder = threading.Thread(target=hold)
+        holder.start()
+        try:
+            assert acquired.wait(10)
+            with project_lock(temp_dir / "b", timeout=0.05):
+                pass
+        finally:
+            release.set()
+            holder.join(10)
+
+    def test_records_last_hold(self, temp_dir: Path):
+        """Test that a released lock records when it was held."""
+        assert last_hold(temp_dir) is None
+        changed = temp_dir / "changed.md"
+
+        with project_lock(temp_dir):
+            assert last_hold(temp_dir) is None
+            changed.write_text("written under the lock")
+        hold = last_hold(temp_dir)
+        assert hold is not None
+        acquired, released = hold
+        assert acquired <= changed.stat().st_ctime_ns <= released
+
+        with project_lock(temp_dir):
+            assert last_hold(temp_dir) == hold
+
+    def test_unwritable_project_runs_unlocked(self, temp_dir: Path):
+        with patch("os.open", side_effect=PermissionError("read-only")):
+            with project_lock(temp_dir):
+                pass
+
+
+class TestBackupNames:
+    """Tests for collision-free, ordered backup names."""
+
+    def test_same_second_backups_are_distinct(self, project: Path):
+        """Test that backups made in the same second get their own directory."""
+        second = 1_700_000_000 * 1_000_000_000
+        with patch("time.time_ns", side_effect=[second + 1, second + 2]):
+            first = create_backup(project)
+            second_backup = create_backup(project)
+
+        assert first != second_backup
+        assert first.name < second_backup.name
+        assert list_backup_names(project) == [second_backup.name, first.name]
+
+    def test_clock_going_back_keeps_order(self, project: Path):
+        """Test that names still sort in creation order if the clock steps back."""
+        later = create_backup(project)
+        with patch("time.time_ns", return_value=1_000_000_000 * 1_000_000_000):
+            earlier_clock = create_backup(project)
+
+        assert earlier_clock.name > later.name
+        assert list_backup_names(project)[0] == earlier_clock.name
+
+    def test_sorts_after_legacy_names(self, temp_dir: Path):
+        """Test that new names sort after a same-second name without suffix."""
+        legacy = f"{BACKUP_PREFIX}20991231-235959"
+        (temp_dir / legacy).mkdir()
+        backups.append_to_index(temp_dir, legacy)
+
+        name = new_backup_name(temp_dir)
+
+        assert name > legacy
+        assert name.startswith(legacy)
+
+    def test_name_fits_index_record(self, temp_dir: Path):
+        assert len(new_backup_name(temp_dir)) < INDEX_RECORD_SIZE
+
+    def test_skips_unindexed_directory(self, project: Path):
+        """Test that a directory made outside Pantheon is not reused."""
+        now = 1_700_000_000 * 1_000_000_000
+        with patch("time.time_ns", return_value=now):
+            taken = new_backup_name(project)
+            (project / taken).mkdir()
+            (project / taken / "keep.txt").write_text("not ours")
+            backup_dir = create_backup(project)
+
+        assert backup_dir.name > taken
+        assert (project / taken / "keep.txt").read_text() == "not ours"
+
+
+class TestStress:
+    """Hammer one project from many processes at once."""
+
+    def test_parallel_processes(self, project: Path):
+        workers, rounds = 8, 6
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_hammer, str(project), worker, rounds)
+                for worker in range(workers)
+            ]
+            names = [name for future in futures for name in future.result()]
+
+        # Every operation got its own backup, and the index holds them all
+        assert len(names) == len(set(names)) == workers * rounds * 2
+        indexed = list_backup_names(project)
+        assert sorted(indexed) == sorted(names)
+        assert index_path(project).stat().st_size == len(names) * INDEX_RECORD_SIZE
+
+        # Every backup is complete, despite gc running alongside
+        for name in names:
+            manifest = read_manifest(project / name)
+            assert manifest is not None
+            assert set(manifest["files"]) == set(COMMAND_DIRECTIVES)
+            for filename in manifest["files"]:
+                assert (project / name / filename).exists()
+
+        # Each directive was inserted exactly once
+        for filename, (marker, _) in COMMAND_DIRECTIVES.items():
+            content = (project / ".claude" / "commands" / filename).read_text()
+            assert content.count(marker) == 1
@@ -0,0 +1,142 @@
+"""Tests for the multi-marker scanning engine."""
+
+from pathlib import Path
+
+import pytest
+
+from pantheon.integrations.spec_kit import (
+    COMMAND_DIRECTIVES,
+    integrate_spec_kit,
+    locate_markers,
+    validate_command_file,
+    validate_integration,
+)
+from pantheon.markers import HEADER_WINDOW, MarkerScanner, find_markers
+
+
+class TestMarkerScanner:
+    """Tests for finding several markers in one scan."""
+
+    def test_reports_first_offset_of_each_marker(self):
+        data = b"intro\n## Beta\n## Alpha\n## Beta\n<!-- stamp -->\n"
+        scanner = MarkerScanner(["## Alpha", "## Beta", "<!-- stamp", "## Gamma"])
+
+        assert scanner.search(data) == {
+            "## Beta": data.index(b"## Beta"),
+            "## Alpha": data.index(b"## Alpha"),
+            "<!-- stamp": data.index(b"<!--"),
+        }
+
+    def test_markers_prefixing_each_other(self):
+        """Test that a marker is found where a longer one also starts."""
+        data = b"x ## Agent Integration Notes\n"
+        scanner = MarkerScanner(["## Agent Integration Notes", "## Agent Integration"])
+
+        assert scanner.search(data) == {
+            "## Agent Integration Notes": 2,
+            "## Agent Integration": 2,
+        }
+
+    def test_markers_with_different_prefixes(self, temp_dir: Path):
+        """Test markers that fall into separate prefix groups."""
+        data = b"<!-- pantheon:directive abc -->\n## Rules\n@@ hunk\n## Rules\n"
+        markers = ["## Rules", "<!-- pantheon:directive", "@@ hunk", "%% none"]
+        scanner = MarkerScanner(markers)
+        filepath = temp_dir / "cmd.md"
+        filepath.write_bytes(data)
+
+        expected = {
+            "<!-- pantheon:directive": 0,
+            "## Rules": data.index(b"## Rules"),
+            "@@ hunk": data.index(b"@@ hunk"),
+        }
+        assert scanner.search(data) == expected
+        assert find_markers(filepath, markers) == expected
+        assert find_markers(filepath, markers, window=40) == {
+            "<!-- pantheon:directive": 0,
+            "## Rules": data.index(b"## Rules"),
+        }
+
+    def test_end_excludes_markers_crossing_it(self):
+        data = b"0123## Marker"
+        scanner = MarkerScanner(["## Marker"])
+        assert scanner.search(data, end=len(data)) == {"## Marker": 4}
+        assert scanner.search(data, end=len(data) - 1) == {}
+
+    def test_rejects_empty_marker(self):
+        with pytest.raises(ValueError):
+            MarkerScanner(["## Marker", ""])
+
+    def test_scans_files_by_mapping_or_window(self, temp_dir: Path):
+        """Test whole-file and header-window scans of a large file."""
+        filepath = temp_dir / "cmd.md"
+        body = b"filler line\n" * 200_000
+        filepath.write_bytes(b"## Head\n" + body + b"## Tail\n")
+        markers = ["## Head", "## Tail"]
+
+        assert find_markers(filepath, markers) == {
+            "## Head": 0,
+            "## Tail": 8 + len(body),
+        }
+        assert find_markers(filepath, markers, window=HEADER_WINDOW) == {
+            "## Head": 0
+        }
+
+    def test_empty_and_binary_files(self, temp_dir: Path):
+        empty = temp_dir / "empty.md"
+        empty.write_bytes(b"")
+        assert find_markers(empty, ["## Marker"]) == {}
+
+        binary = temp_dir / "binary.md"
+        binary.write_bytes(b"\xff\xfe## Marker\n")
+        assert find_markers(binary, ["## Marker"]) == {"## Marker": 2}
+        assert validate_command_file(binary, "## Marker") is None
+
+
+class TestProjectMarkers:
+    """Tests for marker lookup and validation over a project."""
+
+    @pytest.fixture
+    def project(self, spec_kit_fleet: list[Path]) -> Path:
+        return spec_kit_fleet[0]
+
+    def test_locate_markers_reports_offsets(self, project: Path):
+        integrate_spec_kit(project)
+        commands_dir = project / ".claude" / "commands"
+
+        located = locate_markers(project)
+
+        for filename, directive in COMMAND_DIRECTIVES.items():
+            content = (commands_dir / filename).read_bytes()
+            assert located[filename] == {
+                directive.marker: content.index(directive.marker.encode())
+            }
+
+    def test_locate_custom_markers(self, project: Path):
+        commands_dir = project / ".claude" / "commands"
+        (commands_dir / "plan.md").unlink()
+        offset = (commands_dir / "tasks.md").read_bytes().index(b"tasks body")
+
+        located = locate_markers(
+            project,
+            {"plan.md": ["## Anything"], "tasks.md": ["tasks body", "## Missing"]},
+        )
+
+        assert located["plan.md"] is None
+        assert located["tasks.md"] == {"tasks body": offset}
+
+    def test_validate_with_header_window(self, project: Path):
+        """Test the header fast path, and that it misses far-away markers."""
+        integrate_spec_kit(project)
+        assert validate_integration(project, window=HEADER_WINDOW)["valid"] is True
+
+        plan = project / ".claude" / "commands" / "plan.md"
+        plan.write_text("x" * HEADER_WINDOW + "\n" + plan.read_text())
+
+        assert validate_integration(project)["valid"] is True
+        result = validate_integration(project, window=HEADER_WINDOW)
+        assert result["valid"] is False
+        assert result["errors"] == [
+            "plan.md missing integration section: "
+            + COMMAND_DIRECTIVES["plan.md"].marker
+        ]
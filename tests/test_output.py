@@ -0,0 +1,152 @@
+"""Tests for the machine-readable --output modes."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from pantheon.cli import main
+from pantheon.integrations.spec_kit import integrate_spec_kit
+from pantheon.output import Reporter, to_jsonable
+
+
+def _records(output: str) -> list[dict]:
+    return [json.loads(line) for line in output.splitlines()]
+
+
+class TestReporter:
+    """Tests for the Reporter itself."""
+
+    def test_to_jsonable_renders_paths(self):
+        """Test that nested Paths, tuples and sets become JSON types."""
+        value = {"root": Path("/a"), "files": ("x", Path("y")), "tags": {"b", "a"}}
+        assert to_jsonable(value) == {
+            "root": "/a",
+            "files": ["x", "y"],
+            "tags": ["a", "b"],
+        }
+
+    def test_unknown_format_rejected(self):
+        """Test that an unknown output format is an error."""
+        with pytest.raises(ValueError):
+            Reporter("yaml", "list")
+
+
+class TestOutputModes:
+    """Tests for `pantheon --output` across commands."""
+
+    def test_text_is_default(self, mock_spec_kit_project: Path):
+        """Test that text mode prints no JSON records."""
+        os.chdir(mock_spec_kit_project)
+        (mock_spec_kit_project / ".claude" / "agents" / "dev.md").write_text("# DEV")
+
+        result = CliRunner().invoke(main, ["integrate"])
+
+        assert result.exit_code == 0
+        assert "Integration successful" in result.output
+        assert '"schema"' not in result.output
+
+    def test_integrate_ndjson(self, mock_spec_kit_project: Path):
+        """Test that ndjson mode prints only a versioned result record."""
+        os.chdir(mock_spec_kit_project)
+        (mock_spec_kit_project / ".claude" / "agents" / "dev.md").write_text("# DEV")
+
+        result = CliRunner().invoke(main, ["--output", "ndjson", "integrate"])
+
+        assert result.exit_code == 0
+        (record,) = _records(result.output)
+        assert record["schema"] == 1
+        assert record["type"] == "result"
+        assert record["command"] == "integrate"
+        assert record["result"]["success"] is True
+        assert sorted(record["result"]["files_modified"]) == [
+            "implement.md",
+            "plan.md",
+            "tasks.md",
+        ]
+        assert isinstance(record["result"]["backup_dir"], str)
+
+    def test_batch_streams_progress(self, spec_kit_fleet: list[Path]):
+        """Test that batch integration emits one progress record per project."""
+        base = spec_kit_fleet[0].parent
+        os.chdir(base)
+        result = CliRunner().invoke(
+            main,
+            [
+                "--output",
+                "ndjson",
+                "integrate",
+                "--discover",
+                str(base),
+                "--executor",
+                "thread",
+            ],
+        )
+
+        assert result.exit_code == 0
+        records = _records(result.output)
+        progress = [r for r in records if r["type"] == "progress"]
+        assert {Path(r["project_root"]) for r in progress} == set(spec_kit_fleet)
+        assert all(r["event"] == "project" for r in progress)
+        assert records[-1]["type"] == "result"
+        assert records[-1]["result"] == {"succeeded": 3, "failed": 0}
+
+    def test_rollback_json_document(self, mock_spec_kit_project: Path):
+        """Test that json mode prints one document with events and result."""
+        os.chdir(mock_spec_kit_project)
+        (mock_spec_kit_project / ".claude" / "agents" / "dev.md").write_text("# DEV")
+        integrate_spec_kit()
+
+        result = CliRunner().invoke(
+            main, ["--output", "json", "rollback", "--force"]
+        )
+
+        assert result.exit_code == 0
+        document = json.loads(result.output)
+        assert document["schema"] == 1
+        assert document["command"] == "rollback"
+        assert [e["event"] for e in document["events"]] == ["backup_found"]
+        assert document["result"]["success"] is True
+
+    def test_rollback_requires_force(self, mock_spec_kit_project: Path):
+        """Test that structured rollback refuses to prompt."""
+        os.chdir(mock_spec_kit_project)
+        result = CliRunner().invoke(main, ["--output", "json", "rollback"])
+        assert result.exit_code == 2
+        assert "--force" in result.output
+
+    def test_list_json(self, temp_dir: Path):
+        """Test that list reports agents with their install status."""
+        os.chdir(temp_dir)
+        result = CliRunner().invoke(main, ["--output", "json", "list"])
+
+        assert result.exit_code == 0
+        document = json.loads(result.output)
+        assert document["events"] == []
+        agents = document["result"]["agents"]
+        assert agents
+        assert all(agent["status"] == "missing" for agent in agents)
+
+    def test_nested_command_name(self, temp_dir: Path):
+        """Test that subcommands of groups report their full name."""
+        os.chdir(temp_dir)
+        result = CliRunner().invoke(main, ["--output", "ndjson", "backups", "list"])
+
+        (record,) = _records(result.output)
+        assert record["command"] == "backups list"
+        assert record["result"] == {"backups": []}
+
+    def test_status_scan_ndjson(self, spec_kit_fleet: list[Path]):
+        """Test that --scan records are wrapped as progress events."""
+        integrate_spec_kit(spec_kit_fleet[1])
+        base = spec_kit_fleet[0].parent
+
+        result = CliRunner().invoke(
+            main, ["--output", "ndjson", "status", "--scan", str(base)]
+        )
+
+        records = _records(result.output)
+        assert len(records) == len(spec_kit_fleet) + 1
+        assert records[-1]["result"] == {"projects": 3, "integrated": 1}
@@ -0,0 +1,196 @@
+"""Tests for the persistent SQLite project index."""
+
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from pantheon import project_index
+from pantheon.cli import main
+from pantheon.integrations.spec_kit import integrate_spec_kit
+from pantheon.project_index import ProjectIndex, index_path
+
+
+def _age_tree(base: Path) -> None:
+    """Backdate every file and directory under base out of the racy window."""
+    old_ns = time.time_ns() - 3600 * 10**9
+    for dirpath, dirnames, filenames in os.walk(base):
+        for name in dirnames + filenames:
+            os.utime(os.path.join(dirpath, name), ns=(old_ns, old_ns))
+    os.utime(base, ns=(old_ns, old_ns))
+
+
+@pytest.fixture
+def fleet_dir(spec_kit_fleet: list[Path]) -> Path:
+    """The directory holding the spec_kit_fleet projects, aged."""
+    base = spec_kit_fleet[0].parent
+    _age_tree(base)
+    return base
+
+
+@pytest.fixture
+def reads(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    """Record every command file the index re-reads."""
+    seen: list[Path] = []
+    original = project_index.validate_command_file
+
+    def counting(filepath: Path, marker: str):
+        seen.append(filepath)
+        return original(filepath, marker)
+
+    monkeypatch.setattr(project_index, "validate_command_file", counting)
+    return seen
+
+
+def _refresh(base: Path, walk: bool = True) -> dict[Path, dict]:
+    with ProjectIndex(base) as index:
+        return {r["project_root"]: r for r in index.refresh(walk=walk)}
+
+
+class TestProjectIndex:
+    """Tests for incremental refreshes of the project index."""
+
+    def test_first_refresh_finds_every_project(
+        self, fleet_dir: Path, spec_kit_fleet: list[Path]
+    ):
+        """Test that a cold index reports the same projects as a scan."""
+        records = _refresh(fleet_dir)
+
+        assert set(records) == set(spec_kit_fleet)
+        assert index_path(fleet_dir).exists()
+        assert all(not r["integrated"] for r in records.values())
+
+    def test_unchanged_fleet_reads_nothing(
+        self, fleet_dir: Path, spec_kit_fleet: list[Path], reads: list[Path]
+    ):
+        """Test that a second refresh answers from the index."""
+        first = _refresh(fleet_dir)
+        reads.clear()
+
+        second = _refresh(fleet_dir)
+
+        assert reads == []
+        assert second == first
+
+    def test_only_changed_file_is_reread(
+        self, fleet_dir: Path, spec_kit_fleet: list[Path], reads: list[Path]
+    ):
+        """Test that a moved fingerprint re-reads just that command file."""
+        _refresh(fleet_dir)
+        integrate_spec_kit(spec_kit_fleet[1])
+        plan = spec_kit_fleet[0] / ".claude" / "commands" / "plan.md"
+        plan.write_text(plan.read_text() + "\nMore.\n")
+        reads.clear()
+
+        records = _refresh(fleet_dir)
+
+        assert sorted(reads) == sorted(
+            [plan]
+            + [
+                spec_kit_fleet[1] / ".claude" / "commands" / name
+                for name in ("implement.md", "plan.md", "tasks.md")
+            ]
+        )
+        assert records[spec_kit_fleet[1]]["integrated"] is True
+        assert records[spec_kit_fleet[0]]["integrated"] is False
+
+    def test_added_and_removed_projects(
+        self, fleet_dir: Path, spec_kit_fleet: list[Path]
+    ):
+        """Test that the walk notices new and deleted projects."""
+        _refresh(fleet_dir)
+        shutil.rmtree(spec_kit_fleet[2].parent)
+        added = fleet_dir / "delta"
+        (added / ".claude" / "commands").mkdir(parents=True)
+        (added / ".specify").mkdir()
+
+        records = _refresh(fleet_dir)
+
+        assert set(records) == {spec_kit_fleet[0], spec_kit_fleet[1], added}
+        with ProjectIndex(fleet_dir) as index:
+            assert set(index._known_roots()) == {str(r) for r in records}
+
+    def test_commands_dir_created_later(self, fleet_dir: Path):
+        """Test that .claude/commands/ appearing in a candidate is noticed."""
+        candidate = fleet_dir / "epsilon"
+        (candidate / ".claude").mkdir(parents=True)
+        (candidate / ".specify").mkdir()
+        _age_tree(fleet_dir)
+        assert candidate not in _refresh(fleet_dir)
+
+        (candidate / ".claude" / "commands").mkdir()
+
+        assert candidate in _refresh(fleet_dir)
+
+    def test_no_walk_rechecks_known_projects(
+        self, fleet_dir: Path, spec_kit_fleet: list[Path]
+    ):
+        """Test that walk=False skips discovery but sees file changes."""
+        _refresh(fleet_dir)
+        unseen = fleet_dir / "zeta"
+        (unseen / ".claude" / "commands").mkdir(parents=True)
+        (unseen / ".specify").mkdir()
+        integrate_spec_kit(spec_kit_fleet[0])
+
+        records = _refresh(fleet_dir, walk=False)
+
+        assert set(records) == set(spec_kit_fleet)
+        assert records[spec_kit_fleet[0]]["integrated"] is True
+
+    def test_index_survives_relocation(
+        self, fleet_dir: Path, temp_dir: Path, reads: list[Path]
+    ):
+        """Test that paths are stored relative to the scanned directory."""
+        _refresh(fleet_dir)
+        moved = temp_dir / "moved"
+        shutil.copytree(fleet_dir, moved, copy_function=shutil.copy2)
+        # copytree keeps file mtimes but not directory mtimes
+        with ProjectIndex(moved) as index:
+            index._db.execute("UPDATE dirs SET mtime_ns = -1")
+        reads.clear()
+
+        records = _refresh(moved)
+
+        assert reads == []
+        assert len(records) == 3
+
+    def test_registry_change_revalidates(
+        self, fleet_dir: Path, reads: list[Path], monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that a different directive registry drops cached results."""
+        _refresh(fleet_dir)
+        monkeypatch.setattr(project_index, "directives_digest", lambda: "changed")
+        reads.clear()
+
+        _refresh(fleet_dir)
+
+        assert len(reads) == 9
+
+
+class TestStatusIndexOption:
+    """Tests for `pantheon status --scan DIR --index`."""
+
+    def test_index_output_matches_scan(self, fleet_dir: Path):
+        """Test that indexed and plain scans print the same records."""
+        runner = CliRunner()
+        plain = runner.invoke(main, ["status", "--scan", str(fleet_dir)])
+        indexed = runner.invoke(main, ["status", "--scan", str(fleet_dir), "--index"])
+        cached = runner.invoke(main, ["status", "--scan", str(fleet_dir), "--index"])
+
+        def parse(output: str) -> list[dict]:
+            lines = [json.loads(line) for line in output.splitlines()]
+            return sorted(lines, key=lambda r: r["project_root"])
+
+        assert indexed.exit_code == 0
+        assert parse(plain.output) == parse(indexed.output) == parse(cached.output)
+
+    def test_no_walk_requires_index(self, fleet_dir: Path):
+        """Test that --no-walk is rejected without --index."""
+        result = CliRunner().invoke(
+            main, ["status", "--scan", str(fleet_dir), "--no-walk"]
+        )
+        assert result.exit_code == 2
@@ -0,0 +1,89 @@
+"""Tests for the concurrent project scanner and `pantheon status`."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from pantheon.cli import main
+from pantheon.integrations.spec_kit import integrate_spec_kit
+from pantheon.scan import check_project, scan_projects
+
+
+class TestScanProjects:
+    """Tests for scan_projects()."""
+
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_finds_every_project(self, spec_kit_fleet: list[Path], workers: int):
+        """Test that every project is reported once and pruned dirs are skipped."""
+        fleet_dir = spec_kit_fleet[0].parent
+
+        records = list(scan_projects(fleet_dir, max_workers=workers))
+
+        assert sorted(r["project_root"] for r in records) == sorted(spec_kit_fleet)
+
+    def test_reports_integration_state(self, spec_kit_fleet: list[Path]):
+        """Test that integrated and unintegrated projects are told apart."""
+        integrate_spec_kit(spec_kit_fleet[0])
+
+        records = {
+            r["project_root"]: r for r in scan_projects(spec_kit_fleet[0].parent)
+        }
+
+        assert records[spec_kit_fleet[0]]["integrated"] is True
+        assert records[spec_kit_fleet[1]]["integrated"] is False
+        assert len(records[spec_kit_fleet[1]]["validation"]["errors"]) == 3
+
+    def test_nested_project_inside_project(self, spec_kit_fleet: list[Path]):
+        """Test that projects nested in other projects are still found."""
+        inner = spec_kit_fleet[0] / "packages" / "inner"
+        (inner / ".claude" / "commands").mkdir(parents=True)
+        (inner / ".specify").mkdir()
+
+        roots = {r["project_root"] for r in scan_projects(spec_kit_fleet[0])}
+
+        assert roots == {spec_kit_fleet[0], inner}
+
+    def test_check_project_without_agent(self, mock_spec_kit_project: Path):
+        """Test that a missing DEV agent is reported."""
+        record = check_project(mock_spec_kit_project)
+        assert record["agents_installed"] is False
+        assert record["integrated"] is False
+
+
+class TestStatusCommand:
+    """Tests for `pantheon status`."""
+
+    def test_scan_streams_ndjson(self, spec_kit_fleet: list[Path]):
+        """Test that --scan prints one JSON record per line."""
+        integrate_spec_kit(spec_kit_fleet[2])
+
+        result = CliRunner().invoke(
+            main, ["status", "--scan", str(spec_kit_fleet[0].parent), "-j", "2"]
+        )
+
+        assert result.exit_code == 0
+        records = [json.loads(line) for line in result.output.splitlines()]
+        by_root = {Path(r["project_root"]): r for r in records}
+        assert set(by_root) == set(spec_kit_fleet)
+        assert by_root[spec_kit_fleet[2]]["integrated"] is True
+        assert by_root[spec_kit_fleet[0]]["agents_installed"] is True
+
+    def test_current_project(self, spec_kit_fleet: list[Path]):
+        """Test the single-project status report."""
+        os.chdir(spec_kit_fleet[0])
+
+        before = CliRunner().invoke(main, ["status"])
+        integrate_spec_kit(spec_kit_fleet[0])
+        after = CliRunner().invoke(main, ["status"])
+
+        assert "not integrated" in before.output
+        assert "✓ integrated" in after.output
+
+    def test_not_a_project(self, temp_dir: Path):
+        """Test status outside a Spec Kit project."""
+        os.chdir(temp_dir)
+        result = CliRunner().invoke(main, ["status"])
+        assert "Spec Kit not detected" in result.output
@@ -1,12 +1,31 @@
 """Unit tests for Spec Kit integration utilities."""
 
 import os
+import stat
 from pathlib import Path
 
+import pytest
+
+from pantheon.backups import hash_file
+from pantheon.integrations import spec_kit
 from pantheon.integrations.spec_kit import (
+    COMMAND_DIRECTIVES,
+    DIRECTIVE_CURRENT,
+    DIRECTIVE_MISSING,
+    DIRECTIVE_OUTDATED,
+    FILE_NOT_FOUND,
+    CommandDirective,
+    SpecKitProject,
+    apply_directive,
+    check_directive,
     create_backup,
+    discover_spec_kit_projects,
     find_latest_backup,
+    insert_directive,
+    integrate_spec_kit,
+    register_directive,
     restore_files,
+    upgrade_directive,
     validate_integration,
     verify_agents_installed,
     verify_spec_kit,
@@ -206,3 +225,255 @@ class TestValidateIntegration:
 
         result = validate_integration()
         assert result["valid"] is False
+
+
+class TestDiscoverSpecKitProjects:
+    """Tests for discover_spec_kit_projects function."""
+
+    def test_discovers_all_projects(self, spec_kit_fleet: list[Path], temp_dir: Path):
+        """Test that every project root under the base is found."""
+        found = discover_spec_kit_projects(temp_dir / "fleet")
+        assert sorted(found) == sorted(spec_kit_fleet)
+
+    def test_prunes_dependency_directories(self, temp_dir: Path):
+        """Test that projects inside node_modules are not reported."""
+        project = temp_dir / "node_modules" / "pkg"
+        (project / ".specify").mkdir(parents=True)
+        (project / ".claude" / "commands").mkdir(parents=True)
+
+        assert list(discover_spec_kit_projects(temp_dir)) == []
+
+    def test_requires_commands_directory(self, mock_specify_dir: Path):
+        """Test that .specify/ alone does not make a project."""
+        (mock_specify_dir.parent / ".claude").mkdir()
+
+        assert list(discover_spec_kit_projects(mock_specify_dir.parent)) == []
+
+
+class TestInsertDirective:
+    """Tests for the streaming insert_directive engine."""
+
+    directive = CommandDirective("## Marker", "## Marker\n\nBody.\n\n---\n")
+
+    def test_inserts_after_frontmatter(self, temp_dir: Path):
+        """Test directive lands right after the closing frontmatter line."""
+        filepath = temp_dir / "cmd.md"
+        filepath.write_text("---\ndescription: x\n---\n\nOriginal.\n")
+
+        assert insert_directive(filepath, self.directive) is True
+        assert filepath.read_text() == (
+            "---\ndescription: x\n---\n\n"
+            + self.directive.stamp.decode()
+            + "## Marker\n\nBody.\n\n---\n\n\nOriginal.\n"
+        )
+
+    def test_streams_large_file_unchanged(self, temp_dir: Path):
+        """Test that content beyond the frontmatter is copied through intact."""
+        filepath = temp_dir / "cmd.md"
+        body = "".join(f"line {i}\n" for i in range(200_000))
+        filepath.write_text("---\ndescription: x\n---\n" + body)
+
+        insert_directive(filepath, self.directive)
+
+        content = filepath.read_text()
+        assert content.endswith(body)
+        assert content.count("## Marker") == 1
+
+    def test_detects_marker_across_chunk_boundary(self, temp_dir: Path):
+        """Test that an existing marker split between read chunks is found."""
+        filepath = temp_dir / "cmd.md"
+        padding = "x" * (spec_kit._CHUNK_SIZE - 4)
+        original = padding + "## Marker\n"
+        filepath.write_text(original)
+
+        assert insert_directive(filepath, self.directive) is True
+        assert filepath.read_text() == original
+
+    def test_replaces_atomically_and_keeps_mode(self, temp_dir: Path):
+        """Test no temp files are left behind and permissions are preserved."""
+        filepath = temp_dir / "cmd.md"
+        filepath.write_text("Original.\n")
+        filepath.chmod(0o640)
+
+        insert_directive(filepath, self.directive)
+
+        assert [p.name for p in temp_dir.iterdir()] == ["cmd.md"]
+        assert stat.S_IMODE(filepath.stat().st_mode) == 0o640
+
+    def test_missing_file(self, temp_dir: Path):
+        """Test that a missing command file is reported as not integrated."""
+        assert insert_directive(temp_dir / "missing.md", self.directive) is False
+
+    def test_apply_reports_digest_of_written_content(self, temp_dir: Path):
+        """Test the returned digest matches the file as written."""
+        filepath = temp_dir / "cmd.md"
+        filepath.write_text("---\ndescription: x\n---\nOriginal.\n")
+
+        result = apply_directive(filepath, self.directive)
+
+        assert result["changed"] is True
+        assert result["integrated"] is True
+        assert result["sha256"] == hash_file(filepath)
+
+    def test_apply_on_integrated_file(self, temp_dir: Path):
+        """Test an already integrated file is reported unchanged with its digest."""
+        filepath = temp_dir / "cmd.md"
+        filepath.write_text("## Marker\nAlready here.\n")
+
+        result = apply_directive(filepath, self.directive)
+
+        assert result["changed"] is False
+        assert result["integrated"] is True
+        assert result["sha256"] == hash_file(filepath)
+
+
+class TestDirectiveStamps:
+    """Tests for versioned directive stamps and in-place upgrades."""
+
+    old = CommandDirective("## Marker", "## Marker\n\nOld body.\n\n---\n")
+    new = CommandDirective("## Marker", "## Marker\n\nNew body.\n\n---\n")
+
+    def test_stamp_tracks_text(self):
+        assert self.old.stamp != self.new.stamp
+        assert self.old.stamp == CommandDirective("## Other", self.old.text).stamp
+
+    def test_check_reads_only_the_header(self, temp_dir: Path, monkeypatch):
+        """Test that stamped files are classified without scanning the body."""
+        filepath = temp_dir / "cmd.md"
+        filepath.write_text("---\ndescription: x\n---\n" + "line\n" * 100_000)
+        insert_directive(filepath, self.old)
+
+        def no_scan(*args: object) -> None:
+            raise AssertionError("scanned the whole file")
+
+        monkeypatch.setattr(spec_kit, "_scan_for_marker", no_scan)
+        assert check_directive(filepath, self.old) == DIRECTIVE_CURRENT
+        assert check_directive(filepath, self.new) == DIRECTIVE_OUTDATED
+
+    def test_check_unstamped_and_missing(self, temp_dir: Path):
+        filepath = temp_dir / "cmd.md"
+        filepath.write_text("Original.\n")
+        assert check_directive(filepath, self.new) == DIRECTIVE_MISSING
+
+        filepath.write_text("\n" + self.old.text + "\nOriginal.\n")
+        assert check_directive(filepath, self.new) == DIRECTIVE_OUTDATED
+        assert check_directive(temp_dir / "gone.md", self.new) == FILE_NOT_FOUND
+
+    @pytest.mark.parametrize(
+        "content",
+        ["---\ndescription: x\n---\n\nOriginal.\n", "---\nx: y\n---", "Original.\n"],
+    )
+    def test_upgrade_matches_fresh_insert(self, temp_dir: Path, content: str):
+        """Test that an upgraded file is exactly what integrating anew writes."""
+        upgraded = temp_dir / "upgraded.md"
+        fresh = temp_dir / "fresh.md"
+        upgraded.write_text(content)
+        fresh.write_text(content)
+        insert_directive(upgraded, self.old)
+        insert_directive(fresh, self.new)
+
+        assert upgrade_directive(upgraded, self.new) == DIRECTIVE_OUTDATED
+        assert upgraded.read_bytes() == fresh.read_bytes()
+        assert upgrade_directive(upgraded, self.new) == DIRECTIVE_CURRENT
+        assert {p.name for p in temp_dir.iterdir()} == {"fresh.md", "upgraded.md"}
+
+    def test_upgrade_keeps_surrounding_edits(self, temp_dir: Path):
+        filepath = temp_dir / "cmd.md"
+        filepath.write_text("---\nx: y\n---\nOriginal.\n")
+        insert_directive(filepath, self.old)
+        filepath.write_text(filepath.read_text() + "Added later.\n")
+
+        upgrade_directive(filepath, self.new)
+
+        content = filepath.read_text()
+        assert "New body." in content and "Old body." not in content
+        assert content.endswith("Original.\nAdded later.\n")
+
+    def test_upgrade_unstamped_and_renamed_marker(self, temp_dir: Path):
+        """Test upgrading directives from before stamps and after a rename."""
+        renamed = CommandDirective("## Renamed", "## Renamed\n\nBody.\n\n---\n")
+        filepath = temp_dir / "cmd.md"
+        filepath.write_text("\n" + self.old.text + "\nOriginal.\n")
+
+        assert upgrade_directive(filepath, self.new) == DIRECTIVE_OUTDATED
+        assert upgrade_directive(filepath, renamed) == DIRECTIVE_OUTDATED
+
+        content = filepath.read_text()
+        assert content.count("---") == 1
+        assert content == "\n" + renamed.stamp.decode() + renamed.text + "\nOriginal.\n"
+
+
+class TestRegisterDirective:
+    """Tests for register_directive function."""
+
+    @pytest.fixture(autouse=True)
+    def restore_registry(self):
+        saved = dict(COMMAND_DIRECTIVES)
+        yield
+        COMMAND_DIRECTIVES.clear()
+        COMMAND_DIRECTIVES.update(saved)
+
+    def test_registered_command_is_integrated(self, mock_spec_kit_project: Path):
+        """Test a newly registered command needs no extra code to integrate."""
+        commands_dir = mock_spec_kit_project / ".claude" / "commands"
+        (commands_dir / "specify.md").write_text("---\ndescription: s\n---\n")
+        (mock_spec_kit_project / ".claude" / "agents" / "dev.md").write_text("# DEV")
+        register_directive("specify.md", "## Spec Rules", "## Spec Rules\n\n---\n")
+
+        result = integrate_spec_kit(mock_spec_kit_project)
+
+        assert result["success"] is True
+        assert "specify.md" in result["files_modified"]
+        assert "specify.md" in result["validation"]["files_checked"]
+        assert "## Spec Rules" in (commands_dir / "specify.md").read_text()
+
+
+class TestSpecKitProject:
+    """Tests for the SpecKitProject API object."""
+
+    @pytest.fixture
+    def project(self, mock_spec_kit_project: Path) -> SpecKitProject:
+        (mock_spec_kit_project / ".claude" / "agents" / "dev.md").write_text("# DEV")
+        return SpecKitProject(mock_spec_kit_project)
+
+    def test_resolves_paths_once(self, mock_spec_kit_project: Path):
+        """Test path resolution, including the current-directory default."""
+        os.chdir(mock_spec_kit_project)
+        project = SpecKitProject()
+
+        assert project.root == mock_spec_kit_project
+        assert project.commands_dir == mock_spec_kit_project / ".claude" / "commands"
+        assert project.command_path("plan.md") == project.commands_dir / "plan.md"
+
+    def test_probes_are_memoized_until_invalidated(self, project: SpecKitProject):
+        """Test that prerequisite checks are cached with explicit invalidation."""
+        assert project.agents_installed is True
+        assert project.spec_kit_detected is True
+
+        project.agent_path.unlink()
+        assert project.agents_installed is True
+
+        project.invalidate()
+        assert project.agents_installed is False
+        assert project.integrate()["success"] is False
+
+    def test_integrate_validate_rollback(self, project: SpecKitProject):
+        """Test the full cycle through the object's methods."""
+        original = project.command_path("plan.md").read_text()
+
+        result = project.integrate()
+        assert result["success"] is True
+        assert project.validate()["valid"] is True
+        assert project.list_backups() == [result["backup_dir"]]
+
+        rollback = project.rollback()
+        assert rollback["success"] is True
+        assert project.command_path("plan.md").read_text() == original
+        assert project.validate()["valid"] is False
+
+    def test_wrappers_match_methods(self, project: SpecKitProject):
+        """Test that the module functions delegate to the object."""
+        assert verify_spec_kit(project.root) is project.spec_kit_detected
+        assert validate_integration(project.root) == project.validate()
+        backup_dir = create_backup(project.root)
+        assert project.find_backup() == backup_dir
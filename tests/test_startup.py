@@ -0,0 +1,119 @@
+"""Tests for CLI startup cost and lazy subcommand loading."""
+
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from benchmarks.startup import run_benchmark
+from pantheon.catalog import AGENTS_DIR
+from pantheon.cli import LAZY_SUBCOMMANDS, main
+
+
+def _modules_after(code: str, cwd: Path) -> set[str]:
+    """Return the modules loaded in a fresh interpreter after running code."""
+    proc = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint('\\n'.join(sys.modules))"],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(proc.stdout.split())
+
+
+class TestLazyLoading:
+    """Tests that subcommands are imported only when used."""
+
+    def test_version_skips_click(self, temp_dir: Path):
+        """Test that --version is answered without importing click."""
+        modules = _modules_after(
+            "import sys; sys.argv = ['pantheon', '--version']\n"
+            "from pantheon.__main__ import run; run()",
+            temp_dir,
+        )
+        assert "click" not in modules
+        assert "pantheon.cli" not in modules
+
+    def test_list_skips_click(self, temp_dir: Path):
+        """Test that a plain `pantheon list` is answered without click."""
+        modules = _modules_after(
+            "import sys; sys.argv = ['pantheon', 'list']\n"
+            "from pantheon.__main__ import run; run()",
+            temp_dir,
+        )
+        assert "click" not in modules
+        assert "pantheon.client" not in modules
+
+    def test_list_fast_path_matches_cli(self, temp_dir: Path):
+        """Test that the click-free listing prints what the CLI prints."""
+        (temp_dir / ".claude" / "agents").mkdir(parents=True)
+        proc = subprocess.run(
+            [sys.executable, "-m", "pantheon", "list"],
+            cwd=temp_dir,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        os.chdir(temp_dir)
+        result = CliRunner().invoke(main, ["list"])
+        assert result.exit_code == 0
+        assert proc.stdout == result.output
+
+    def test_unforwardable_command_skips_client(self, temp_dir: Path):
+        """Test that the daemon client is imported only for daemon commands."""
+        modules = _modules_after(
+            "import sys; sys.argv = ['pantheon', 'backups', 'list']\n"
+            "from pantheon.__main__ import run\n"
+            "try:\n    run()\nexcept SystemExit:\n    pass",
+            temp_dir,
+        )
+        assert "pantheon.cli" in modules
+        assert "pantheon.client" not in modules
+
+    def test_cli_import_loads_no_subcommands(self, temp_dir: Path):
+        """Test that importing the CLI group loads no command modules."""
+        modules = _modules_after("import pantheon.cli", temp_dir)
+        assert not any(m.startswith("pantheon.commands.") for m in modules)
+        assert "pantheon.integrations.spec_kit" not in modules
+        assert "shutil" not in modules
+
+    def test_invoking_command_loads_only_that_command(self, temp_dir: Path):
+        """Test that running one subcommand leaves the others unloaded."""
+        modules = _modules_after(
+            "import sys; sys.argv = ['pantheon', 'list']\n"
+            "from pantheon.cli import main\n"
+            "main(standalone_mode=False)",
+            temp_dir,
+        )
+        loaded = {m for m in modules if m.startswith("pantheon.commands.")}
+        assert loaded == {"pantheon.commands.list"}
+
+    def test_help_lists_every_command(self):
+        """Test that lazily registered commands show up in --help."""
+        result = CliRunner().invoke(main, ["--help"])
+        assert result.exit_code == 0
+        for name in LAZY_SUBCOMMANDS:
+            assert name in result.output
+
+
+class TestStartupBudget:
+    """Tests that startup stays within the benchmark budget."""
+
+    def test_startup_within_budget(self, temp_dir: Path):
+        """Test every scenario in benchmarks/startup_budget.json."""
+        failures = [r for r in run_benchmark(runs=3, cwd=temp_dir) if not r["passed"]]
+        assert failures == []
+
+    def test_startup_within_budget_with_agents_installed(self, temp_dir: Path):
+        """Test the budgets where `list` has to hash installed agents."""
+        agents_dir = temp_dir / ".claude" / "agents"
+        agents_dir.mkdir(parents=True)
+        for agent_file in AGENTS_DIR.glob("*.md"):
+            shutil.copy2(agent_file, agents_dir / agent_file.name)
+
+        failures = [r for r in run_benchmark(runs=3, cwd=temp_dir) if not r["passed"]]
+        assert failures == []
@@ -0,0 +1,153 @@
+"""Tests for span tracing and the --trace CLI option."""
+
+import json
+import os
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from pantheon import trace
+from pantheon.cli import main
+from pantheon.integrations.spec_kit import (
+    integrate_spec_kit,
+    integrate_spec_kit_batch,
+    rollback_integration,
+)
+
+
+@pytest.fixture
+def tracer() -> Generator[trace.Tracer, None, None]:
+    """Enable tracing for one test."""
+    yield trace.start()
+    trace.stop()
+
+
+@pytest.fixture
+def agent_project(mock_spec_kit_project: Path) -> Path:
+    """A Spec Kit project with the DEV agent installed."""
+    (mock_spec_kit_project / ".claude" / "agents" / "dev.md").write_text("# DEV")
+    return mock_spec_kit_project
+
+
+class TestSpans:
+    """Tests for recording spans."""
+
+    def test_disabled_span_is_shared_noop(self):
+        """Test that spans cost nothing and record nothing while disabled."""
+        assert not trace.enabled()
+        first = trace.span("a", files=1)
+        assert first is trace.span("b")
+        assert not first
+        with first as span:
+            span.set(bytes=10)
+
+    def test_span_records_complete_event(self, tracer: trace.Tracer):
+        """Test that a span becomes a Chrome "X" event with its counts."""
+        with trace.span("phase", file="plan.md") as span:
+            span.set(bytes=42)
+
+        [event] = tracer.events
+        assert event["name"] == "phase"
+        assert event["ph"] == "X"
+        assert event["dur"] >= 0
+        assert event["pid"] == os.getpid()
+        assert event["args"] == {"file": "plan.md", "bytes": 42}
+
+    def test_span_records_exception(self, tracer: trace.Tracer):
+        """Test that a span interrupted by an exception is still recorded."""
+        with pytest.raises(KeyError):
+            with trace.span("failing"):
+                raise KeyError("x")
+
+        assert tracer.events[0]["args"] == {"error": "KeyError"}
+
+
+class TestInstrumentation:
+    """Tests for the phases recorded by integrate and rollback."""
+
+    def test_integrate_phases(self, agent_project: Path, tracer: trace.Tracer):
+        """Test that each integration phase is recorded with its counts."""
+        assert integrate_spec_kit(agent_project)["success"] is True
+
+        names = [e["name"] for e in tracer.events]
+        assert names == [
+            "verify_agents_installed",
+            "verify_spec_kit",
+            "fingerprint_cache",
+            "create_backup",
+            "apply_directive",
+            "apply_directive",
+            "apply_directive",
+            "commit",
+            "validate_integration",
+            "record_fingerprints",
+        ]
+        backup = tracer.events[names.index("create_backup")]
+        assert backup["args"]["files"] == 3
+        assert backup["args"]["bytes"] > 0
+        applied = [e["args"] for e in tracer.events if e["name"] == "apply_directive"]
+        assert {a["file"] for a in applied} == {"implement.md", "plan.md", "tasks.md"}
+        assert all(a["changed"] and a["bytes"] > 0 for a in applied)
+        assert tracer.events[names.index("commit")]["args"] == {"files": 3}
+
+    def test_cache_hit_skips_phases(self, agent_project: Path, tracer: trace.Tracer):
+        """Test that a cached run records only the prerequisite checks."""
+        integrate_spec_kit(agent_project)
+        tracer.events.clear()
+
+        integrate_spec_kit(agent_project)
+
+        assert [e["name"] for e in tracer.events][-1] == "fingerprint_cache"
+        assert tracer.events[-1]["args"] == {"hit": True}
+
+    def test_rollback_phases(self, agent_project: Path, tracer: trace.Tracer):
+        """Test that rollback records the lookup and the restore."""
+        integrate_spec_kit(agent_project)
+        tracer.events.clear()
+
+        assert rollback_integration(agent_project)["success"] is True
+
+        restore = tracer.events[-1]
+        assert [e["name"] for e in tracer.events] == ["find_backup", "restore_files"]
+        assert restore["args"]["files"] == 3
+
+    def test_thread_batch_records_each_root(
+        self, spec_kit_fleet: list[Path], tracer: trace.Tracer
+    ):
+        """Test that thread-pool workers are traced per root."""
+        list(integrate_spec_kit_batch(spec_kit_fleet, executor="thread"))
+
+        roots = {
+            e["args"]["root"] for e in tracer.events if e["name"] == "integrate_root"
+        }
+        assert roots == {str(root) for root in spec_kit_fleet}
+
+
+class TestTraceOption:
+    """Tests for the global --trace option."""
+
+    def test_writes_chrome_trace(self, agent_project: Path):
+        """Test that --trace writes a loadable trace of the subcommand."""
+        os.chdir(agent_project)
+        trace_file = agent_project / "trace.json"
+
+        result = CliRunner().invoke(main, ["--trace", str(trace_file), "integrate"])
+
+        assert result.exit_code == 0
+        data = json.loads(trace_file.read_text())
+        names = [e["name"] for e in data["traceEvents"]]
+        assert names[0] == "pantheon integrate"
+        assert "create_backup" in names
+        assert not trace.enabled()
+
+    def test_no_trace_by_default(self, agent_project: Path):
+        """Test that nothing is recorded without --trace."""
+        os.chdir(agent_project)
+
+        result = CliRunner().invoke(main, ["integrate"])
+
+        assert result.exit_code == 0
+        assert not trace.enabled()
+        assert not list(agent_project.glob("*.json"))
@@ -0,0 +1,168 @@
+"""Tests for the command file watcher."""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from pantheon.integrations.spec_kit import (
+    integrate_spec_kit,
+    rollback_integration,
+    unintegrate_spec_kit,
+)
+from pantheon.watch import PollingBackend, _Backend, create_backend, watch_projects
+
+BACKENDS = ["poll"]
+if sys.platform.startswith("linux"):
+    BACKENDS.append("inotify")
+
+
+@pytest.fixture
+def integrated_project(mock_spec_kit_project: Path) -> Path:
+    """A Spec Kit project that has been integrated once."""
+    (mock_spec_kit_project / ".claude" / "agents" / "dev.md").write_text("# DEV")
+    assert integrate_spec_kit(mock_spec_kit_project)["success"] is True
+    return mock_spec_kit_project
+
+
+class _WatchThread:
+    """Run watch_projects() in the background and collect its events."""
+
+    def __init__(self, roots: list[Path], backend: str):
+        self.stop = threading.Event()
+        self.events: list[dict] = []
+        self._thread = threading.Thread(
+            target=self._run, args=(roots, backend), daemon=True
+        )
+        self._thread.start()
+
+        # The initial check runs only after every watch is registered
+        expected = 3 * len(roots)
+        assert self.wait_for(lambda events: len(events) >= expected)
+        self.events.clear()
+
+    def _run(self, roots: list[Path], backend: str) -> None:
+        for event in watch_projects(
+            roots, debounce=0.05, backend=backend, poll_interval=0.02, stop=self.stop
+        ):
+            self.events.append(event)
+
+    def wait_for(self, predicate, timeout: float = 5.0) -> bool:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if predicate(self.events):
+                return True
+            time.sleep(0.01)
+        return False
+
+    def close(self) -> None:
+        self.stop.set()
+        self._thread.join(5)
+
+
+@pytest.fixture
+def start_watch():
+    """Factory starting a watcher thread, stopped at teardown."""
+    watchers = []
+
+    def start(roots: list[Path], backend: str) -> _WatchThread:
+        watcher = _WatchThread(roots, backend)
+        watchers.append(watcher)
+        return watcher
+
+    yield start
+    for watcher in watchers:
+        watcher.close()
+
+
+class TestWatchProjects:
+    """Tests for watch_projects function."""
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_reapplies_dropped_directive(
+        self, integrated_project: Path, start_watch, backend: str
+    ):
+        """Test an overwritten command file gets its directive back."""
+        watcher = start_watch([integrated_project], backend)
+        plan = integrated_project / ".claude" / "commands" / "plan.md"
+
+        plan.write_text("---\ndescription: upgraded\n---\n\nNew plan.\n")
+
+        assert watcher.wait_for(lambda events: any(e["changed"] for e in events))
+        assert "## Quality Standards" in plan.read_text()
+        changed = [e for e in watcher.events if e["changed"]]
+        assert [e["filename"] for e in changed] == ["plan.md"]
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_burst_is_debounced(
+        self, integrated_project: Path, start_watch, backend: str
+    ):
+        """Test a burst of writes to one file leads to one repair."""
+        watcher = start_watch([integrated_project], backend)
+        tasks = integrated_project / ".claude" / "commands" / "tasks.md"
+
+        for i in range(5):
+            tasks.write_text(f"Tasks v{i}\n")
+
+        assert watcher.wait_for(lambda events: any(e["changed"] for e in events))
+        time.sleep(0.2)
+        assert len([e for e in watcher.events if e["changed"]]) == 1
+        assert tasks.read_text().endswith("Tasks v4\n")
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_leaves_rollback_and_unintegrate_alone(
+        self, integrated_project: Path, start_watch, backend: str
+    ):
+        """Test that changes made by locked Pantheon operations are kept."""
+        watcher = start_watch([integrated_project], backend)
+        commands_dir = integrated_project / ".claude" / "commands"
+
+        assert rollback_integration(integrated_project)["success"] is True
+        assert watcher.wait_for(lambda events: len(events) >= 3)
+        time.sleep(0.2)
+        assert not any(e["changed"] or e["error"] for e in watcher.events)
+        assert "## Quality Standards" not in (commands_dir / "plan.md").read_text()
+
+        integrate_spec_kit(integrated_project)
+        watcher.events.clear()
+        assert unintegrate_spec_kit(integrated_project)["success"] is True
+        assert watcher.wait_for(lambda events: len(events) >= 3)
+        time.sleep(0.2)
+        assert not any(e["changed"] for e in watcher.events)
+        assert "## Quality Standards" not in (commands_dir / "plan.md").read_text()
+
+        # A later overwrite by another tool is still repaired
+        (commands_dir / "plan.md").write_text("Regenerated plan.\n")
+        assert watcher.wait_for(lambda events: any(e["changed"] for e in events))
+        assert "## Quality Standards" in (commands_dir / "plan.md").read_text()
+
+    def test_initial_check_heals_existing_damage(self, integrated_project: Path):
+        """Test that files broken before watching are fixed on start."""
+        implement = integrated_project / ".claude" / "commands" / "implement.md"
+        implement.write_text("Overwritten.\n")
+        stop = threading.Event()
+        stop.set()
+
+        events = list(watch_projects([integrated_project], backend="poll", stop=stop))
+
+        assert [e["filename"] for e in events if e["changed"]] == ["implement.md"]
+        assert "## Agent Integration" in implement.read_text()
+
+
+class TestCreateBackend:
+    """Tests for create_backend function."""
+
+    def test_poll_backend(self):
+        """Test that polling can always be requested explicitly."""
+        assert isinstance(create_backend("poll"), PollingBackend)
+
+    def test_backend_interface_is_abstract(self):
+        with pytest.raises(TypeError):
+            _Backend()  # type: ignore[abstract]
+
+    def test_unknown_backend(self):
+        """Test that unknown backend names are rejected."""
+        with pytest.raises(ValueError):
+            create_backend("kqueue")